@@ -0,0 +1,62 @@
+#!/usr/bin/env node
+/*
+ * Long-running bible-scraper sidecar for Bible Clock.
+ *
+ * Reads JSON-lines requests on stdin:   {"id": 1, "translation": "AMP", "reference": "John 3:16"}
+ * Writes one JSON line per request:     {"id": 1, "success": true, "data": {...}}
+ *                                       {"id": 1, "success": false, "error": "..."}
+ * A {"ready": true} line is written once the module has loaded. Requests are
+ * handled concurrently, so responses may arrive out of order.
+ */
+const readline = require('readline');
+const BibleScraper = require('bible-scraper');
+
+// YouVersion translation IDs
+const TRANSLATION_IDS = {
+    'AMP': 1588,
+    'NLT': 116,
+    'MSG': 97,
+    'ESV': 59,
+    'NASB': 100,        // NASB 1995
+    'NASB1995': 100,    // NASB 1995 (alternative name)
+    'NASB2020': 2692,   // NASB 2020
+    'NIV': 111,
+    'CEV': 392          // Contemporary English Version
+};
+
+const scrapers = new Map();
+
+function scraperFor(translation) {
+    const id = TRANSLATION_IDS[translation] || TRANSLATION_IDS.AMP;
+    if (!scrapers.has(id)) {
+        scrapers.set(id, new BibleScraper(id));
+    }
+    return scrapers.get(id);
+}
+
+function respond(message) {
+    process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+const input = readline.createInterface({ input: process.stdin });
+
+input.on('line', async (line) => {
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (error) {
+        return;
+    }
+
+    try {
+        const data = await scraperFor(request.translation).verse(request.reference);
+        respond({ id: request.id, success: true, data: data });
+    } catch (error) {
+        respond({ id: request.id, success: false, error: error.message });
+    }
+});
+
+// Parent closed the pipe: exit with it
+input.on('close', () => process.exit(0));
+
+respond({ ready: true });
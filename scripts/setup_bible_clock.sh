@@ -91,6 +91,15 @@ pip install -r requirements-pi.txt
 echo "✅ Python dependencies installed in virtual environment"
 echo ""
 
+# Install Node.js dependencies for the bible-scraper sidecar (YouVersion translations)
+echo "📜 Installing bible-scraper for the scraper sidecar..."
+if ! command -v npm >/dev/null 2>&1; then
+    sudo apt-get install -y nodejs npm
+fi
+npm install --omit=dev --no-audit --no-fund
+echo "✅ bible-scraper installed"
+echo ""
+
 # Prompt for hardware setup
 echo "🛠️  Hardware Setup Options:"
 echo "1. E-ink Display (IT8951) - Required for display output"
@@ -167,6 +176,11 @@ else
 fi
 echo ""
 
+# Pre-scale backgrounds and borders to the panel (rerun after changing images/)
+echo "🖼️  Building display-resolution backgrounds and borders..."
+python3 src/display_assets.py
+echo ""
+
 # Test installation
 echo "🧪 Testing installation..."
 
@@ -33,6 +33,11 @@ class BibleClockCleaner:
             "python_cache_cleanup": True,
             "preserve_patterns": [
                 "data/translations/*.json",
+                "data/translations/*.bin",
+                "data/translations/*.journal",
+                "data/translations/*.idx",
+                "data/composites/*.l8",
+                "data/display_assets/*",
                 "images/**/*.png",
                 "src/**/*.py",
                 "*.md",
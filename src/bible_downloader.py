@@ -4,20 +4,52 @@ Bible Translation Downloader and Converter
 Downloads complete Bible translations from public sources and converts them to the format expected by Bible Clock.
 """
 
+import hashlib
 import json
-import requests
 import os
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 import time
 
+import requests
+
+try:
+    from src.http_client import http_client
+except ImportError:
+    from http_client import http_client
+
+try:
+    from src.verse_store import VerseLayout, VerseStore, load_layout, open_translation_store, translation_file_stem
+except ImportError:
+    from verse_store import VerseLayout, VerseStore, load_layout, open_translation_store, translation_file_stem
+
+KJV_BOOK_URL = "https://raw.githubusercontent.com/aruljohn/Bible-kjv/master/{book}.json"
+
+# Attempts per book before it is left for the next (resumed) run
+BOOK_ATTEMPTS = 3
+
+# Optional sha256sum-style manifests ("<sha256>  Genesis.json") pinning downloads
+MANIFEST_DIR = Path('data/download_manifests')
+ARCHIVE_MANIFEST_NAMES = ('SHA256SUMS', 'sha256sums.txt', 'checksums.sha256')
+
 class BibleDownloader:
-    def __init__(self):
+    def __init__(self, verse_manager=None):
         self.logger = logging.getLogger(__name__)
         self.translation_dir = Path('data/translations')
         self.translation_dir.mkdir(parents=True, exist_ok=True)
         
+        # With a running verse manager, verses go through its translation caches
+        # (keeping the search index and completion current); otherwise the
+        # downloader opens the verse store itself
+        self.verse_manager = verse_manager
+        self.workers = max(1, int(os.getenv('DOWNLOAD_WORKERS', '4')))
+        self._checkpoint_lock = threading.Lock()
+        
         # KJV Bible books from GitHub repository - all 66 books
         self.kjv_books = [
             "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua", "Judges", "Ruth",
@@ -53,51 +85,262 @@ class BibleDownloader:
             "3John": "3 John"
         }
 
-    def download_kjv_complete(self) -> bool:
-        """Download complete KJV Bible from GitHub and convert to our format."""
-        self.logger.info("Starting KJV Bible download from GitHub...")
+    def download_kjv_complete(self, resume: bool = True) -> bool:
+        """Download the complete KJV Bible from GitHub into the KJV verse store."""
+        return self.download_books('kjv', self.kjv_books, KJV_BOOK_URL, resume=resume)
+
+    def download_books(self, translation: str, books: List[str], url_template: str, resume: bool = True) -> bool:
+        """Download one JSON file per book in parallel, streaming each into the verse store.
         
-        kjv_bible = {}
-        total_books = len(self.kjv_books)
+        Finished books are checkpointed with their checksum, so a rerun after a
+        failure or interruption only fetches the books that are still missing.
+        Returns True when every book is in the store.
+        """
+        layout = self._layout()
+        store = self._open_store(translation, layout)
+        checkpoint = self._load_checkpoint(translation) if resume else {'completed': {}}
+        manifest = self._load_manifest(translation)
         
-        for i, book in enumerate(self.kjv_books, 1):
+        pending = [book for book in books
+                   if not self._book_done(checkpoint, book, store, layout)]
+        self.logger.info(f"Downloading {len(pending)} of {len(books)} {translation.upper()} books "
+                         f"with {self.workers} workers ({len(books) - len(pending)} already downloaded)")
+        
+        started = time.monotonic()
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bible-download') as pool:
+            futures = {
+                pool.submit(self._download_book, translation, book, url_template, manifest, store, layout): book
+                for book in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                book = futures[future]
+                try:
+                    digest, verse_count = future.result()
+                except Exception as e:
+                    failed.append(book)
+                    self.logger.error(f"Failed to download {book}: {e}")
+                    continue
+                with self._checkpoint_lock:
+                    checkpoint['completed'][book] = digest
+                    self._save_checkpoint(translation, checkpoint)
+                self.logger.info(f"Stored {self.book_name_mapping.get(book, book)} ({verse_count} verses, {done}/{len(pending)})")
+        
+        self._finish_store(translation, store)
+        elapsed = time.monotonic() - started
+        if failed:
+            self.logger.warning(f"{translation.upper()} download incomplete after {elapsed:.0f}s; "
+                                f"{len(failed)} books failed ({', '.join(sorted(failed))}). Run again to resume.")
+            return False
+        self.logger.info(f"{translation.upper()} Bible complete in {elapsed:.0f}s")
+        return True
+
+    def _download_book(self, translation: str, book: str, url_template: str, manifest: Dict[str, str],
+                       store: Optional[VerseStore], layout: VerseLayout) -> Tuple[str, int]:
+        """Fetch, verify and store one book. Returns (sha256, verses stored)."""
+        url = url_template.format(book=book)
+        for attempt in range(1, BOOK_ATTEMPTS + 1):
             try:
-                self.logger.info(f"Downloading {book} ({i}/{total_books})...")
-                
-                # Download from GitHub
-                url = f"https://raw.githubusercontent.com/aruljohn/Bible-kjv/master/{book}.json"
-                response = requests.get(url, timeout=30)
+                response = http_client.get(url, provider='downloader')
                 response.raise_for_status()
-                
-                # Parse JSON
-                book_data = response.json()
-                
-                # Convert to our format
-                book_name = self.book_name_mapping.get(book, book)
-                kjv_bible[book_name] = self._convert_kjv_book_format(book_data)
-                
-                self.logger.info(f"Successfully converted {book_name}")
-                
-                # Small delay to be respectful to GitHub
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to download {book}: {e}")
+                payload = response.content
+                digest = self._verify_checksum(f"{book}.json", payload, manifest)
+                chapters = self._convert_kjv_book_format(json.loads(payload))
+                return digest, self._store_book(translation, self.book_name_mapping.get(book, book),
+                                                chapters, store, layout)
+            except (requests.RequestException, ValueError) as e:
+                if attempt == BOOK_ATTEMPTS:
+                    raise
+                self.logger.warning(f"{book} attempt {attempt} failed ({e}); retrying")
+                time.sleep(2 ** attempt)
+
+    # --- Verification and storage ---
+
+    @staticmethod
+    def _verify_checksum(name: str, payload: bytes, manifest: Dict[str, str]) -> str:
+        """sha256 of a payload; raises ValueError if it differs from the manifest entry."""
+        digest = hashlib.sha256(payload).hexdigest()
+        expected = manifest.get(name)
+        if expected and expected.lower() != digest:
+            raise ValueError(f"checksum mismatch for {name}: expected {expected}, got {digest}")
+        return digest
+
+    def _store_book(self, translation: str, book: str, chapters: Dict[Any, Dict[Any, str]],
+                    store: Optional[VerseStore], layout: VerseLayout) -> int:
+        """Write a book's chapters to the verse store, checking them against the Bible structure."""
+        canonical = VerseLayout.normalize_book(book)
+        if layout.book_range(canonical) is None:
+            raise ValueError(f"{book} is not in the Bible structure")
+        if not chapters:
+            raise ValueError(f"{book} has no chapters")
+        
+        stored = 0
+        for chapter, verses in chapters.items():
+            chapter_range = layout.chapter_range(canonical, int(chapter))
+            if not chapter_range:
+                self.logger.warning(f"Skipping {canonical} {chapter}: not in the Bible structure")
+                continue
+            verses = {int(verse): text for verse, text in verses.items() if isinstance(text, str) and text.strip()}
+            if len(verses) != chapter_range[1]:
+                self.logger.warning(f"{translation.upper()} {canonical} {chapter} has {len(verses)} verses, "
+                                    f"expected {chapter_range[1]}")
+            if self.verse_manager is not None:
+                self.verse_manager.cache_chapter(translation, canonical, int(chapter), verses)
+            else:
+                store.add_many(canonical, int(chapter), verses)
+            stored += len(verses)
+        return stored
+
+    def _layout(self) -> VerseLayout:
+        layout = getattr(self.verse_manager, 'verse_layout', None)
+        return layout if layout is not None else load_layout()
+
+    def _open_store(self, translation: str, layout: VerseLayout) -> Optional[VerseStore]:
+        """Open the translation's verse store, unless a verse manager owns it."""
+        if self.verse_manager is not None:
+            return self.verse_manager.translation_store(translation)
+        return open_translation_store(translation, layout, self.translation_dir)
+
+    def _finish_store(self, translation: str, store: Optional[VerseStore]):
+        """Merge the journaled verses into the store file (the verse manager's writer does this itself)."""
+        if self.verse_manager is None and store is not None:
+            store.compact()
+            store.close()
+
+    def _book_done(self, checkpoint: Dict, book: str, store: Optional[VerseStore], layout: VerseLayout) -> bool:
+        """A checkpointed book counts as done only while every one of its chapters is in the store."""
+        if book not in checkpoint['completed'] or store is None:
+            return False
+        canonical = VerseLayout.normalize_book(self.book_name_mapping.get(book, book))
+        chapter = 1
+        while layout.chapter_range(canonical, chapter):
+            if not store.has_chapter(canonical, chapter):
                 return False
+            chapter += 1
+        return chapter > 1
+
+    # --- Checkpoints and manifests ---
+
+    def _checkpoint_path(self, translation: str) -> Path:
+        return self.translation_dir / f"download_{translation_file_stem(translation)}.json"
+
+    def _load_checkpoint(self, translation: str) -> Dict:
+        try:
+            with open(self._checkpoint_path(translation), 'r') as f:
+                checkpoint = json.load(f)
+            checkpoint.setdefault('completed', {})
+            return checkpoint
+        except FileNotFoundError:
+            return {'completed': {}}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read download checkpoint, starting over: {e}")
+            return {'completed': {}}
+
+    def _save_checkpoint(self, translation: str, checkpoint: Dict):
+        path = self._checkpoint_path(translation)
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.error(f"Failed to save download checkpoint: {e}")
+
+    def _load_manifest(self, translation: str) -> Dict[str, str]:
+        """Pinned checksums for a translation's files, if a manifest was provided."""
+        path = MANIFEST_DIR / f"{translation_file_stem(translation)}.sha256"
+        try:
+            return self._parse_manifest(path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _parse_manifest(text: str) -> Dict[str, str]:
+        """Parse sha256sum output into file name -> digest."""
+        manifest = {}
+        for line in text.splitlines():
+            parts = line.strip().split(None, 1)
+            if len(parts) == 2:
+                manifest[os.path.basename(parts[1].lstrip('*'))] = parts[0]
+        return manifest
+
+    # --- Offline provisioning ---
+
+    def import_archive(self, archive_path: Path, translation: str = 'kjv') -> bool:
+        """Load a translation from a local .zip/.tar(.gz) archive or JSON file.
+        
+        The archive may hold one JSON file per book (the GitHub KJV format) or a
+        whole Bible as book -> chapter -> verse JSON. Files are read and stored
+        one at a time; a SHA256SUMS file in the archive, or a manifest in
+        data/download_manifests, is checked before a file is stored.
+        """
+        archive_path = Path(archive_path)
+        layout = self._layout()
+        store = self._open_store(translation, layout)
+        manifest = self._load_manifest(translation)
         
-        # Save complete KJV Bible
+        stored = failed = skipped = 0
         try:
-            kjv_path = self.translation_dir / 'bible_kjv.json'
-            with open(kjv_path, 'w', encoding='utf-8') as f:
-                json.dump(kjv_bible, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Successfully saved complete KJV Bible to {kjv_path}")
-            self._log_bible_stats(kjv_bible, "KJV")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save KJV Bible: {e}")
+            for name, payload in self._archive_members(archive_path, manifest):
+                try:
+                    self._verify_checksum(name, payload, manifest)
+                    books = list(self._archive_books(name, json.loads(payload)))
+                except ValueError as e:
+                    failed += 1
+                    self.logger.error(f"Skipping {name} from {archive_path.name}: {e}")
+                    continue
+                # An unknown or empty book is skipped on its own; the rest of the file is still stored
+                for book, chapters in books:
+                    try:
+                        stored += self._store_book(translation, book, chapters, store, layout)
+                    except ValueError as e:
+                        skipped += 1
+                        self.logger.warning(f"Skipping {book} in {name}: {e}")
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            self.logger.error(f"Failed to read {archive_path}: {e}")
             return False
+        finally:
+            self._finish_store(translation, store)
+        
+        self.logger.info(f"Imported {stored} {translation.upper()} verses from {archive_path.name}"
+                         + (f" ({failed} files rejected)" if failed else "")
+                         + (f" ({skipped} books skipped)" if skipped else ""))
+        return stored > 0 and not failed
+
+    def _archive_members(self, archive_path: Path, manifest: Dict[str, str]) -> Iterator[Tuple[str, bytes]]:
+        """Yield (file name, bytes) for each JSON file, adding any bundled checksums to manifest."""
+        if zipfile.is_zipfile(archive_path):
+            with zipfile.ZipFile(archive_path) as archive:
+                names = [info.filename for info in archive.infolist() if not info.is_dir()]
+                for name in names:
+                    if os.path.basename(name) in ARCHIVE_MANIFEST_NAMES:
+                        manifest.update(self._parse_manifest(archive.read(name).decode('utf-8')))
+                for name in names:
+                    if name.lower().endswith('.json'):
+                        yield os.path.basename(name), archive.read(name)
+        elif tarfile.is_tarfile(archive_path):
+            with tarfile.open(archive_path) as archive:
+                members = [member for member in archive.getmembers() if member.isfile()]
+                for member in members:
+                    if os.path.basename(member.name) in ARCHIVE_MANIFEST_NAMES:
+                        manifest.update(self._parse_manifest(archive.extractfile(member).read().decode('utf-8')))
+                for member in members:
+                    if member.name.lower().endswith('.json'):
+                        yield os.path.basename(member.name), archive.extractfile(member).read()
+        else:
+            yield archive_path.name, archive_path.read_bytes()
+
+    def _archive_books(self, name: str, data: Any) -> Iterator[Tuple[str, Dict]]:
+        """Books in an archive file: a GitHub KJV book, or a whole book -> chapter -> verse Bible."""
+        if isinstance(data, dict) and isinstance(data.get('chapters'), list):
+            book = data.get('book') or os.path.splitext(name)[0]
+            yield self.book_name_mapping.get(book, book), self._convert_kjv_book_format(data)
+        elif isinstance(data, dict):
+            for book, chapters in data.items():
+                if isinstance(chapters, dict):
+                    yield book, {chapter: verses for chapter, verses in chapters.items() if isinstance(verses, dict)}
+        else:
+            raise ValueError("unrecognised Bible JSON layout")
 
     def _convert_kjv_book_format(self, book_data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
         """Convert GitHub KJV format to our expected format."""
@@ -114,33 +357,61 @@ class BibleDownloader:
         
         return converted_book
 
-    def download_web_bible(self, translation: str = 'web') -> bool:
-        """Download World English Bible from getBible API."""
+    def download_web_bible(self, translation: str = 'web', resume: bool = True) -> bool:
+        """Download World English Bible from getBible API into the verse store."""
         self.logger.info(f"Starting {translation.upper()} Bible download from getBible API...")
+        return self.download_bible(translation, f"https://getbible.net/v2/{translation}/json",
+                                   self._convert_getbible_format, resume=resume)
+
+    def download_bible(self, translation: str, url: str, convert, resume: bool = True, **request_args) -> bool:
+        """Download a whole Bible published as one JSON file and stream it into the verse store book by book.
         
+        The file is checked against the translation's manifest, and stored
+        books are checkpointed like per-book downloads, so a rerun skips the
+        request entirely once every book is in the store.
+        """
+        layout = self._layout()
+        store = self._open_store(translation, layout)
+        checkpoint = self._load_checkpoint(translation) if resume else {'completed': {}}
         try:
-            # Get Bible from getBible API
-            url = f"https://getbible.net/v2/{translation}/json"
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
+            if all(self._book_done(checkpoint, book, store, layout) for book in layout.books):
+                self.logger.info(f"{translation.upper()} Bible already downloaded")
+                return True
             
-            bible_data = response.json()
-            
-            # Convert to our format
-            converted_bible = self._convert_getbible_format(bible_data)
-            
-            # Save to file
-            file_path = self.translation_dir / f'bible_{translation}.json'
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(converted_bible, f, indent=2, ensure_ascii=False)
+            name = f"{translation_file_stem(translation)}.json"
+            response = http_client.get(url, provider='downloader', **request_args)
+            response.raise_for_status()
+            digest = self._verify_checksum(name, response.content, self._load_manifest(translation))
+            bible = convert(response.json())
+            del response
+            if not bible:
+                raise ValueError(f"{name} holds no verses")
             
-            self.logger.info(f"Successfully saved {translation.upper()} Bible to {file_path}")
-            self._log_bible_stats(converted_bible, translation.upper())
-            return True
+            stored = failed = 0
+            for book in list(bible):
+                # Drop each book once stored so the converted Bible shrinks as it is written
+                chapters = bible.pop(book)
+                canonical = VerseLayout.normalize_book(book)
+                if self._book_done(checkpoint, canonical, store, layout):
+                    continue
+                try:
+                    stored += self._store_book(translation, book, chapters, store, layout)
+                except ValueError as e:
+                    failed += 1
+                    self.logger.warning(f"Skipping {book}: {e}")
+                    continue
+                checkpoint['completed'][canonical] = digest
+                self._save_checkpoint(translation, checkpoint)
             
+            self.logger.info(f"Stored {stored} {translation.upper()} verses"
+                             + (f" ({failed} books skipped)" if failed else ""))
+            return stored > 0 or not failed
+        
         except Exception as e:
             self.logger.error(f"Failed to download {translation.upper()} Bible: {e}")
             return False
+        finally:
+            self._finish_store(translation, store)
 
     def _convert_getbible_format(self, bible_data: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, str]]]:
         """Convert getBible API format to our expected format."""
@@ -176,8 +447,8 @@ class BibleDownloader:
         
         return converted_bible
 
-    def download_bible_supserearch_json(self, translation: str = 'kjv') -> bool:
-        """Download Bible from Bible SuperSearch JSON format."""
+    def download_bible_supserearch_json(self, translation: str = 'kjv', resume: bool = True) -> bool:
+        """Download Bible from Bible SuperSearch JSON format into the verse store."""
         self.logger.info(f"Attempting to download {translation.upper()} from Bible SuperSearch...")
         
         # Bible SuperSearch direct download URLs
@@ -191,28 +462,8 @@ class BibleDownloader:
             self.logger.error(f"Translation {translation} not available from Bible SuperSearch")
             return False
         
-        try:
-            url = translation_urls[translation]
-            response = requests.get(url, timeout=120, allow_redirects=True)
-            response.raise_for_status()
-            
-            bible_data = response.json()
-            
-            # Convert format (assuming it matches getBible format)
-            converted_bible = self._convert_supersearch_format(bible_data)
-            
-            # Save to file
-            file_path = self.translation_dir / f'bible_{translation}.json'
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(converted_bible, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"Successfully saved {translation.upper()} Bible to {file_path}")
-            self._log_bible_stats(converted_bible, translation.upper())
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to download {translation.upper()} from Bible SuperSearch: {e}")
-            return False
+        return self.download_bible(translation, translation_urls[translation], self._convert_supersearch_format,
+                                   resume=resume, allow_redirects=True)
 
     def _convert_supersearch_format(self, bible_data: Any) -> Dict[str, Dict[str, Dict[str, str]]]:
         """Convert Bible SuperSearch JSON format to our expected format."""
@@ -225,20 +476,6 @@ class BibleDownloader:
             self.logger.warning("Unknown Bible SuperSearch format, attempting generic conversion")
             return {}
 
-    def _log_bible_stats(self, bible: Dict[str, Any], translation: str):
-        """Log statistics about the downloaded Bible."""
-        book_count = len(bible)
-        chapter_count = sum(len(book.get('chapters', book)) for book in bible.values() if isinstance(book, dict))
-        verse_count = 0
-        
-        for book in bible.values():
-            if isinstance(book, dict):
-                for chapter in book.values():
-                    if isinstance(chapter, dict):
-                        verse_count += len(chapter)
-        
-        self.logger.info(f"{translation} Bible stats: {book_count} books, ~{chapter_count} chapters, ~{verse_count} verses")
-
     def download_all_available(self):
         """Download all available free Bible translations."""
         self.logger.info("Starting download of all available Bible translations...")
@@ -274,10 +511,11 @@ def main():
     print("1. Download KJV from GitHub")
     print("2. Download Other Translations (WEB removed)")
     print("3. Download all available translations")
-    print("4. Exit")
+    print("4. Import a translation from a local archive")
+    print("5. Exit")
     
     try:
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = input("\nEnter your choice (1-5): ").strip()
         
         if choice == '1':
             downloader.download_kjv_complete()
@@ -286,6 +524,10 @@ def main():
         elif choice == '3':
             downloader.download_all_available()
         elif choice == '4':
+            archive = input("Archive path (.zip, .tar.gz or .json): ").strip()
+            translation = input("Translation code [kjv]: ").strip().lower() or 'kjv'
+            downloader.import_archive(Path(archive), translation)
+        elif choice == '5':
             print("Exiting...")
         else:
             print("Invalid choice")
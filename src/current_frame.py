@@ -0,0 +1,40 @@
+"""
+Immutable snapshot of what the clock is showing.
+
+The service builds one frame per display tick - the resolved verse data plus
+the rendered image - and publishes it to the verse manager. Every other
+reader (web API, health checks, voice commands, refreshes) reads the frame
+instead of resolving and rendering the minute again.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class CurrentFrame:
+    """Verse data and rendered image for one display tick.
+
+    settings_key identifies the minute and the verse settings the frame was
+    resolved under; a frame is only current while the key still matches.
+    The image is shared between readers and must not be modified.
+    """
+    settings_key: tuple
+    verse_data: Mapping[str, Any]
+    image: Optional[Any] = None
+    built_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def build(cls, settings_key: tuple, verse_data: Dict, image=None) -> 'CurrentFrame':
+        """Create a frame holding a private, read-only copy of the verse data."""
+        return cls(settings_key, MappingProxyType(dict(verse_data)), image)
+
+    def verse(self) -> Dict:
+        """A mutable copy of the frame's verse data."""
+        return dict(self.verse_data)
+
+    def with_image(self, image) -> 'CurrentFrame':
+        """The same verse data with a newly rendered image."""
+        return CurrentFrame(self.settings_key, self.verse_data, image)
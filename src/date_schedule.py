@@ -0,0 +1,87 @@
+"""
+Precompiled date-mode schedules.
+
+Date mode picks a verse from the day's biblical events for every minute.
+Instead of walking the event hierarchy each minute, a day is compiled once
+into 1440 slots that index a small table of fully parsed verse records. The
+schedule is saved to disk so a restart reuses it, and the daily maintenance
+job compiles tomorrow's schedule ahead of midnight.
+"""
+
+import json
+import logging
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCHEDULE_DIR = Path('data/date_schedules')
+SLOTS_PER_DAY = 24 * 60
+SCHEDULE_VERSION = 1
+
+
+class DateSchedule:
+    """One day's date-mode schedule: a verse record index for each minute."""
+
+    def __init__(self, day: date, records: List[Dict], slots: List[int], source_checksum: int):
+        if len(slots) != SLOTS_PER_DAY:
+            raise ValueError(f"Date schedule needs {SLOTS_PER_DAY} slots, got {len(slots)}")
+        self.day = day
+        self.records = records
+        self.slots = slots
+        self.source_checksum = source_checksum
+
+    def record_for(self, minute_of_day: int) -> Dict:
+        """Get a copy of the verse record scheduled for a minute of the day."""
+        return dict(self.records[self.slots[minute_of_day]])
+
+    @staticmethod
+    def path_for(day: date, directory: Path = SCHEDULE_DIR) -> Path:
+        return Path(directory) / f"{day.isoformat()}.json"
+
+    def save(self, directory: Path = SCHEDULE_DIR):
+        """Atomically write the schedule to disk."""
+        path = self.path_for(self.day, directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': SCHEDULE_VERSION,
+                'date': self.day.isoformat(),
+                'source_checksum': self.source_checksum,
+                'records': self.records,
+                'slots': self.slots,
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, day: date, source_checksum: int, directory: Path = SCHEDULE_DIR) -> Optional['DateSchedule']:
+        """Load a saved schedule, or None if it is missing or was built from different data."""
+        try:
+            with open(cls.path_for(day, directory), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"Ignoring unreadable date schedule for {day}: {e}")
+            return None
+
+        if data.get('version') != SCHEDULE_VERSION or data.get('source_checksum') != source_checksum:
+            return None
+        try:
+            return cls(day, data['records'], data['slots'], source_checksum)
+        except (KeyError, ValueError):
+            return None
+
+
+def prune_schedules(keep_from: date, directory: Path = SCHEDULE_DIR) -> int:
+    """Delete saved schedules for days before keep_from. Returns how many were removed."""
+    removed = 0
+    for path in Path(directory).glob('*.json'):
+        try:
+            if date.fromisoformat(path.stem) < keep_from:
+                path.unlink()
+                removed += 1
+        except (ValueError, OSError):
+            continue
+    return removed
@@ -14,6 +14,11 @@ import calendar
 import re
 from bs4 import BeautifulSoup
 
+try:
+    from src.http_client import http_client
+except ImportError:
+    from http_client import http_client
+
 class DevotionalManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -117,9 +122,10 @@ class DevotionalManager:
         today = datetime.now()
         return self.get_devotional_by_date(today, source)
 
-    def get_rotating_devotional(self, source: str = 'faiths_checkbook', rotation_minutes: int = None) -> Optional[Dict[str, Any]]:
+    def get_rotating_devotional(self, source: str = 'faiths_checkbook', rotation_minutes: int = None,
+                                now: datetime = None) -> Optional[Dict[str, Any]]:
         """Get devotional that rotates every specified number of minutes with random selection."""
-        now = datetime.now()
+        now = now or datetime.now()
         
         # Use configured interval if no override provided
         if rotation_minutes is None:
@@ -296,7 +302,7 @@ class DevotionalManager:
             for url in url_patterns:
                 try:
                     self.logger.debug(f"Trying URL: {url}")
-                    response = requests.get(url, headers=headers, timeout=self.timeout)
+                    response = http_client.get(url, headers=headers, provider='devotional')
                     
                     if response.status_code == 200:
                         devotional = self._parse_devotional_html(response.text, date)
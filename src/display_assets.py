@@ -0,0 +1,252 @@
+"""
+Display-resolution asset pipeline for backgrounds and borders.
+
+Source PNGs in images/ are decoded once and turned, in the same pass, into a
+panel-sized 8-bit grayscale raster (optionally reduced to the panel's 16
+gray levels) and the web interface thumbnail. Rasters are stored raw under
+data/display_assets/, named by the source's content hash, so rendering
+loads a ready canvas instead of resampling a PNG.
+
+Run at install time, and after changing images/:
+
+    python3 src/display_assets.py [--force]
+
+At runtime a source whose size or modification time no longer matches the
+manifest is rebuilt once on first use.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+ASSET_DIR = Path('data/display_assets')
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+THUMBNAIL_DIR = Path('src/web_interface/static/thumbnails')
+THUMBNAIL_SIZE = (150, 150)
+
+# The e-ink panel shows 16 gray levels; quantizing up front matches what it displays
+PANEL_GRAY_LEVELS = 16
+
+# Source directory -> thumbnail name pattern used by the settings page
+SOURCE_DIRS = (
+    (Path('images/backgrounds'), 'bg_{stem}_thumb.jpg'),
+    (Path('images/borders'), 'border_{stem}_thumb.jpg'),
+)
+LEGACY_DIR = (Path('images'), 'thumb_{stem}.jpg')
+
+
+class DisplayAssets:
+    """Builds and loads panel-sized rasters of the background and border images."""
+
+    def __init__(self, width: int, height: int, quantize: Optional[bool] = None, asset_dir: Path = ASSET_DIR):
+        self.logger = logging.getLogger(__name__)
+        self.width = width
+        self.height = height
+        if quantize is None:
+            quantize = os.getenv('QUANTIZE_ASSETS', 'false').lower() == 'true'
+        self.quantize = quantize
+        self.asset_dir = Path(asset_dir)
+        self._manifest: Optional[Dict] = None
+        self._lock = threading.RLock()
+
+    # --- Manifest ---
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.asset_dir / MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict:
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    manifest = json.load(f)
+                if manifest.get('version') != MANIFEST_VERSION:
+                    manifest = {}
+            except (OSError, ValueError):
+                manifest = {}
+            self._manifest = manifest.get('assets', {})
+        return self._manifest
+
+    def _save_manifest(self):
+        try:
+            self.asset_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(MANIFEST_NAME + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'assets': self._manifest}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save display asset manifest: {e}")
+
+    # --- Sources ---
+
+    @staticmethod
+    def sources() -> List[Tuple[Path, str]]:
+        """Source images with the thumbnail name the web interface expects for each."""
+        found = []
+        for directory, thumbnail_pattern in SOURCE_DIRS:
+            if directory.exists():
+                found += [(path, thumbnail_pattern.format(stem=path.stem)) for path in sorted(directory.glob('*.png'))]
+        if not found and LEGACY_DIR[0].exists():
+            found = [(path, LEGACY_DIR[1].format(stem=path.stem)) for path in sorted(LEGACY_DIR[0].glob('*.png'))]
+        return found
+
+    def _raster_name(self, content_hash: str) -> str:
+        suffix = f'_q{PANEL_GRAY_LEVELS}' if self.quantize else ''
+        return f"{content_hash[:16]}_{self.width}x{self.height}{suffix}.l8"
+
+    # --- Building ---
+
+    def build(self, force: bool = False) -> Dict[str, int]:
+        """Bring every source's raster and thumbnail up to date; returns counts."""
+        counts = {'updated': 0, 'current': 0, 'failed': 0}
+        with self._lock:
+            manifest = self._load_manifest()
+            for source, thumbnail_name in self.sources():
+                try:
+                    if self._ensure(source, thumbnail_name, force):
+                        counts['updated'] += 1
+                    else:
+                        counts['current'] += 1
+                except Exception as e:
+                    counts['failed'] += 1
+                    self.logger.warning(f"Could not build display asset for {source}: {e}")
+            self._prune(manifest)
+            self._save_manifest()
+        if counts['updated'] or counts['failed']:
+            self.logger.info(f"Display assets: {counts['updated']} updated, {counts['current']} current, {counts['failed']} failed")
+        return counts
+
+    def _ensure(self, source: Path, thumbnail_name: Optional[str], force: bool = False) -> bool:
+        """Build a source's assets unless the manifest already matches it.
+
+        Returns True when the manifest entry was written (assets built, or the
+        file was touched without changing its content).
+        """
+        manifest = self._load_manifest()
+        stat = source.stat()
+        entry = manifest.get(str(source))
+        if not force and entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size \
+                and entry['raster'] == self._raster_name(entry['hash']) and (self.asset_dir / entry['raster']).exists():
+            return False
+
+        data = source.read_bytes()
+        content_hash = hashlib.sha1(data).hexdigest()
+        raster_name = self._raster_name(content_hash)
+        raster_path = self.asset_dir / raster_name
+        thumbnail_path = THUMBNAIL_DIR / thumbnail_name if thumbnail_name else None
+        need_raster = force or not raster_path.exists()
+        # Thumbnails shipped with the repo are kept until their source's content changes
+        need_thumbnail = thumbnail_path is not None and (
+            force or not thumbnail_path.exists() or (entry is not None and entry['hash'] != content_hash))
+
+        if need_raster or need_thumbnail:
+            with Image.open(source) as image:
+                image.load()
+                if need_raster:
+                    self._write_raster(self._display_raster(image), raster_path)
+                if need_thumbnail:
+                    self._write_thumbnail(image, thumbnail_path)
+            self.logger.debug(f"Built display asset {raster_name} from {source}")
+
+        manifest[str(source)] = {
+            'hash': content_hash,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'raster': raster_name,
+            'thumbnail': thumbnail_name,
+        }
+        return True
+
+    def _display_raster(self, image: Image.Image) -> Image.Image:
+        """Panel-sized grayscale version of a decoded source image."""
+        if image.size != (self.width, self.height):
+            image = image.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        image = image.convert('L')
+        if self.quantize:
+            step = 255 / (PANEL_GRAY_LEVELS - 1)
+            image = image.point([int(round(round(value / step) * step)) for value in range(256)])
+        return image
+
+    def _write_raster(self, image: Image.Image, path: Path):
+        self.asset_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(image.tobytes())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_thumbnail(image: Image.Image, path: Path):
+        """Web thumbnail: white-flattened RGB JPEG of at most THUMBNAIL_SIZE."""
+        if image.mode in ('RGBA', 'LA', 'P'):
+            rgba = image.convert('RGBA')
+            flattened = Image.new('RGB', image.size, (255, 255, 255))
+            flattened.paste(rgba, mask=rgba.split()[-1])
+            image = flattened
+        else:
+            image = image.copy()
+        image.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.stem + '.tmp.jpg')
+        image.save(tmp_path, 'JPEG', quality=85, optimize=True)
+        os.replace(tmp_path, path)
+
+    def _prune(self, manifest: Dict):
+        """Forget removed sources and delete rasters no manifest entry points to."""
+        for source in [source for source in manifest if not Path(source).exists()]:
+            del manifest[source]
+        referenced = {entry['raster'] for entry in manifest.values()}
+        if self.asset_dir.exists():
+            for raster in self.asset_dir.glob('*.l8'):
+                if raster.name not in referenced:
+                    raster.unlink()
+
+    # --- Runtime ---
+
+    def load(self, source: Path) -> Image.Image:
+        """Panel-sized grayscale raster of a source image, building it if out of date."""
+        source = Path(source)
+        with self._lock:
+            manifest = self._load_manifest()
+            entry = manifest.get(str(source))
+            thumbnail_name = entry.get('thumbnail') if entry else None
+            if self._ensure(source, thumbnail_name):
+                self._save_manifest()
+            raster_path = self.asset_dir / manifest[str(source)]['raster']
+
+        data = raster_path.read_bytes()
+        if len(data) != self.width * self.height:
+            raise ValueError(f"Display asset {raster_path.name} has the wrong size")
+        return Image.frombytes('L', (self.width, self.height), data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build display-resolution backgrounds, borders and thumbnails.')
+    parser.add_argument('--force', action='store_true', help='rebuild every asset')
+    parser.add_argument('--quantize', action='store_true', default=None,
+                        help=f'reduce rasters to {PANEL_GRAY_LEVELS} gray levels (default: QUANTIZE_ASSETS)')
+    args = parser.parse_args()
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    assets = DisplayAssets(int(os.getenv('DISPLAY_WIDTH', '1872')), int(os.getenv('DISPLAY_HEIGHT', '1404')),
+                           quantize=args.quantize)
+    counts = assets.build(force=args.force)
+    print(f"Display assets: {counts['updated']} updated, {counts['current']} up to date, {counts['failed']} failed")
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,6 +15,13 @@ try:
 except ImportError:
     from .display_constants import DisplayModes
 
+try:
+    from src.font_registry import font_registry
+    from src.text_layout import text_layout
+except ImportError:
+    from font_registry import font_registry
+    from text_layout import text_layout
+
 class DisplayManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -302,10 +309,10 @@ class DisplayManager:
                 font_size = 48
                 
             try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
+                font = font_registry.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
             except:
                 try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+                    font = font_registry.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
                 except:
                     font = ImageFont.load_default()
             
@@ -414,19 +421,7 @@ class DisplayManager:
     
     def _wrap_text_for_display(self, text: str, font, max_width: int) -> list:
         """Wrap text to fit within display width."""
-        import textwrap
-        
-        # Calculate average character width
-        sample_text = "W" * 10  # Use wide character for measurement
-        sample_bbox = ImageDraw.Draw(Image.new('L', (100, 100))).textbbox((0, 0), sample_text, font=font)
-        avg_char_width = (sample_bbox[2] - sample_bbox[0]) / len(sample_text)
-        
-        # Calculate approximate characters per line
-        chars_per_line = int(max_width / avg_char_width) - 2  # Add buffer
-        
-        # Wrap text
-        wrapped = textwrap.fill(text, width=max(chars_per_line, 20))  # Minimum 20 chars per line
-        return wrapped.split('\n')
+        return text_layout.wrap(text, font, max_width)
     
     def _draw_multiline_text(self, draw, position: tuple, text: str, font, fill=0):
         """Draw multi-line text on the display."""
@@ -0,0 +1,88 @@
+"""
+Process-wide registry of loaded fonts.
+
+Opening a TrueType face parses the font file, and the render paths ask for
+the same few faces at many sizes (auto-fit tries a dozen sizes per verse).
+The registry resolves each font file's path once and keeps an LRU of loaded
+faces keyed by (path, size), shared by the image generator and the display
+manager.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from PIL import ImageFont
+
+SYSTEM_FONT_DIR = Path('/usr/share/fonts/truetype/dejavu')
+LOCAL_FONT_DIR = Path('data/fonts')
+
+# Loaded faces kept in memory; a face at one size is a few KB plus FreeType state
+MAX_FONTS = int(os.getenv('FONT_CACHE_SIZE', '64'))
+
+
+class FontRegistry:
+    """LRU of loaded TrueType faces keyed by (path, size)."""
+
+    def __init__(self, max_fonts: int = MAX_FONTS):
+        self.logger = logging.getLogger(__name__)
+        self.max_fonts = max(1, max_fonts)
+        self._fonts: OrderedDict = OrderedDict()
+        self._paths: Dict[str, str] = {}
+        self._system_fonts: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    @property
+    def system_fonts_available(self) -> bool:
+        """Whether the system DejaVu fonts are installed (checked once)."""
+        if self._system_fonts is None:
+            self._system_fonts = SYSTEM_FONT_DIR.exists()
+        return self._system_fonts
+
+    def resolve(self, filename: str) -> str:
+        """Path of a DejaVu font file, preferring the system copy over data/fonts."""
+        path = self._paths.get(filename)
+        if path is None:
+            system_path = SYSTEM_FONT_DIR / filename
+            path = str(system_path if self.system_fonts_available and system_path.exists()
+                       else LOCAL_FONT_DIR / filename)
+            self._paths[filename] = path
+        return path
+
+    def truetype(self, path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Get a loaded face, opening it only on first use.
+
+        Raises the same errors as ImageFont.truetype so callers keep their
+        fallbacks.
+        """
+        key = (str(path), int(size))
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self._fonts.move_to_end(key)
+                return font
+
+        font = ImageFont.truetype(key[0], key[1])
+        with self._lock:
+            self._fonts[key] = font
+            while len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+        return font
+
+    def get(self, filename: str, size: int):
+        """Get a DejaVu face by file name, falling back to Pillow's default font."""
+        try:
+            return self.truetype(self.resolve(filename), size)
+        except Exception as e:
+            self.logger.warning(f"Failed to load font {filename} at size {size}: {e}")
+            try:
+                return ImageFont.load_default()
+            except Exception:
+                return None
+
+
+# Global font registry instance
+font_registry = FontRegistry()
@@ -0,0 +1,172 @@
+"""
+Shared HTTP transport for Bible Clock.
+
+All outbound requests go through one requests.Session so connections to each
+host are pooled and kept alive between calls - on a Pi over Wi-Fi the TCP+TLS
+handshake is most of a verse request's latency. Concurrency is bounded and
+each provider gets its own (connect, read) timeout.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from src.provider_health import provider_health
+except ImportError:
+    from provider_health import provider_health
+
+Timeout = Union[float, Tuple[float, float]]
+
+# Connect timeout is short everywhere: a host that does not answer the SYN
+# quickly is down, while read timeouts depend on how much the provider returns
+CONNECT_TIMEOUT = 3.05
+
+DEFAULT_PROVIDER_TIMEOUTS: Dict[str, Timeout] = {
+    'bible-api': (CONNECT_TIMEOUT, 10),
+    'wldeh_api': (CONNECT_TIMEOUT, 8),
+    'esv_api': (CONNECT_TIMEOUT, 10),
+    'scripture_api': (CONNECT_TIMEOUT, 10),
+    'biblegateway': (CONNECT_TIMEOUT, 10),
+    'web_scraping': (CONNECT_TIMEOUT, 15),
+    'devotional': (CONNECT_TIMEOUT, 30),
+    'downloader': (CONNECT_TIMEOUT, 120),
+}
+
+# Responses that mean the provider is refusing us rather than missing the verse
+FAILURE_STATUSES = {401, 403, 429}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class HttpClient:
+    """Pooled, keep-alive HTTP client shared by verse providers and downloaders."""
+
+    def __init__(self, max_concurrency: int = None, pool_hosts: int = None, pool_size: int = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency = max_concurrency or int(os.getenv('HTTP_MAX_CONCURRENCY', '4'))
+        self.pool_hosts = pool_hosts or int(os.getenv('HTTP_POOL_HOSTS', '10'))
+        self.pool_size = pool_size or int(os.getenv('HTTP_POOL_SIZE', '4'))
+
+        default_read = float(os.getenv('REQUEST_TIMEOUT', '10'))
+        self.default_timeout: Timeout = (CONNECT_TIMEOUT, default_read)
+        self.provider_timeouts: Dict[str, Timeout] = dict(DEFAULT_PROVIDER_TIMEOUTS)
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._deadlines = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared session, created on first use."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                # pool_connections = hosts kept pooled, pool_maxsize = keep-alive connections per host
+                adapter = HTTPAdapter(pool_connections=self.pool_hosts, pool_maxsize=self.pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['User-Agent'] = USER_AGENT
+                self._session = session
+            return self._session
+
+    def timeout_for(self, provider: Optional[str]) -> Timeout:
+        """Get the (connect, read) timeout for a provider."""
+        return self.provider_timeouts.get(provider, self.default_timeout)
+
+    def set_timeout(self, provider: str, timeout: Timeout):
+        """Override the timeout used for a provider."""
+        self.provider_timeouts[provider] = timeout
+
+    @contextmanager
+    def deadline(self, at: float):
+        """Cap the requests this thread sends inside the block at a time.monotonic() deadline.
+
+        Each request's timeouts shrink to the time left, and a request that
+        would start after the deadline raises requests.Timeout instead.
+        """
+        previous = getattr(self._deadlines, 'at', None)
+        self._deadlines.at = at if previous is None else min(at, previous)
+        try:
+            yield
+        finally:
+            self._deadlines.at = previous
+
+    def _time_left(self) -> Optional[float]:
+        """Seconds until this thread's deadline, or None without one."""
+        at = getattr(self._deadlines, 'at', None)
+        return None if at is None else at - time.monotonic()
+
+    @staticmethod
+    def _cap_timeout(timeout: Optional[Timeout], left: float) -> Timeout:
+        if timeout is None:
+            return left
+        if isinstance(timeout, tuple):
+            return tuple(left if part is None else min(part, left) for part in timeout)
+        return min(timeout, left)
+
+    def request(self, method: str, url: str, provider: str = None, **kwargs) -> requests.Response:
+        """Send a request through the pooled session.
+
+        The provider name selects the timeout unless one is passed explicitly,
+        and the outcome is recorded in the provider's circuit breaker.
+        At most max_concurrency requests are in flight at once; for streamed
+        responses the slot is released once the headers have arrived. Inside
+        deadline() the wait for a slot and the timeouts stop at the deadline.
+        """
+        kwargs.setdefault('timeout', self.timeout_for(provider))
+        left = self._time_left()
+        if left is None:
+            self._slots.acquire()
+        elif left <= 0 or not self._slots.acquire(timeout=left):
+            raise requests.Timeout(f"deadline passed before {urlsplit(url).netloc} was requested")
+        else:
+            kwargs['timeout'] = self._cap_timeout(kwargs['timeout'], max(self._time_left(), 0.01))
+        try:
+            self.logger.debug(f"{method} {urlsplit(url).netloc} ({provider or 'default'})")
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                if provider:
+                    provider_health.record_failure(provider, time.monotonic() - started, type(e).__name__)
+                raise
+        finally:
+            self._slots.release()
+
+        if provider:
+            latency = time.monotonic() - started
+            if response.status_code in FAILURE_STATUSES or response.status_code >= 500:
+                provider_health.record_failure(provider, latency, f"HTTP {response.status_code}")
+            else:
+                provider_health.record_answer(provider, latency)
+                if response.status_code == 404:
+                    provider_health.record_not_found()
+        return response
+
+    def get(self, url: str, provider: str = None, **kwargs) -> requests.Response:
+        """Send a GET request through the pooled session."""
+        return self.request('GET', url, provider=provider, **kwargs)
+
+    def post(self, url: str, provider: str = None, **kwargs) -> requests.Response:
+        """Send a POST request through the pooled session."""
+        return self.request('POST', url, provider=provider, **kwargs)
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Global HTTP client instance
+http_client = HttpClient()
@@ -4,13 +4,38 @@ Generates images for Bible verses with backgrounds and typography.
 
 import os
 import random
+import hashlib
 import logging
+import math
+import threading
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List
-import textwrap
 from datetime import datetime
 
+try:
+    from src.display_assets import DisplayAssets
+    from src.font_registry import font_registry
+    from src.text_layout import text_layout
+except ImportError:
+    from display_assets import DisplayAssets
+    from font_registry import font_registry
+    from text_layout import text_layout
+
+# Paginated text layouts kept in memory (summaries, devotionals, date events)
+MAX_PAGE_LAYOUTS = 16
+# Auto-fit font sizes remembered per text and text box
+MAX_FITTED_SIZES = 512
+# Finished background + border composites kept in memory (about 2.6 MB each at
+# 1872x1404) and, unless disabled, as raw 8-bit grayscale files on disk
+MAX_COMPOSITES = 4
+MAX_COMPOSITE_FILES = 8
+COMPOSITE_CACHE_DIR = Path('data/composites')
+# Share of the measured text width the auto-fit estimate counts on, so the
+# estimate never rules out a size that actually fits (line breaks drop spaces)
+FIT_ESTIMATE_SLACK = 0.9
+
 class ImageGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -30,6 +55,9 @@ class ImageGenerator:
         self.enhanced_layering_enabled = True
         self.separate_background_index = 0  # Pure white by default
         self.separate_border_index = 0      # No border by default
+        self._composites = OrderedDict()
+        self._composite_lock = threading.Lock()
+        self.composite_disk_cache = os.getenv('COMPOSITE_DISK_CACHE', 'true').lower() == 'true'
         
         # Background cycling settings
         self.background_cycling_enabled = False
@@ -38,6 +66,9 @@ class ImageGenerator:
         
         self._discover_fonts()
         
+        # Panel-sized rasters of the background and border images
+        self.display_assets = DisplayAssets(self.width, self.height)
+        
         # Load fonts
         self._load_fonts()
         
@@ -57,44 +88,37 @@ class ImageGenerator:
         self.reference_x_offset = 0  # Custom X offset from calculated position
         self.reference_y_offset = 30  # Push reference down 30 pixels from top (was 20)
         self.reference_margin = 20   # Margin from edges
+        
+        # Wrapped pages of long texts, so page flips only draw precomputed lines,
+        # and auto-fit font sizes of texts already laid out
+        self._page_layouts = OrderedDict()
+        self._fitted_sizes = OrderedDict()
+        self._layout_lock = threading.Lock()
     
     def _get_font(self, size: int):
         """Get a font at the specified size."""
-        try:
-            # Try system DejaVu fonts first
-            system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-            if system_dejavu_path.exists():
-                return ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), size)
-            else:
-                # Fallback to local fonts
-                font_dir = Path('data/fonts')
-                return ImageFont.truetype(str(font_dir / 'DejaVuSans.ttf'), size)
-        except Exception as e:
-            self.logger.warning(f"Failed to load font at size {size}: {e}")
-            # Return default font
-            try:
-                return ImageFont.load_default()
-            except:
-                return None
+        # System DejaVu fonts first, then local fonts, then Pillow's default font
+        return font_registry.get('DejaVuSans.ttf', size)
+    
+    def _verse_font_path(self) -> str:
+        """Path of the face used for auto-sized verse text."""
+        if not font_registry.system_fonts_available and self.current_font_name != 'default' \
+                and self.available_fonts.get(self.current_font_name):
+            return self.available_fonts[self.current_font_name]
+        return font_registry.resolve('DejaVuSans.ttf')
     
     def _load_fonts(self):
         """Load fonts for text rendering."""
-        # Try system fonts first
-        system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-        font_dir = Path('data/fonts')
-        
         try:
-            # Try system DejaVu fonts first
-            if system_dejavu_path.exists():
-                self.title_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans-Bold.ttf'), self.title_size)
-                self.verse_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), self.verse_size)
-                self.reference_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans-Bold.ttf'), self.reference_size)
+            # System DejaVu fonts first, local fonts otherwise
+            bold_path = font_registry.resolve('DejaVuSans-Bold.ttf')
+            regular_path = font_registry.resolve('DejaVuSans.ttf')
+            self.title_font = font_registry.truetype(bold_path, self.title_size)
+            self.verse_font = font_registry.truetype(regular_path, self.verse_size)
+            self.reference_font = font_registry.truetype(bold_path, self.reference_size)
+            if font_registry.system_fonts_available:
                 self.logger.info("System DejaVu fonts loaded successfully")
             else:
-                # Fallback to local fonts
-                self.title_font = ImageFont.truetype(str(font_dir / 'DejaVuSans-Bold.ttf'), self.title_size)
-                self.verse_font = ImageFont.truetype(str(font_dir / 'DejaVuSans.ttf'), self.verse_size)
-                self.reference_font = ImageFont.truetype(str(font_dir / 'DejaVuSans-Bold.ttf'), self.reference_size)
                 self.logger.info("Local fonts loaded successfully")
         except Exception as e:
             self.logger.warning(f"Failed to load DejaVu fonts: {e}")
@@ -102,9 +126,9 @@ class ImageGenerator:
             try:
                 nimbus_path = '/usr/share/fonts/opentype/urw-base35/NimbusSans-Regular.otf'
                 nimbus_bold_path = '/usr/share/fonts/opentype/urw-base35/NimbusSans-Bold.otf'
-                self.title_font = ImageFont.truetype(nimbus_bold_path, self.title_size)
-                self.verse_font = ImageFont.truetype(nimbus_path, self.verse_size)
-                self.reference_font = ImageFont.truetype(nimbus_bold_path, self.reference_size)
+                self.title_font = font_registry.truetype(nimbus_bold_path, self.title_size)
+                self.verse_font = font_registry.truetype(nimbus_path, self.verse_size)
+                self.reference_font = font_registry.truetype(nimbus_bold_path, self.reference_size)
                 self.logger.info("NimbusSans fallback fonts loaded")
             except:
                 self.logger.error("All font loading failed - using minimal fallback")
@@ -260,36 +284,103 @@ class ImageGenerator:
                     self.logger.warning(f"Failed to load separate border {border_file}: {e}")
     
     def _create_enhanced_layered_background(self) -> Image.Image:
-        """Create a properly layered background + border image."""
+        """Get the layered background + border image.
+        
+        The composite is cached per background, border, display size and file
+        modification times, so it is only built when the selection or the images
+        change. The returned image is shared: copy it before drawing on it.
+        """
         if not self.enhanced_layering_enabled:
             return self._get_background(self.current_background_index)
         
+        background_path = self._selected_layer(self.separate_backgrounds, self.separate_background_index)
+        border_path = self._selected_layer(self.separate_borders, self.separate_border_index)
+        key = (self._layer_key(background_path), self._layer_key(border_path), self.width, self.height,
+               self.display_assets.quantize)
+        with self._composite_lock:
+            image = self._composites.get(key)
+            if image is not None:
+                self._composites.move_to_end(key)
+                return image
+        
+        cache_file = COMPOSITE_CACHE_DIR / f"{hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]}_{self.width}x{self.height}.l8"
+        image = self._load_composite(cache_file) if self.composite_disk_cache else None
+        if image is None:
+            image, complete = self._build_layered_background(background_path, border_path)
+            if not complete:
+                # Keyed by file mtimes, a cached partial image would outlive the failure
+                return image
+            if self.composite_disk_cache and (background_path or border_path):
+                self._save_composite(cache_file, image)
+        
+        with self._composite_lock:
+            self._composites[key] = image
+            while len(self._composites) > MAX_COMPOSITES:
+                self._composites.popitem(last=False)
+        return image
+    
+    @staticmethod
+    def _selected_layer(paths: List, index: int) -> Optional[Path]:
+        return paths[index] if 0 <= index < len(paths) else None
+    
+    @staticmethod
+    def _layer_key(path: Optional[Path]) -> Optional[Tuple[str, int]]:
+        """Identify a layer image by path and modification time."""
+        if path is None:
+            return None
+        try:
+            return (str(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return (str(path), 0)
+    
+    def _load_composite(self, cache_file: Path) -> Optional[Image.Image]:
+        """Read a composite saved as raw 8-bit grayscale, if present and complete."""
+        try:
+            data = cache_file.read_bytes()
+        except OSError:
+            return None
+        if len(data) != self.width * self.height:
+            return None
+        self.logger.debug(f"Loaded cached composite {cache_file.name}")
+        return Image.frombytes('L', (self.width, self.height), data)
+    
+    def _save_composite(self, cache_file: Path, image: Image.Image):
+        """Atomically save a composite as raw 8-bit grayscale, pruning old files."""
+        try:
+            COMPOSITE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            tmp_file.write_bytes(image.tobytes())
+            os.replace(tmp_file, cache_file)
+            
+            saved = sorted(COMPOSITE_CACHE_DIR.glob('*.l8'), key=lambda f: f.stat().st_mtime, reverse=True)
+            for old_file in saved[MAX_COMPOSITE_FILES:]:
+                old_file.unlink()
+        except OSError as e:
+            self.logger.warning(f"Could not save composite background: {e}")
+    
+    def _build_layered_background(self, bg_path: Optional[Path], border_path: Optional[Path]) -> Tuple[Image.Image, bool]:
+        """Composite a background and border at display size.
+        
+        Returns (image, complete); complete is False when a layer failed to
+        load and was left out, so the image must not be cached.
+        """
         # Start with pure white base
         image = Image.new('L', (self.width, self.height), 255)
+        complete = True
         
         # Layer 1: Background (if not pure white)
-        if (self.separate_background_index < len(self.separate_backgrounds) and 
-            self.separate_backgrounds[self.separate_background_index] is not None):
-            
-            bg_path = self.separate_backgrounds[self.separate_background_index]
+        if bg_path is not None:
             try:
-                bg_img = Image.open(bg_path)
-                bg_img = bg_img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                bg_img = bg_img.convert('L')  # Ensure grayscale
-                image = bg_img.copy()
+                image = self.display_assets.load(bg_path)  # Already grayscale at display size
                 self.logger.debug(f"Applied background: {bg_path.name}")
             except Exception as e:
+                complete = False
                 self.logger.warning(f"Failed to apply background {bg_path}: {e}")
         
         # Layer 2: Border (if selected)
-        if (self.separate_border_index < len(self.separate_borders) and 
-            self.separate_borders[self.separate_border_index] is not None):
-            
-            border_path = self.separate_borders[self.separate_border_index]
+        if border_path is not None:
             try:
-                border_img = Image.open(border_path)
-                border_img = border_img.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                border_img = border_img.convert('L')  # Ensure grayscale
+                border_img = self.display_assets.load(border_path)  # Already grayscale at display size
                 
                 # Composite border over background using proper blending
                 import numpy as np
@@ -306,9 +397,10 @@ class ImageGenerator:
                 self.logger.debug(f"Applied border: {border_path.name}")
                 
             except Exception as e:
+                complete = False
                 self.logger.warning(f"Failed to apply border {border_path}: {e}")
         
-        return image
+        return image, complete
     
     def _create_default_background(self) -> Image.Image:
         """Create a simple default background."""
@@ -325,14 +417,14 @@ class ImageGenerator:
         return bg
     
     def _get_background(self, index: int) -> Image.Image:
-        """Lazy load background image with LRU cache."""
+        """Lazy load background image with LRU cache (shared: copy before drawing)."""
         if index < 0 or index >= len(self.background_files):
             self.logger.warning(f"Invalid background index {index}, using default")
             return self._create_default_background()
         
         # Check if already cached
         if index in self.background_cache:
-            return self.background_cache[index].copy()
+            return self.background_cache[index]
         
         # Load background
         bg_file = self.background_files[index]
@@ -342,11 +434,8 @@ class ImageGenerator:
             background = self._create_default_background()
         else:
             try:
-                bg_image = Image.open(bg_file)
-                # Resize to display dimensions
-                bg_image = bg_image.resize((self.width, self.height), Image.Resampling.LANCZOS)
-                # Convert to grayscale for e-ink
-                background = bg_image.convert('L')
+                # Prebuilt grayscale raster at display dimensions
+                background = self.display_assets.load(bg_file)
                 self.logger.debug(f"Lazy loaded background: {bg_file.name}")
             except Exception as e:
                 self.logger.warning(f"Failed to load background {bg_file}: {e}")
@@ -361,7 +450,7 @@ class ImageGenerator:
         
         # Cache the new background
         self.background_cache[index] = background
-        return background.copy()
+        return background
     
     def create_verse_image(self, verse_data: Dict) -> Image.Image:
         """Create an image for a Bible verse."""
@@ -378,7 +467,7 @@ class ImageGenerator:
             self.logger.error(f"Error loading background: {e}")
             background = self._create_default_background()
         
-        # Create a fresh copy to avoid artifacts from previous renders
+        # Create a fresh copy of the cached canvas to avoid artifacts from previous renders
         background = background.copy()
         draw = ImageDraw.Draw(background)
         
@@ -480,22 +569,15 @@ class ImageGenerator:
         
         # Calculate current page based on time rotation (same as devotionals)
         # Use 15-second rotation interval for pages
-        from datetime import datetime
-        now = datetime.now()
-        page_rotation_seconds = 15  # Change page every 15 seconds
-        seconds_since_midnight = now.hour * 3600 + now.minute * 60 + now.second
-        page_slot = (seconds_since_midnight // page_rotation_seconds) % len(pages)
+        page_slot = self._current_page_slot(len(pages), 15)
         current_page = page_slot + 1  # Pages are 1-indexed
         
         # Update verse_data with page information
         verse_data['current_page'] = current_page
         verse_data['total_pages'] = len(pages)
         
-        # Get current page content
-        page_content = pages[page_slot]
-        
-        # Draw the current page
-        self._draw_book_summary_page(draw, verse_data, page_content, margin, content_width)
+        # Draw the current page from the precomputed lines
+        self._draw_book_summary_page(draw, verse_data, pages[page_slot], margin, content_width)
         
         # Add verse reference display (shows current time for summaries)
         self._add_verse_reference_display(draw, verse_data)
@@ -575,45 +657,11 @@ class ImageGenerator:
                 draw.text((line_x, y_position), line, fill=0, font=self.verse_font)
                 y_position += line_height + 25
 
-    def _paginate_book_summary_text(self, text: str, content_width: int, margin: int) -> List[str]:
+    def _paginate_book_summary_text(self, text: str, content_width: int, margin: int) -> List[List[Tuple[str, int, int]]]:
         """Split book summary text into pages that fit the display (similar to devotionals)."""
-        # Use a reasonable font size for pagination calculation
-        test_font = self._get_font(self.verse_size)
-        
-        # Calculate available space for content
-        ref_bbox = (0, 0, 0, 100)  # Approximate reference height
-        ref_height = ref_bbox[3] - ref_bbox[1]
-        has_decorative_border = self.current_background_index > 0
-        base_margin = self.reference_margin if hasattr(self, 'reference_margin') else 20
-        if has_decorative_border:
-            base_margin = max(base_margin, 80)
-        
-        ref_y = base_margin + self.reference_y_offset
-        min_gap = 40
-        reference_bottom = ref_y + ref_height + min_gap
-        title_height = 60  # Approximate title height for "Book of [Name]"
-        available_height = self.height - reference_bottom - title_height - margin - 60  # Reserve space for page info
-        
-        # Calculate max lines per page
-        line_height = test_font.size + 25 if test_font else 30  # Match book summary line spacing
-        max_lines_per_page = max(3, available_height // line_height)  # Minimum 3 lines per page
-        
-        # Wrap text and split into pages
-        wrapped_lines = self._wrap_text(text, content_width, test_font)
-        
-        # If text fits on one page, return single page
-        if len(wrapped_lines) <= max_lines_per_page:
-            return [text]
-        
-        # Split into pages
-        pages = []
-        for i in range(0, len(wrapped_lines), max_lines_per_page):
-            page_lines = wrapped_lines[i:i + max_lines_per_page]
-            pages.append(' '.join(page_lines))
-        
-        return pages
+        return self._page_layout('summary', text, content_width, margin)
 
-    def _draw_book_summary_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_content: str, margin: int, content_width: int):
+    def _draw_book_summary_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_lines: List[Tuple[str, int, int]], margin: int, content_width: int):
         """Draw a single page of book summary content."""
         
         # Get book name for the title
@@ -665,10 +713,7 @@ class ImageGenerator:
                 content_start_y += page_info_bbox[3] - page_info_bbox[1] + 20
         
         # Use consistent font size for all pages
-        page_font = self._get_font(self.verse_size)
-        
-        # Wrap page content
-        wrapped_text = self._wrap_text(page_content, content_width, page_font)
+        page_font = self._page_font()
         
         # Draw page text with bottom margin protection
         y_position = content_start_y
@@ -676,17 +721,12 @@ class ImageGenerator:
         bottom_margin = base_margin if not has_decorative_border else max(base_margin, 80)
         max_y_position = self.height - bottom_margin - 40  # Extra buffer for decorative borders
         
-        for line in wrapped_text:
+        for line, line_x, line_height in page_lines:
             if page_font:
-                line_bbox = draw.textbbox((0, 0), line, font=page_font)
-                line_width = line_bbox[2] - line_bbox[0]
-                line_height = line_bbox[3] - line_bbox[1]
-                
                 # Check if this line would exceed bottom boundary
                 if y_position + line_height > max_y_position:
                     break  # Stop drawing if we would overlap with bottom border
                 
-                line_x = (self.width - line_width) // 2
                 draw.text((line_x, y_position), line, fill=0, font=page_font)
                 y_position += page_font.size + 25  # Match book summary line spacing
     
@@ -696,45 +736,12 @@ class ImageGenerator:
         min_font_size = 24
         available_height = self.height - (2 * margin) - 120  # Reserve space for bottom-right reference
         
-        # Start with desired size and scale down if needed
-        for font_size in range(max_font_size, min_font_size - 1, -2):
-            try:
-                # Use system DejaVu fonts
-                system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-                if system_dejavu_path.exists():
-                    test_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), font_size)
-                elif self.current_font_name != 'default' and self.available_fonts[self.current_font_name]:
-                    test_font = ImageFont.truetype(self.available_fonts[self.current_font_name], font_size)
-                else:
-                    test_font = ImageFont.truetype(str(Path('data/fonts/DejaVuSans.ttf')), font_size)
-                
-                # Test if text fits
-                wrapped_text = self._wrap_text(text, content_width, test_font)
-                total_height = len(wrapped_text) * (font_size + 20)
-                
-                if total_height <= available_height:
-                    return test_font
-                    
-            except Exception:
-                # Fallback to default font
-                try:
-                    test_font = ImageFont.load_default()
-                    wrapped_text = self._wrap_text(text, content_width, test_font)
-                    return test_font
-                except:
-                    continue
-        
-        # If all else fails, use minimum size
         try:
-            # Use system DejaVu fonts for fallback
-            system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-            if system_dejavu_path.exists():
-                return ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), min_font_size)
-            elif self.current_font_name != 'default' and self.available_fonts[self.current_font_name]:
-                return ImageFont.truetype(self.available_fonts[self.current_font_name], min_font_size)
-            else:
-                return ImageFont.truetype(str(Path('data/fonts/DejaVuSans.ttf')), min_font_size)
-        except:
+            font_path = self._verse_font_path()
+            font_size = self._fit_font_size([text], content_width, available_height, max_font_size, min_font_size, 20, font_path)
+            return font_registry.truetype(font_path, font_size)
+        except Exception:
+            # Fallback to default font
             return ImageFont.load_default()
 
     def _get_optimal_font_size_parallel(self, primary_text: str, secondary_text: str, column_width: int, margin: int) -> ImageFont.ImageFont:
@@ -749,75 +756,77 @@ class ImageGenerator:
         spacing_margin = 100  # Extra margin for proper spacing
         available_height = self.height - (2 * margin) - ref_height - label_height - spacing_margin
         
-        # Test both texts and find size that fits both comfortably
-        for font_size in range(max_font_size, min_font_size - 1, -2):
-            try:
-                # Use system DejaVu fonts
-                system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-                if system_dejavu_path.exists():
-                    test_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), font_size)
-                elif self.current_font_name != 'default' and self.available_fonts[self.current_font_name]:
-                    test_font = ImageFont.truetype(self.available_fonts[self.current_font_name], font_size)
-                else:
-                    test_font = ImageFont.truetype(str(Path('data/fonts/DejaVuSans.ttf')), font_size)
-                
-                # Test both texts with more conservative line spacing
-                wrapped_primary = self._wrap_text(primary_text, column_width, test_font)
-                wrapped_secondary = self._wrap_text(secondary_text, column_width, test_font)
-                
-                max_lines = max(len(wrapped_primary), len(wrapped_secondary))
-                total_height = max_lines * (font_size + 18)  # Slightly more line spacing for parallel mode
-                
-                # Be more conservative - only use this size if it fits comfortably
-                if total_height <= available_height * 0.9:  # Use only 90% of available space for safety
-                    return test_font
-                    
-            except Exception:
-                continue
-        
-        # Fallback
+        # Both texts must fit comfortably: slightly more line spacing and only 90% of the space
         try:
-            # Use system DejaVu fonts for fallback
-            system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-            if system_dejavu_path.exists():
-                return ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), min_font_size)
-            elif self.current_font_name != 'default' and self.available_fonts[self.current_font_name]:
-                return ImageFont.truetype(self.available_fonts[self.current_font_name], min_font_size)
-            else:
-                return ImageFont.truetype(str(Path('data/fonts/DejaVuSans.ttf')), min_font_size)
-        except:
+            font_path = self._verse_font_path()
+            font_size = self._fit_font_size([primary_text, secondary_text], column_width, available_height * 0.9,
+                                            max_font_size, min_font_size, 18, font_path)
+            return font_registry.truetype(font_path, font_size)
+        except Exception:
             return ImageFont.load_default()
 
+    def _fit_font_size(self, texts: List[str], width: int, available_height: float, max_size: int,
+                       min_size: int, line_spacing: int, font_path: str) -> int:
+        """Find the largest size on the max_size, max_size - 2, ... scale at which every text fits.
+        
+        The search starts below the sizes that a width estimate already rules out,
+        then gallops and bisects (a larger font never needs fewer lines). Results
+        are memoized per text, box and face, so showing a verse again needs no search.
+        Returns min_size when nothing fits.
+        """
+        key = (tuple(hashlib.sha1(text.encode('utf-8')).hexdigest() for text in texts),
+               width, available_height, font_path, max_size, min_size, line_spacing)
+        with self._layout_lock:
+            size = self._fitted_sizes.get(key)
+            if size is not None:
+                self._fitted_sizes.move_to_end(key)
+                return size
+        
+        sizes = list(range(max_size, min_size - 1, -2))
+        
+        def fits(font_size: int) -> bool:
+            font = font_registry.truetype(font_path, font_size)
+            lines = max(len(self._wrap_text(text, width, font)) for text in texts)
+            return lines * (font_size + line_spacing) <= available_height
+        
+        # Text width scales with the font size, so one measurement estimates the
+        # fewest lines each size can need; sizes that cannot fit even then are skipped
+        reference_font = font_registry.truetype(font_path, max_size)
+        text_widths = [reference_font.getlength(' '.join(text.split())) * FIT_ESTIMATE_SLACK for text in texts]
+        low = 0
+        while low < len(sizes) and max(math.ceil(text_width * sizes[low] / max_size / width) for text_width in text_widths) \
+                * (sizes[low] + line_spacing) > available_height:
+            low += 1
+        
+        # Gallop down from the estimate (the answer is usually at or just below it),
+        # then binary search the bracket for the first (largest) fitting size;
+        # len(sizes) means none fits
+        high = len(sizes)
+        step = 1
+        while low < high:
+            probe = min(low + step - 1, high - 1)
+            if fits(sizes[probe]):
+                high = probe
+                break
+            low = probe + 1
+            step *= 2
+        while low < high:
+            middle = (low + high) // 2
+            if fits(sizes[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        size = sizes[low] if low < len(sizes) else min_size
+        
+        with self._layout_lock:
+            self._fitted_sizes[key] = size
+            while len(self._fitted_sizes) > MAX_FITTED_SIZES:
+                self._fitted_sizes.popitem(last=False)
+        return size
+
     def _wrap_text(self, text: str, max_width: int, font: Optional[ImageFont.ImageFont]) -> list:
         """Wrap text to fit within specified width."""
-        if not font:
-            # Simple character-based wrapping if no font available
-            chars_per_line = max_width // 10  # Rough estimate
-            return textwrap.wrap(text, width=chars_per_line)
-        
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-            
-            if line_width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Word is too long, break it
-                    lines.append(word)
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
+        return text_layout.wrap(text, font, max_width)
     
     def _add_decorative_elements(self, draw: ImageDraw.Draw, y_position: int):
         """Add decorative elements to the image."""
@@ -902,9 +911,9 @@ class ImageGenerator:
         try:
             if self.current_font_name != 'default' and self.current_font_name in self.available_fonts and self.available_fonts[self.current_font_name]:
                 font_path = self.available_fonts[self.current_font_name]
-                self.title_font = ImageFont.truetype(font_path, self.title_size)
-                self.verse_font = ImageFont.truetype(font_path, self.verse_size)
-                self.reference_font = ImageFont.truetype(font_path, self.reference_size)
+                self.title_font = font_registry.truetype(font_path, self.title_size)
+                self.verse_font = font_registry.truetype(font_path, self.verse_size)
+                self.reference_font = font_registry.truetype(font_path, self.reference_size)
                 self.logger.info(f"Loaded font: {self.current_font_name}")
             else:
                 # Use default font loading
@@ -1121,21 +1130,16 @@ class ImageGenerator:
             self._draw_date_event_single_page(draw, verse_data, margin, content_width)
             return
         
-        # Multiple pages - use pagination with 10-second cycling
-        from datetime import datetime
-        now = datetime.now()
-        page_rotation_seconds = 10  # Same as devotional mode
-        seconds_since_midnight = now.hour * 3600 + now.minute * 60 + now.second
-        page_slot = (seconds_since_midnight // page_rotation_seconds) % len(pages)
+        # Multiple pages - use pagination with 10-second cycling (same as devotional mode)
+        page_slot = self._current_page_slot(len(pages), 10)
         current_page = page_slot + 1
         
         # Update verse_data with page information
         verse_data['current_page'] = current_page
         verse_data['total_pages'] = len(pages)
         
-        # Draw the current page
-        page_content = pages[page_slot]
-        self._draw_date_event_page(draw, verse_data, page_content, margin, content_width)
+        # Draw the current page from the precomputed lines
+        self._draw_date_event_page(draw, verse_data, pages[page_slot], margin, content_width)
         
         # Add verse reference display
         self._add_verse_reference_display(draw, verse_data)
@@ -1151,23 +1155,16 @@ class ImageGenerator:
             return
         
         # Calculate current page based on time rotation
-        # Use a different rotation interval for pages (e.g., every 10 seconds)
-        from datetime import datetime
-        now = datetime.now()
-        page_rotation_seconds = 10  # Change page every 10 seconds
-        seconds_since_midnight = now.hour * 3600 + now.minute * 60 + now.second
-        page_slot = (seconds_since_midnight // page_rotation_seconds) % len(pages)
+        # Use a different rotation interval for pages (every 10 seconds)
+        page_slot = self._current_page_slot(len(pages), 10)
         current_page = page_slot + 1  # Pages are 1-indexed
         
         # Update verse_data with page information
         verse_data['current_page'] = current_page
         verse_data['total_pages'] = len(pages)
         
-        # Get current page content
-        page_content = pages[page_slot]
-        
-        # Draw the current page
-        self._draw_devotional_page(draw, verse_data, page_content, margin, content_width)
+        # Draw the current page from the precomputed lines
+        self._draw_devotional_page(draw, verse_data, pages[page_slot], margin, content_width)
         
         # Add verse reference display (shows current time for devotionals)
         self._add_verse_reference_display(draw, verse_data)
@@ -1226,43 +1223,9 @@ class ImageGenerator:
                 draw.text((line_x, y_position), line, fill=0, font=optimal_font)
                 y_position += line_bbox[3] - line_bbox[1] + 20
 
-    def _paginate_devotional_text(self, text: str, content_width: int, margin: int) -> List[str]:
+    def _paginate_devotional_text(self, text: str, content_width: int, margin: int) -> List[List[Tuple[str, int, int]]]:
         """Split devotional text into pages that fit the display."""
-        # Use a reasonable font size for pagination calculation
-        test_font = self._get_font(self.verse_size)
-        
-        # Calculate available space for content
-        ref_bbox = (0, 0, 0, 100)  # Approximate reference height
-        ref_height = ref_bbox[3] - ref_bbox[1]
-        has_decorative_border = self.current_background_index > 0
-        base_margin = self.reference_margin if hasattr(self, 'reference_margin') else 20
-        if has_decorative_border:
-            base_margin = max(base_margin, 80)
-        
-        ref_y = base_margin + self.reference_y_offset
-        min_gap = 40
-        reference_bottom = ref_y + ref_height + min_gap
-        title_height = 60  # Approximate title height
-        available_height = self.height - reference_bottom - title_height - margin - 60  # Reserve space for page info
-        
-        # Calculate max lines per page
-        line_height = test_font.size + 20 if test_font else 30
-        max_lines_per_page = max(3, available_height // line_height)  # Minimum 3 lines per page
-        
-        # Wrap text and split into pages
-        wrapped_lines = self._wrap_text(text, content_width, test_font)
-        
-        # If text fits on one page, return single page
-        if len(wrapped_lines) <= max_lines_per_page:
-            return [text]
-        
-        # Split into pages - use newlines to preserve line breaks
-        pages = []
-        for i in range(0, len(wrapped_lines), max_lines_per_page):
-            page_lines = wrapped_lines[i:i + max_lines_per_page]
-            pages.append('\n'.join(page_lines))
-        
-        return pages
+        return self._page_layout('devotional', text, content_width, margin)
 
     def _build_date_content(self, verse_data: Dict) -> str:
         """Build full content string for date events."""
@@ -1321,15 +1284,31 @@ class ImageGenerator:
         
         return '\n\n'.join(content_parts)
 
-    def _paginate_date_content(self, content: str, content_width: int, margin: int) -> List[str]:
+    def _paginate_date_content(self, content: str, content_width: int, margin: int) -> List[List[Tuple[str, int, int]]]:
         """Split date content into pages that fit the display."""
-        # Use similar logic to devotional pagination
-        test_font = self._get_font(self.verse_size)
+        return self._page_layout('date', content, content_width, margin)
+
+    def _page_layout(self, kind: str, text: str, content_width: int, margin: int) -> List[List[Tuple[str, int, int]]]:
+        """Get the cached pages of a summary, devotional or date text.
         
-        # Calculate available space (similar to devotional)
-        ref_bbox = (0, 0, 0, 100)
-        ref_height = ref_bbox[3] - ref_bbox[1]
+        Each page is a list of (line, x, height) tuples ready to draw; a text
+        that fits on one page gives a single page. Layouts are keyed by text
+        hash, font size, width and everything that changes the usable height.
+        """
         has_decorative_border = self.current_background_index > 0
+        key = (kind, hashlib.sha1(text.encode('utf-8')).hexdigest(), self.verse_size, content_width, margin,
+               self.width, self.height, has_decorative_border, self.reference_margin, self.reference_y_offset)
+        with self._layout_lock:
+            pages = self._page_layouts.get(key)
+            if pages is not None:
+                self._page_layouts.move_to_end(key)
+                return pages
+        
+        # Use a reasonable font size for pagination calculation
+        page_font = self._page_font()
+        
+        # Calculate available space for content
+        ref_height = 100  # Approximate reference height
         base_margin = self.reference_margin if hasattr(self, 'reference_margin') else 20
         if has_decorative_border:
             base_margin = max(base_margin, 80)
@@ -1337,27 +1316,57 @@ class ImageGenerator:
         ref_y = base_margin + self.reference_y_offset
         min_gap = 40
         reference_bottom = ref_y + ref_height + min_gap
-        available_height = self.height - reference_bottom - margin - 60
-        
-        # Calculate max lines per page
-        line_height = test_font.size + 20 if test_font else 30
-        max_lines_per_page = max(3, available_height // line_height)
-        
-        # Wrap text and split into pages
-        wrapped_lines = self._wrap_text(content, content_width, test_font)
-        
-        # If text fits on one page, return single page
-        if len(wrapped_lines) <= max_lines_per_page:
-            return [content]
+        title_height = 0 if kind == 'date' else 60  # Approximate title height
+        available_height = self.height - reference_bottom - title_height - margin - 60  # Reserve space for page info
         
-        # Split into pages - use newlines to preserve line breaks
-        pages = []
-        for i in range(0, len(wrapped_lines), max_lines_per_page):
-            page_lines = wrapped_lines[i:i + max_lines_per_page]
-            pages.append('\n'.join(page_lines))
+        # Calculate max lines per page (book summaries use wider line spacing)
+        line_spacing = 25 if kind == 'summary' else 20
+        line_height = page_font.size + line_spacing if page_font else 30
+        max_lines_per_page = max(3, available_height // line_height)  # Minimum 3 lines per page
         
+        # Wrap text once and measure every line for centering
+        wrapped_lines = []
+        for line in self._wrap_text(text, content_width, page_font):
+            if page_font:
+                line_bbox = page_font.getbbox(line)
+                wrapped_lines.append((line, (self.width - (line_bbox[2] - line_bbox[0])) // 2, line_bbox[3] - line_bbox[1]))
+            else:
+                wrapped_lines.append((line, margin, 0))
+        
+        pages = [wrapped_lines[i:i + max_lines_per_page]
+                 for i in range(0, len(wrapped_lines), max_lines_per_page)] or [[]]
+        with self._layout_lock:
+            self._page_layouts[key] = pages
+            while len(self._page_layouts) > MAX_PAGE_LAYOUTS:
+                self._page_layouts.popitem(last=False)
+        if len(pages) > 1:
+            self.logger.debug(f"Paginated {kind} text into {len(pages)} pages")
         return pages
 
+    def warm_page_layouts(self, verse_data: Dict):
+        """Precompute the pages of a newly selected summary, devotional or date event."""
+        margin = 80
+        content_width = self.width - (2 * margin)
+        try:
+            if verse_data.get('is_devotional'):
+                self._page_layout('devotional', verse_data['text'], content_width, margin)
+            elif verse_data.get('is_date_event'):
+                self._page_layout('date', self._build_date_content(verse_data), content_width, margin)
+            elif verse_data.get('is_summary'):
+                self._page_layout('summary', verse_data['text'], content_width, margin)
+        except Exception as e:
+            self.logger.debug(f"Could not warm page layout: {e}")
+
+    def _page_font(self):
+        """Font that paginated pages are measured and drawn with."""
+        return self._get_font(self.verse_size)
+
+    def _current_page_slot(self, page_count: int, page_rotation_seconds: int) -> int:
+        """Index of the page to show now; pages rotate on a fixed wall-clock schedule."""
+        now = datetime.now()
+        seconds_since_midnight = now.hour * 3600 + now.minute * 60 + now.second
+        return (seconds_since_midnight // page_rotation_seconds) % page_count
+
     def _draw_date_event_single_page(self, draw: ImageDraw.Draw, verse_data: Dict, margin: int, content_width: int):
         """Draw date event on single page with proper spacing."""
         # Calculate reference position and reserve space
@@ -1579,7 +1588,7 @@ class ImageGenerator:
         
         return total_height
 
-    def _draw_date_event_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_content: str, margin: int, content_width: int):
+    def _draw_date_event_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_lines: List[Tuple[str, int, int]], margin: int, content_width: int):
         """Draw a single page of date event content."""
         # Calculate positioning similar to devotional
         ref_text = verse_data.get('reference', 'Unknown')
@@ -1606,23 +1615,17 @@ class ImageGenerator:
             content_start_y += title_bbox[3] - title_bbox[1] + 30
         
         # Use consistent font size for all pages
-        page_font = self._get_font(self.verse_size)
-        
-        # Split page content by newlines (preserve pagination line breaks)
-        page_lines = page_content.split('\n')
+        page_font = self._page_font()
         
         # Draw page text
         y_position = content_start_y
-        for line in page_lines:
+        for line, line_x, _line_height in page_lines:
             if line.strip():  # Only draw non-empty lines
                 if page_font:
-                    line_bbox = draw.textbbox((0, 0), line, font=page_font)
-                    line_width = line_bbox[2] - line_bbox[0]
-                    line_x = (self.width - line_width) // 2
                     draw.text((line_x, y_position), line, font=page_font, fill='black')
                     y_position += page_font.size + 20
 
-    def _draw_devotional_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_content: str, margin: int, content_width: int):
+    def _draw_devotional_page(self, draw: ImageDraw.Draw, verse_data: Dict, page_lines: List[Tuple[str, int, int]], margin: int, content_width: int):
         """Draw a single page of devotional content."""
         # Calculate positioning
         ref_text = verse_data.get('reference', 'Unknown')
@@ -1650,19 +1653,13 @@ class ImageGenerator:
             content_start_y += title_height + 30
         
         # Use consistent font size for all pages
-        page_font = self._get_font(self.verse_size)
-        
-        # Split page content by newlines (preserve pagination line breaks)
-        page_lines = page_content.split('\n')
+        page_font = self._page_font()
         
         # Draw page text
         y_position = content_start_y
-        for line in page_lines:
+        for line, line_x, _line_height in page_lines:
             if line.strip():  # Only draw non-empty lines
                 if page_font:
-                    line_bbox = draw.textbbox((0, 0), line, font=page_font)
-                    line_width = line_bbox[2] - line_bbox[0]
-                    line_x = (self.width - line_width) // 2
                     draw.text((line_x, y_position), line, font=page_font, fill='black')
                     y_position += page_font.size + 20
         
@@ -1779,11 +1776,7 @@ class ImageGenerator:
         # Use appropriately sized font for translation labels (larger than before)
         label_font_size = min(optimal_font.size - 4, 36) if optimal_font else 28  # Larger font for better readability
         try:
-            system_dejavu_path = Path('/usr/share/fonts/truetype/dejavu')
-            if system_dejavu_path.exists():
-                label_font = ImageFont.truetype(str(system_dejavu_path / 'DejaVuSans.ttf'), label_font_size)
-            else:
-                label_font = ImageFont.truetype(str(Path('data/fonts/DejaVuSans.ttf')), label_font_size)
+            label_font = font_registry.truetype(font_registry.resolve('DejaVuSans.ttf'), label_font_size)
         except:
             label_font = optimal_font  # Fallback to verse font
         
@@ -0,0 +1,267 @@
+"""
+Health tracking for upstream verse providers.
+
+Each provider gets a circuit breaker fed with request outcomes: a rolling
+success rate and a latency EWMA decide when to stop calling it (open), and a
+single probe after an exponential backoff decides when to resume (half-open).
+A negative cache remembers references a provider reported as not found, so
+the fallback chain can skip that hop without a request.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Dict, Hashable, Optional
+
+try:
+    from src.usage_stats import usage_stats
+except ImportError:
+    from usage_stats import usage_stats
+
+
+class CircuitBreaker:
+    """Open/half-open/closed circuit breaker for one provider."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, window: int = 20, min_requests: int = 5,
+                 failure_threshold: float = 0.5, base_backoff: float = 30.0,
+                 max_backoff: float = 1800.0, latency_alpha: float = 0.3, probe_timeout: float = 60.0):
+        self.name = name
+        self.min_requests = min_requests
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.latency_alpha = latency_alpha
+        self.probe_timeout = probe_timeout
+
+        self.state = self.CLOSED
+        self.backoff = base_backoff
+        self.latency_ewma: Optional[float] = None
+        self.total_requests = 0
+        self.total_failures = 0
+        self.last_error: Optional[str] = None
+
+        self._outcomes = deque(maxlen=window)
+        self._retry_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Success rate over the rolling window, or None before any request."""
+        if not self._outcomes:
+            return None
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() < self._retry_at:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: let a single probe through (another one if it never reported back)
+            now = time.monotonic()
+            if self._probe_in_flight and now - self._probe_started < self.probe_timeout:
+                return False
+            self._probe_in_flight = True
+            self._probe_started = now
+            return True
+
+    def available(self) -> bool:
+        """Whether allow() would let a request through now, without taking the probe."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                return now >= self._retry_at
+            if self.state == self.HALF_OPEN:
+                return not self._probe_in_flight or now - self._probe_started >= self.probe_timeout
+            return True
+
+    def record_success(self, latency: float = None):
+        """Record a request the provider answered."""
+        with self._lock:
+            self._record(True, latency)
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self.backoff = self.base_backoff
+                self._probe_in_flight = False
+                self._outcomes.clear()
+
+    def record_failure(self, latency: float = None, error: str = None):
+        """Record a request that failed (transport error, blocked, rate limited, server error)."""
+        with self._lock:
+            self._record(False, latency)
+            self.total_failures += 1
+            self.last_error = error
+
+            if self.state == self.HALF_OPEN:
+                # Probe failed: back off further
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+                self._open()
+            elif (self.state == self.CLOSED and len(self._outcomes) >= self.min_requests
+                  and self.success_rate < 1 - self.failure_threshold):
+                self.backoff = self.base_backoff
+                self._open()
+
+    def _record(self, success: bool, latency: Optional[float]):
+        self.total_requests += 1
+        self._outcomes.append(success)
+        if latency is not None:
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += self.latency_alpha * (latency - self.latency_ewma)
+
+    def _open(self):
+        self.state = self.OPEN
+        self._probe_in_flight = False
+        self._retry_at = time.monotonic() + self.backoff
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current breaker state for status reporting."""
+        with self._lock:
+            success_rate = self.success_rate
+            return {
+                'state': self.state,
+                'success_rate': round(success_rate * 100, 1) if success_rate is not None else None,
+                'latency_ms': round(self.latency_ewma * 1000) if self.latency_ewma is not None else None,
+                'requests': self.total_requests,
+                'failures': self.total_failures,
+                'retry_in_seconds': max(0, round(self._retry_at - time.monotonic())) if self.state == self.OPEN else 0,
+                'backoff_seconds': self.backoff,
+                'last_error': self.last_error,
+            }
+
+
+class NegativeCache:
+    """Bounded cache of keys known to miss, each expiring after a TTL."""
+
+    def __init__(self, ttl: float = 6 * 3600, max_entries: int = 2000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: Hashable):
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class ProviderHealth:
+    """Registry of provider circuit breakers plus the negative miss cache."""
+
+    def __init__(self):
+        self.negative_cache = NegativeCache(
+            ttl=float(os.getenv('PROVIDER_MISS_TTL', str(6 * 3600)))
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._call_state = threading.local()
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        with self._lock:
+            if provider not in self._breakers:
+                self._breakers[provider] = CircuitBreaker(provider)
+            return self._breakers[provider]
+
+    def allow(self, provider: str) -> bool:
+        """Check whether the provider's circuit lets a request through."""
+        return self.breaker(provider).allow()
+
+    def record_success(self, provider: str, latency: float = None):
+        self.breaker(provider).record_success(latency)
+        usage_stats.record_provider(provider, True, latency)
+
+    def record_failure(self, provider: str, latency: float = None, error: str = None):
+        self._call_state.failed = True
+        self.breaker(provider).record_failure(latency, error)
+        usage_stats.record_provider(provider, False, latency)
+
+    def record_answer(self, provider: str, latency: float = None):
+        """Record a response that arrived without a transport or status error.
+
+        Inside begin_call() it is held until settle_call() knows whether the
+        body was usable; otherwise it counts as a success straight away.
+        """
+        if getattr(self._call_state, 'classifying', False):
+            self._call_state.answers.append((provider, latency))
+        else:
+            self.record_success(provider, latency)
+
+    def record_not_found(self):
+        """Note that the provider said the reference does not exist (404 or empty payload)."""
+        self._call_state.not_found = True
+
+    def begin_call(self):
+        """Start tracking outcomes recorded by this thread (for miss classification)."""
+        self._call_state.failed = False
+        self._call_state.not_found = False
+        self._call_state.classifying = True
+        self._call_state.answers = []
+
+    def settle_call(self, usable: bool, error: str = None):
+        """Record the answers held since begin_call() once, as successes or as failures."""
+        answers = getattr(self._call_state, 'answers', [])
+        self._call_state.classifying = False
+        self._call_state.answers = []
+        for provider, latency in answers:
+            if usable:
+                self.record_success(provider, latency)
+            else:
+                self.record_failure(provider, latency, error)
+
+    def call_failed(self) -> bool:
+        """Whether a failure was recorded by this thread since begin_call()."""
+        return getattr(self._call_state, 'failed', False)
+
+    def call_not_found(self) -> bool:
+        """Whether a provider reported the reference missing on this thread since begin_call()."""
+        return getattr(self._call_state, 'not_found', False)
+
+    def is_known_miss(self, key: Hashable) -> bool:
+        return key in self.negative_cache
+
+    def record_miss(self, key: Hashable):
+        self.negative_cache.add(key)
+
+    def status(self) -> Dict[str, Any]:
+        """Breaker state of every provider seen so far."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            'providers': {name: breaker.snapshot() for name, breaker in sorted(breakers.items())},
+            'negative_cache_entries': len(self.negative_cache),
+        }
+
+
+# Global provider health instance
+provider_health = ProviderHealth()
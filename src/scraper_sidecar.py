@@ -0,0 +1,147 @@
+"""
+Client for the long-running bible-scraper Node.js sidecar.
+
+The sidecar (scripts/bible_scraper_sidecar.js) is started once and kept
+alive; verse lookups are JSON lines written to its stdin and matched to the
+JSON-line responses on its stdout by request id, so several lookups can be
+in flight at once. node_modules is installed by the setup script, never at
+request time.
+"""
+
+import itertools
+import json
+import logging
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+SIDECAR_SCRIPT = PROJECT_DIR / 'scripts' / 'bible_scraper_sidecar.js'
+
+
+class SidecarError(Exception):
+    """The sidecar could not be started or did not answer."""
+    pass
+
+
+class ScraperSidecar:
+    """Manages the bible-scraper sidecar process and multiplexes requests over its pipes."""
+
+    def __init__(self, script_path: Path = SIDECAR_SCRIPT, startup_timeout: float = 15.0,
+                 restart_backoff: float = 60.0):
+        self.logger = logging.getLogger(__name__)
+        self.script_path = Path(script_path)
+        self.startup_timeout = startup_timeout
+        self.restart_backoff = restart_backoff
+
+        self._process: Optional[subprocess.Popen] = None
+        self._ready = threading.Event()
+        self._waiting: Dict[int, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_failure = 0.0
+
+    def available(self) -> bool:
+        """Check whether Node.js and the installed bible-scraper module are present."""
+        return (shutil.which('node') is not None and self.script_path.exists()
+                and (PROJECT_DIR / 'node_modules' / 'bible-scraper').exists())
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._process and self._process.poll() is None:
+                return
+            if time.monotonic() - self._last_failure < self.restart_backoff:
+                raise SidecarError("bible-scraper sidecar unavailable (restart backoff)")
+            if not self.available():
+                self._last_failure = time.monotonic()
+                raise SidecarError("Node.js or bible-scraper not installed (run npm install)")
+
+            self._ready.clear()
+            try:
+                process = subprocess.Popen(
+                    ['node', str(self.script_path)],
+                    cwd=str(PROJECT_DIR),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            except OSError as e:
+                self._last_failure = time.monotonic()
+                raise SidecarError(f"Failed to start bible-scraper sidecar: {e}")
+
+            self._process = process
+            threading.Thread(target=self._read_responses, args=(process,), daemon=True).start()
+
+        if not self._ready.wait(self.startup_timeout):
+            self._last_failure = time.monotonic()
+            self.close()
+            raise SidecarError("bible-scraper sidecar did not start in time")
+        self.logger.info(f"bible-scraper sidecar started (pid {process.pid})")
+
+    def _read_responses(self, process: subprocess.Popen):
+        """Route response lines to the waiting requests until the process exits."""
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get('ready'):
+                self._ready.set()
+                continue
+            with self._lock:
+                slot = self._waiting.pop(message.get('id'), None)
+            if slot:
+                slot['response'] = message
+                slot['event'].set()
+
+        # Process exited: fail everything still waiting on it
+        with self._lock:
+            if self._process is process:
+                self._last_failure = time.monotonic()
+            waiting, self._waiting = self._waiting, {}
+        for slot in waiting.values():
+            slot['response'] = {'success': False, 'error': 'bible-scraper sidecar exited'}
+            slot['event'].set()
+        self.logger.warning("bible-scraper sidecar exited")
+
+    def verse(self, translation_code: str, reference: str, timeout: float = 10.0) -> Dict:
+        """Look up a verse; returns the sidecar's response ({'success', 'data'|'error'})."""
+        self._ensure_started()
+
+        request_id = next(self._ids)
+        slot = {'event': threading.Event(), 'response': None}
+        with self._lock:
+            self._waiting[request_id] = slot
+
+        request = {'id': request_id, 'translation': translation_code, 'reference': reference}
+        try:
+            with self._write_lock:
+                self._process.stdin.write(json.dumps(request) + '\n')
+                self._process.stdin.flush()
+        except (OSError, ValueError, AttributeError) as e:
+            with self._lock:
+                self._waiting.pop(request_id, None)
+            raise SidecarError(f"Failed to write to bible-scraper sidecar: {e}")
+
+        if not slot['event'].wait(timeout):
+            with self._lock:
+                self._waiting.pop(request_id, None)
+            raise SidecarError(f"bible-scraper sidecar timed out for {reference}")
+        return slot['response']
+
+    def close(self):
+        """Stop the sidecar process."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
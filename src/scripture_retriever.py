@@ -0,0 +1,251 @@
+"""
+Local retrieval of scripture context for ChatGPT questions.
+
+Before a question goes to OpenAI, the most relevant verses, book summaries
+and calendar events are picked locally with BM25 and passed to the model as
+a short, cited context block. The model then quotes the clock's own
+translations instead of recalling scripture, which keeps prompts small and
+makes citations repeatable.
+
+Verses are ranked through the full-text index of the cached translation
+(see verse_index), so no extra index is held in memory for them. Book
+summaries and calendar entries form a small in-memory corpus built on first
+use.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from src.verse_index import STOPWORDS, tokenize
+except ImportError:
+    from verse_index import STOPWORDS, tokenize
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Typical verse length in terms, used as the average document length for verses
+AVERAGE_VERSE_TERMS = 25
+# Verses re-scored with exact term frequencies after the posting-list pass
+MAX_VERSE_CANDIDATES = 200
+# Terms in more than this share of the cached verses carry no signal
+MAX_TERM_SHARE = 0.2
+# Passages scoring below this share of the best match are left out
+MIN_RELATIVE_SCORE = 0.35
+# Passage text is cut to keep the context block small
+MAX_PASSAGE_CHARS = 240
+
+# Words that phrase a question rather than describe its subject
+QUESTION_WORDS = frozenset(
+    'what whats does did do is was who whom why how where when tell explain mean means meaning bible '
+    'verse verses scripture scriptures passage book books say says about can could would should please me know'.split()
+)
+
+
+def query_terms(question: str) -> List[str]:
+    """Terms of a question that describe what it is about."""
+    return [term for term in tokenize(question)
+            if term not in STOPWORDS and term not in QUESTION_WORDS and len(term) > 1]
+
+
+def _shorten(text: str, limit: int = MAX_PASSAGE_CHARS) -> str:
+    text = ' '.join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(' ', 1)[0]
+    return cut.rstrip(',;:') + '...'
+
+
+class ScriptureRetriever:
+    """Picks the verses, book summaries and events most relevant to a question."""
+
+    def __init__(self, verse_manager=None, top_k: Optional[int] = None):
+        self.logger = logging.getLogger(__name__)
+        self.verse_manager = verse_manager
+        self.top_k = top_k if top_k is not None else int(os.getenv('CHATGPT_CONTEXT_PASSAGES', '4'))
+        self._documents: Optional[List[Dict]] = None
+        self._document_frequency: Dict[str, int] = {}
+        self._average_length = 1.0
+        self._lock = threading.Lock()
+
+    # --- Summary and calendar corpus ---
+
+    def _load_documents(self) -> List[Dict]:
+        """Build the BM25 corpus of book summaries and calendar entries once."""
+        with self._lock:
+            if self._documents is not None:
+                return self._documents
+
+            documents = []
+            short_summaries = self._read_json(Path('data/book_summaries.json'))
+            long_summaries = getattr(self.verse_manager, 'book_summaries', None) or \
+                self._read_json(Path('data/bible_book_summaries_kjv_all_66.json'))
+            for book in sorted(set(short_summaries) | set(long_summaries)):
+                short = short_summaries.get(book, {})
+                short = short.get('summary', '') if isinstance(short, dict) else str(short)
+                full = long_summaries.get(book, '')
+                full = full.get('summary', '') if isinstance(full, dict) else str(full)
+                # The book name counts twice so "what is Romans about" finds the summary
+                documents.append(self._document('summary', book, short or full, f"{book} {book} {full or short}"))
+
+            calendar = getattr(self.verse_manager, 'biblical_events_calendar', None) or \
+                self._read_json(Path('data/biblical_events_calendar.json')).get('biblical_events_calendar', {})
+            seen_references = set()
+            for group in ('events', 'weekly_themes', 'monthly_themes', 'seasonal_themes'):
+                for entries in (calendar.get(group) or {}).values():
+                    for entry in entries if isinstance(entries, list) else [entries]:
+                        if not isinstance(entry, dict):
+                            continue
+                        title = entry.get('title', '')
+                        description = entry.get('description', '')
+                        if title:
+                            documents.append(self._document('event', title, description,
+                                                            f"{title} {description}"))
+                        for verse in entry.get('verses', []):
+                            reference = verse.get('reference')
+                            if reference and verse.get('text') and reference not in seen_references:
+                                seen_references.add(reference)
+                                documents.append(self._document('verse', reference, verse['text'],
+                                                                f"{verse['text']} {title}"))
+
+            frequency: Dict[str, int] = {}
+            for document in documents:
+                for term in document['counts']:
+                    frequency[term] = frequency.get(term, 0) + 1
+            self._document_frequency = frequency
+            self._average_length = (sum(d['length'] for d in documents) / len(documents)) if documents else 1.0
+            self._documents = documents
+            self.logger.info(f"Scripture retrieval corpus ready: {len(documents)} summaries, events and verses")
+            return documents
+
+    @staticmethod
+    def _document(kind: str, reference: str, text: str, indexed_text: str) -> Dict:
+        terms = tokenize(indexed_text)
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        return {'kind': kind, 'reference': reference, 'text': text, 'counts': counts, 'length': len(terms)}
+
+    def _read_json(self, path: Path) -> Dict:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Retrieval source {path} unavailable: {e}")
+            return {}
+
+    @staticmethod
+    def _bm25(tf: int, length: int, average_length: float, idf: float) -> float:
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+        return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    def _rank_documents(self, terms: List[str]) -> List[Tuple[float, Dict]]:
+        documents = self._load_documents()
+        total = len(documents)
+        scored = []
+        for document in documents:
+            score = 0.0
+            for term in terms:
+                tf = document['counts'].get(term)
+                if tf:
+                    df = self._document_frequency[term]
+                    idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                    score += self._bm25(tf, document['length'], self._average_length, idf)
+            if score > 0:
+                scored.append((score, document))
+        return scored
+
+    # --- Cached verses ---
+
+    def _rank_verses(self, terms: List[str]) -> List[Tuple[float, Dict]]:
+        """BM25 over the cached translation, using the verse index's posting lists."""
+        source = None
+        if self.verse_manager is not None and hasattr(self.verse_manager, 'search_index'):
+            try:
+                source = self.verse_manager.search_index() or self.verse_manager.search_index('kjv')
+            except Exception as e:
+                self.logger.debug(f"Verse index unavailable for retrieval: {e}")
+        if not source:
+            return []
+
+        translation, index, store = source
+        total = max(store.cached_verses, 1)
+        idfs = {}
+        weights: Dict[int, float] = {}
+        for term in set(terms):
+            ids = index.postings(term)
+            if not ids or len(ids) > total * MAX_TERM_SHARE:
+                continue
+            idfs[term] = math.log(1 + (total - len(ids) + 0.5) / (len(ids) + 0.5))
+            for verse_id in ids:
+                weights[verse_id] = weights.get(verse_id, 0.0) + idfs[term]
+
+        # Cheap pass on matched terms, then exact BM25 on the best candidates
+        candidates = heapq.nlargest(MAX_VERSE_CANDIDATES, weights.items(), key=lambda item: (item[1], -item[0]))
+        scored = []
+        for verse_id, _weight in candidates:
+            text = store.get_by_id(verse_id)
+            if not text:
+                continue
+            tokens = tokenize(text)
+            score = sum(self._bm25(tokens.count(term), len(tokens), AVERAGE_VERSE_TERMS, idf)
+                        for term, idf in idfs.items() if term in tokens)
+            book, chapter, verse = index.layout.reference(verse_id)
+            scored.append((score, {'kind': 'verse', 'reference': f"{book} {chapter}:{verse}",
+                                   'text': text, 'translation': translation.upper()}))
+        return scored
+
+    # --- Retrieval ---
+
+    def retrieve(self, question: str, k: Optional[int] = None) -> List[Dict]:
+        """Top passages for a question as dicts with kind, reference, text and score."""
+        k = self.top_k if k is None else k
+        terms = query_terms(question)
+        if not terms or k <= 0:
+            return []
+
+        scored = self._rank_documents(terms) + self._rank_verses(terms)
+        # Highest score first; ties break on reference so citations are repeatable
+        scored.sort(key=lambda item: (-item[0], item[1]['reference']))
+
+        passages, seen = [], set()
+        for score, document in scored:
+            if score < scored[0][0] * MIN_RELATIVE_SCORE:
+                break
+            if document['reference'] in seen:
+                continue
+            seen.add(document['reference'])
+            passage = {key: value for key, value in document.items() if key not in ('counts', 'length')}
+            passage['score'] = round(score, 3)
+            passages.append(passage)
+            if len(passages) >= k:
+                break
+        return passages
+
+    def context_block(self, question: str, k: Optional[int] = None) -> str:
+        """Prompt section listing the retrieved passages, or '' when nothing matches."""
+        try:
+            passages = self.retrieve(question, k)
+        except Exception as e:
+            self.logger.warning(f"Scripture retrieval failed: {e}")
+            return ''
+        if not passages:
+            return ''
+
+        lines = []
+        for passage in passages:
+            if passage['kind'] == 'summary':
+                lines.append(f"- Book of {passage['reference']}: {_shorten(passage['text'])}")
+            elif passage['kind'] == 'event':
+                lines.append(f"- {passage['reference']}: {_shorten(passage['text'])}")
+            else:
+                translation = f" ({passage['translation']})" if passage.get('translation') else ''
+                lines.append(f"- {passage['reference']}{translation}: \"{_shorten(passage['text'])}\"")
+        return ("Relevant scripture (quote and cite these references when they answer the question):\n"
+                + '\n'.join(lines))
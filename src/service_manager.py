@@ -9,12 +9,14 @@ import schedule
 import threading
 import psutil
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 
 from error_handler import error_handler
 from config_validator import ConfigValidator
 from scheduler import AdvancedScheduler
 from performance_monitor import PerformanceMonitor
+from translation_backfill import TranslationBackfill
+from current_frame import CurrentFrame
 
 class ServiceManager:
     def __init__(self, verse_manager, image_generator, display_manager, voice_control=None, web_interface=None):
@@ -28,6 +30,7 @@ class ServiceManager:
         self.running = False
         self.last_update = None
         self.error_count = 0
+        self._warmed_page_text = None
         self.max_errors = 10
         
         # Health monitoring settings
@@ -38,6 +41,7 @@ class ServiceManager:
         self.config_validator = ConfigValidator()
         self.scheduler = AdvancedScheduler()
         self.performance_monitor = PerformanceMonitor()
+        self.translation_backfill = TranslationBackfill(verse_manager)
         
         # Validate configuration on startup
         if not self.config_validator.validate_all():
@@ -52,6 +56,10 @@ class ServiceManager:
         # Set up display manager callback for proper cleanup
         self.display_manager.set_restore_callback(self._restore_normal_display)
         
+        # Voice commands redraw the display from the shared current frame
+        if self.voice_control is not None:
+            self.voice_control.service_manager = self
+        
         # Schedule verse updates
         self._schedule_updates()
     
@@ -80,6 +88,25 @@ class ServiceManager:
         # Start performance monitoring
         self.performance_monitor.start_monitoring()
         
+        # Start resolving upcoming minutes ahead of the display updates
+        if hasattr(self.verse_manager, 'start_prefetching'):
+            # Summaries and devotionals are paginated as soon as they are prefetched
+            if hasattr(self.image_generator, 'warm_page_layouts'):
+                self.verse_manager.prefetch_callback = self.image_generator.warm_page_layouts
+            self.verse_manager.start_prefetching()
+        
+        # Fill translation caches in the background during quiet or idle time
+        if hasattr(self.verse_manager, 'chapter_sources'):
+            self.translation_backfill.start()
+        
+        # Load (or build) the search index off the main thread so the first query is fast
+        if hasattr(self.verse_manager, 'warm_search_index'):
+            threading.Thread(target=self.verse_manager.warm_search_index, daemon=True).start()
+        
+        # Rebuild prescaled backgrounds, borders and thumbnails for images that changed
+        if hasattr(self.image_generator, 'display_assets'):
+            threading.Thread(target=self.image_generator.display_assets.build, daemon=True).start()
+        
         # Start advanced scheduler
         self.scheduler.start()
         
@@ -100,6 +127,7 @@ class ServiceManager:
                 self.voice_control = BibleClockVoiceControl(
                     self.verse_manager, self.image_generator, self.display_manager
                 )
+                self.voice_control.service_manager = self
                 if self.voice_control.enabled:
                     # Mark voice control as initialized to enable visual feedback
                     if hasattr(self.voice_control, 'mark_initialized'):
@@ -131,6 +159,15 @@ class ServiceManager:
         # Stop all components
         self.scheduler.stop()
         self.performance_monitor.stop_monitoring()
+        self.translation_backfill.stop()
+        if hasattr(self.verse_manager, 'stop_prefetching'):
+            self.verse_manager.stop_prefetching()
+        if hasattr(self.verse_manager, 'save_translation_caches'):
+            self.verse_manager.save_translation_caches()
+        if hasattr(self.verse_manager, 'close_scraper_sidecar'):
+            self.verse_manager.close_scraper_sidecar()
+        if hasattr(self.verse_manager, 'save_statistics'):
+            self.verse_manager.save_statistics()
         
         if self.voice_control:
             self.voice_control.stop_listening()
@@ -157,15 +194,14 @@ class ServiceManager:
             if summary_pagination_update:
                 self.logger.debug("Book summary pagination - triggering 15-second update")
             with self.performance_monitor.time_operation('verse_update'):
-                # Get current verse
-                verse_data = self.verse_manager.get_current_verse()
+                # Resolve and render this tick's frame once; every other reader shares it
+                frame = self.refresh_frame(now=now)
+                verse_data = frame.verse()
+                image = frame.image
                 
                 # Store verse data for next iteration's summary mode check
                 self._last_verse_data = verse_data
                 
-                # Generate image
-                image = self.image_generator.create_verse_image(verse_data)
-                
                 # Check if background changed and force refresh only for background changes
                 background_changed = self.image_generator.background_changed_since_last_render()
                 if background_changed:
@@ -218,6 +254,11 @@ class ServiceManager:
                 preserve_border = is_date_mode and force_refresh
                 self.display_manager.display_image(image, force_refresh=force_refresh, preserve_border=preserve_border)
                 
+                # Count the verse once it is on the panel; summary page flips show the same
+                # verse, so only new minutes (and startup) are counted, and retries only once
+                if minute_boundary_update or last_verse_data is None:
+                    self.verse_manager.record_frame_displayed(frame)
+                
                 # Update tracking
                 self.last_update = datetime.now()
                 self.error_count = 0
@@ -269,13 +310,47 @@ class ServiceManager:
         except Exception as e:
             self.logger.error(f"Garbage collection failed: {e}")
     
+    def refresh_frame(self, now: Optional[datetime] = None) -> CurrentFrame:
+        """Resolve and render a new current frame and publish it.
+        
+        Called by the display tick and after changes that alter how the current
+        verse looks. Displays are counted by the tick once the panel shows the frame.
+        """
+        now = now or datetime.now()
+        verse_data = self.verse_manager.resolve_current_verse(now)
+        self._warm_page_layouts(verse_data)
+        image = self.image_generator.create_verse_image(verse_data)
+        frame = CurrentFrame.build(self.verse_manager.frame_key(now), verse_data, image)
+        self.verse_manager.publish_frame(frame)
+        return frame
+    
+    def _warm_page_layouts(self, verse_data: Dict):
+        """Paginate a summary, devotional or date event as soon as it is first selected.
+        
+        Prefetching warms upcoming minutes, but not with prefetching off, in
+        random mode or for a text picked outside the prefetch window.
+        """
+        if not verse_data or not hasattr(self.image_generator, 'warm_page_layouts'):
+            return
+        if not (verse_data.get('is_summary') or verse_data.get('is_devotional') or verse_data.get('is_date_event')):
+            return
+        text_key = (verse_data.get('reference'), verse_data.get('text'))
+        if text_key != self._warmed_page_text:
+            self._warmed_page_text = text_key
+            self.image_generator.warm_page_layouts(verse_data)
+    
+    def current_frame(self) -> CurrentFrame:
+        """Get the current frame, building one only if the minute or settings moved on."""
+        frame = self.verse_manager.get_current_frame()
+        if frame is None or frame.image is None:
+            frame = self.refresh_frame()
+        return frame
+    
     def _force_refresh(self):
         """Force a full display refresh to prevent ghosting."""
         try:
             self.logger.info("Performing scheduled full refresh")
-            verse_data = self.verse_manager.get_current_verse()
-            image = self.image_generator.create_verse_image(verse_data)
-            self.display_manager.display_image(image, force_refresh=True)
+            self.display_manager.display_image(self.current_frame().image, force_refresh=True)
         except Exception as e:
             self.logger.error(f"Force refresh failed: {e}")
     
@@ -283,9 +358,7 @@ class ServiceManager:
         """Restore normal Bible verse display (called by display manager cleanup)."""
         try:
             self.logger.info("Restoring normal display after transient message")
-            verse_data = self.verse_manager.get_current_verse()
-            image = self.image_generator.create_verse_image(verse_data)
-            self.display_manager.display_image(image, force_refresh=True)
+            self.display_manager.display_image(self.current_frame().image, force_refresh=True)
         except Exception as e:
             self.logger.error(f"Failed to restore normal display: {e}")
             # Fallback to clearing display
@@ -310,6 +383,10 @@ class ServiceManager:
             # Force garbage collection
             self._garbage_collect()
             
+            # Compile today's and tomorrow's date-mode schedules ahead of midnight
+            if hasattr(self.verse_manager, 'prepare_date_schedules'):
+                self.verse_manager.prepare_date_schedules()
+            
             # Clear old log entries if needed
             # Add any other maintenance tasks here
             
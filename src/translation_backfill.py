@@ -0,0 +1,274 @@
+"""
+Background backfill of translation caches.
+
+Crawls the chapters still missing from the translations on display (or a
+configured list) in bible_structure.json order, one whole-chapter request
+at a time, so the local verse stores eventually hold every verse and the
+display never needs the network. It only runs during quiet hours or while the CPU is idle,
+spaces requests per provider, and checkpoints its position so a restart
+picks up where it left off.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Minimum seconds between backfill requests to each provider
+PROVIDER_INTERVALS = {
+    'bible-api': 5,
+    'wldeh_api': 2,
+    'esv_api': 10,
+    'web_scraping': 20,
+}
+DEFAULT_INTERVAL = 10
+
+# Attempts at a failed chapter after the first pass before giving up on it
+MAX_RETRIES = 3
+
+# The checkpoint is written after this many chapters or seconds (and on stop), not per chapter
+CHECKPOINT_CHAPTERS = 25
+CHECKPOINT_SECONDS = 300
+
+
+class TranslationBackfill:
+    """Crawls missing chapters into the translation caches during idle time."""
+
+    def __init__(self, verse_manager, state_path: Path = Path('data/backfill_state.json')):
+        self.logger = logging.getLogger(__name__)
+        self.verse_manager = verse_manager
+        self.state_path = Path(state_path)
+
+        self.enabled = os.getenv('BACKFILL_ENABLED', 'true').lower() == 'true'
+        configured = os.getenv('BACKFILL_TRANSLATIONS', '')
+        self.translations = [t.strip().lower() for t in configured.split(',') if t.strip()]
+        self.quiet_hours = self._parse_quiet_hours(os.getenv('BACKFILL_QUIET_HOURS', '00:00-06:00'))
+        self.idle_cpu_percent = float(os.getenv('BACKFILL_IDLE_CPU', '20'))
+
+        self.chapters: List[Tuple[str, int]] = []
+        self.state: Dict[str, Dict] = {}
+        self._next_request: Dict[str, float] = {}
+        self._unsaved_results = 0
+        self._last_save = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self.active = False
+
+    # --- Lifecycle ---
+
+    def start(self):
+        """Start the backfill thread."""
+        if not self.enabled or (self._thread and self._thread.is_alive()):
+            return
+
+        self.chapters = [
+            (book, int(chapter))
+            for book, chapters in self.verse_manager.bible_structure.items()
+            for chapter in sorted(chapters, key=int)
+        ]
+        if not self.chapters:
+            self.logger.warning("Bible structure not loaded; translation backfill disabled")
+            return
+
+        self._load_state()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Translation backfill started for {', '.join(t.upper() for t in self._selected_translations())}")
+
+    def stop(self):
+        """Stop the backfill thread and save the checkpoint."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self.chapters:
+            self._save_state()
+        self.logger.info("Translation backfill stopped")
+
+    # --- Scheduling ---
+
+    @staticmethod
+    def _parse_quiet_hours(value: str) -> Optional[Tuple[int, int]]:
+        """Parse 'HH:MM-HH:MM' into minutes since midnight (start, end)."""
+        try:
+            start, end = value.split('-')
+            start_h, start_m = (int(part) for part in start.strip().split(':'))
+            end_h, end_m = (int(part) for part in end.strip().split(':'))
+            return start_h * 60 + start_m, end_h * 60 + end_m
+        except ValueError:
+            return None
+
+    def _in_quiet_hours(self, now: datetime) -> bool:
+        if not self.quiet_hours:
+            return False
+        start, end = self.quiet_hours
+        minute = now.hour * 60 + now.minute
+        if start <= end:
+            return start <= minute < end
+        return minute >= start or minute < end  # Window crosses midnight
+
+    def _may_run(self) -> bool:
+        """Run during quiet hours, or whenever the CPU is idle."""
+        if self._in_quiet_hours(datetime.now()):
+            return True
+        if psutil is None:
+            return False
+        return psutil.cpu_percent(interval=1) < self.idle_cpu_percent
+
+    def _selected_translations(self) -> List[str]:
+        """Translations to backfill: configured list, or the translations on display."""
+        if self.translations:
+            return self.translations
+        shown = [self.verse_manager.translation]
+        if getattr(self.verse_manager, 'parallel_mode', False):
+            shown.append(getattr(self.verse_manager, 'secondary_translation', None))
+        cacheable = self.verse_manager.CACHEABLE_TRANSLATIONS
+        return [t for i, t in enumerate(shown) if t in cacheable and t not in shown[:i]]
+
+    # --- Checkpoint ---
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                self.state = json.load(f)
+        except FileNotFoundError:
+            self.state = {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read backfill checkpoint, starting over: {e}")
+            self.state = {}
+
+    def _save_state(self):
+        self._unsaved_results = 0
+        self._last_save = time.monotonic()
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.logger.error(f"Failed to save backfill checkpoint: {e}")
+
+    def _translation_state(self, translation: str) -> Dict:
+        return self.state.setdefault(translation, {'next': 0, 'failed': [], 'retries': {}})
+
+    # --- Crawling ---
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.active = self._may_run()
+                if not self.active:
+                    self._stop.wait(60)
+                    continue
+
+                delay = self._backfill_next()
+                self._stop.wait(delay)
+            except Exception as e:
+                self.logger.error(f"Translation backfill error: {e}")
+                self._stop.wait(60)
+
+    def _backfill_next(self) -> float:
+        """Fetch the next missing chapter; returns seconds to wait before the next step."""
+        earliest_wait = None
+        for translation in self._selected_translations():
+            state = self._translation_state(translation)
+            index = self._next_index(translation, state)
+            if index is None:
+                continue
+
+            # Pick a provider for this translation that is healthy and off its rate limit
+            sources = [source for source in self.verse_manager.chapter_sources(translation)
+                       if self.verse_manager.source_ready(source[0])]
+            if not sources:
+                continue
+            now = time.monotonic()
+            ready = [source for source in sources if self._next_request.get(source[0], 0) <= now]
+            if not ready:
+                wait = min(self._next_request[source[0]] for source in sources) - now
+                earliest_wait = wait if earliest_wait is None else min(earliest_wait, wait)
+                continue
+
+            api_source, source_code = ready[0]
+            book, chapter = self.chapters[index]
+            self._next_request[api_source] = now + PROVIDER_INTERVALS.get(api_source, DEFAULT_INTERVAL)
+
+            verses = self.verse_manager.fetch_chapter(api_source, source_code, book, chapter)
+            if verses is None:
+                # Circuit open, rate limited or a transport error: keep the position and retry later
+                self.logger.debug(f"Backfill of {translation.upper()} {book} {chapter} from {api_source} failed; will retry")
+                return 0
+            self._record_result(translation, state, index, bool(verses))
+            if verses:
+                self.logger.info(f"Backfilled {translation.upper()} {book} {chapter} ({len(verses)} verses) from {api_source}")
+            return 0
+
+        # Nothing fetched: wait for a rate limit to expire, or idle until circuits recover
+        return max(earliest_wait, 0.5) if earliest_wait is not None else 300
+
+    def _next_index(self, translation: str, state: Dict) -> Optional[int]:
+        """Next chapter index still missing, skipping chapters that are already cached."""
+        while state['next'] < len(self.chapters):
+            book, chapter = self.chapters[state['next']]
+            if not self.verse_manager.is_chapter_cached(translation, book, chapter):
+                return state['next']
+            state['next'] += 1
+
+        # Pass finished: retry chapters that failed
+        while state['failed']:
+            index = state['failed'][0]
+            book, chapter = self.chapters[index]
+            if not self.verse_manager.is_chapter_cached(translation, book, chapter):
+                return index
+            state['failed'].pop(0)
+        return None
+
+    def _record_result(self, translation: str, state: Dict, index: int, success: bool):
+        if index == state['next']:
+            state['next'] += 1
+            if not success:
+                state['failed'].append(index)
+        else:
+            # Retry of a failed chapter: requeue it at the back until it runs out of retries
+            state['failed'].remove(index)
+            retries = state['retries'].pop(str(index), 0) + 1
+            if not success:
+                if retries < MAX_RETRIES:
+                    state['retries'][str(index)] = retries
+                    state['failed'].append(index)
+                else:
+                    book, chapter = self.chapters[index]
+                    self.logger.warning(f"Giving up on backfilling {translation.upper()} {book} {chapter}")
+
+        # Batched to spare the SD card a rewrite per chapter; stop() saves the rest
+        self._unsaved_results += 1
+        if (self._unsaved_results >= CHECKPOINT_CHAPTERS
+                or time.monotonic() - self._last_save >= CHECKPOINT_SECONDS):
+            self._save_state()
+
+    def get_status(self) -> Dict:
+        """Backfill progress for status reporting (read-only; called from the web thread)."""
+        total = len(self.chapters)
+        translations = {}
+        for translation in self._selected_translations():
+            state = self.state.get(translation, {})
+            translations[translation] = {
+                'chapters_checked': min(state.get('next', 0), total),
+                'total_chapters': total,
+                'failed_chapters': len(state.get('failed', [])),
+                'completion': round(self.verse_manager.translation_completion.get(translation, 0.0), 1)
+            }
+        return {
+            'enabled': self.enabled,
+            'active': self.active,
+            'quiet_hours': os.getenv('BACKFILL_QUIET_HOURS', '00:00-06:00'),
+            'translations': translations
+        }
@@ -0,0 +1,315 @@
+"""
+Bounded, persisted usage statistics.
+
+Every metric is a named series of counters held in fixed-size ring buffers:
+per minute for the last day, per hour for the last week and per day for the
+last year. Memory is fixed by the slot counts, old buckets are overwritten
+as time moves on, and the buffers are saved to disk so a restart keeps the
+history. Breakdown series (books, translations, modes) are only kept per
+hour and per day.
+
+Readers get rollups (today's verses, popular books, provider success rates
+and latencies...) that are computed at most once per minute.
+"""
+
+import base64
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+STATS_PATH = Path('data/usage_stats.json')
+STATS_VERSION = 1
+
+# name -> (seconds per bucket, buckets kept)
+RESOLUTIONS = {
+    'minute': (60, 24 * 60),
+    'hour': (3600, 7 * 24),
+    'day': (86400, 366),
+}
+DETAIL_RESOLUTIONS = ('hour', 'day')
+
+# Cap on distinct series so unexpected names cannot grow memory without bound
+MAX_SERIES = 256
+# Seconds between automatic saves while counters change
+SAVE_INTERVAL = 300
+
+DISPLAY_MODES = ('time', 'date', 'random', 'devotional')
+
+
+class RingBuffer:
+    """Counters for the most recent `slots` buckets of one resolution."""
+
+    __slots__ = ('slots', 'values', 'head')
+
+    def __init__(self, slots: int, values: array = None, head: Optional[int] = None):
+        self.slots = slots
+        self.values = values if values is not None else array('f', bytes(4 * slots))
+        self.head = head  # Absolute number of the newest bucket
+
+    def _advance(self, bucket: int):
+        """Move the head forward to bucket, clearing the slots it passes."""
+        if self.head is None:
+            self.head = bucket
+            return
+        if bucket <= self.head:
+            return
+        for passed in range(self.head + 1, self.head + 1 + min(bucket - self.head, self.slots)):
+            self.values[passed % self.slots] = 0.0
+        self.head = bucket
+
+    def add(self, bucket: int, amount: float):
+        self._advance(bucket)
+        if bucket > self.head - self.slots:
+            self.values[bucket % self.slots] += amount
+
+    def window(self, bucket: int, count: int) -> List[float]:
+        """Values of the count buckets ending at bucket, oldest first."""
+        self._advance(bucket)
+        oldest = self.head - self.slots
+        return [self.values[b % self.slots] if oldest < b <= self.head else 0.0
+                for b in range(bucket - count + 1, bucket + 1)]
+
+    def total(self, bucket: int, count: int) -> float:
+        return sum(self.window(bucket, count))
+
+
+class UsageStats:
+    """Time-series counters for displays, books, translations, modes and providers."""
+
+    def __init__(self, path: Path = STATS_PATH):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._series: Dict[str, Dict[str, RingBuffer]] = {}
+        self._totals: Dict[str, float] = {}
+        self._tracking_since: Optional[str] = None
+        self._lock = threading.RLock()
+        # Serializes writes of the stats file; taken before _lock, never inside it
+        self._save_lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._changes = 0
+        self._last_save = time.monotonic()
+        self._rollup: Optional[Dict] = None
+        self._rollup_minute: Optional[int] = None
+        self._series_cap_logged = False
+
+    # --- Recording ---
+
+    def record(self, name: str, amount: float = 1.0, when: Optional[float] = None, detail: bool = False):
+        """Add to a series; detail series skip the per-minute buffer."""
+        when = time.time() if when is None else when
+        with self._lock:
+            self._ensure_loaded()
+            buffers = self._series.get(name)
+            if buffers is None:
+                if len(self._series) >= MAX_SERIES:
+                    if not self._series_cap_logged:
+                        self.logger.warning(f"Usage statistics reached {MAX_SERIES} series; ignoring new ones")
+                        self._series_cap_logged = True
+                    return
+                resolutions = DETAIL_RESOLUTIONS if detail else tuple(RESOLUTIONS)
+                buffers = {res: RingBuffer(RESOLUTIONS[res][1]) for res in resolutions}
+                self._series[name] = buffers
+            for res, buffer in buffers.items():
+                buffer.add(self._bucket(res, when), amount)
+            self._totals[name] = self._totals.get(name, 0.0) + amount
+            if self._tracking_since is None:
+                self._tracking_since = datetime.fromtimestamp(when).isoformat()
+            self._dirty = True
+            self._changes += 1
+        self._maybe_save()
+
+    def record_display(self, book: Optional[str], translation: Optional[str], mode: Optional[str],
+                       when: Optional[float] = None):
+        """Count a verse that was shown on the display."""
+        self.record('verses', when=when)
+        if book:
+            self.record(f'book:{book}', when=when, detail=True)
+        if translation:
+            self.record(f'translation:{translation.lower()}', when=when, detail=True)
+        if mode:
+            self.record(f'mode:{mode}', when=when, detail=True)
+
+    def record_provider(self, provider: str, success: bool, latency: Optional[float] = None):
+        """Count an upstream provider request and its latency in seconds."""
+        self.record(f"provider_{'ok' if success else 'fail'}:{provider}")
+        if latency is not None:
+            self.record(f'provider_ms:{provider}', latency * 1000)
+            self.record(f'provider_timed:{provider}')
+
+    @staticmethod
+    def _bucket(res: str, when: float) -> int:
+        """Bucket number of a timestamp; day buckets follow local midnight."""
+        span = RESOLUTIONS[res][0]
+        if res == 'day':
+            return datetime.fromtimestamp(when).date().toordinal()
+        return int(when // span)
+
+    # --- Rollups ---
+
+    def rollup(self) -> Dict:
+        """Summary for the statistics API, recomputed at most once per minute."""
+        now = time.time()
+        minute = int(now // 60)
+        with self._lock:
+            self._ensure_loaded()
+            if self._rollup is None or self._rollup_minute != minute:
+                self._rollup = self._compute_rollup(now)
+                self._rollup_minute = minute
+            return copy.deepcopy(self._rollup)
+
+    def _window_total(self, name: str, res: str, now: float, count: int) -> float:
+        buffers = self._series.get(name)
+        if not buffers or res not in buffers:
+            return 0.0
+        return buffers[res].total(self._bucket(res, now), count)
+
+    def _names(self, prefix: str) -> List[str]:
+        return [name[len(prefix):] for name in self._series if name.startswith(prefix)]
+
+    def _compute_rollup(self, now: float) -> Dict:
+        today = self._bucket('day', now)
+
+        book_counts = {book: int(self._window_total(f'book:{book}', 'day', now, 30)) for book in self._names('book:')}
+        book_counts = {book: count for book, count in book_counts.items() if count}
+        books = sorted(book_counts, key=lambda book: (-book_counts[book], book))
+
+        verses_by_day = self._series.get('verses', {}).get('day')
+        daily = verses_by_day.window(today, 30) if verses_by_day else [0.0] * 30
+        daily_activity = {date.fromordinal(today - 29 + i).isoformat(): int(count)
+                          for i, count in enumerate(daily) if count}
+        verses_by_hour = self._series.get('verses', {}).get('hour')
+        hourly = verses_by_hour.window(self._bucket('hour', now), 24) if verses_by_hour else [0.0] * 24
+
+        mode_usage = {mode: 0 for mode in DISPLAY_MODES}
+        mode_usage.update({mode: int(self._totals.get(f'mode:{mode}', 0)) for mode in self._names('mode:')})
+
+        providers = {}
+        total_ok = total_fail = total_ms = total_timed = 0.0
+        for provider in sorted(set(self._names('provider_ok:')) | set(self._names('provider_fail:'))):
+            ok = self._window_total(f'provider_ok:{provider}', 'hour', now, 24)
+            fail = self._window_total(f'provider_fail:{provider}', 'hour', now, 24)
+            ms = self._window_total(f'provider_ms:{provider}', 'hour', now, 24)
+            timed = self._window_total(f'provider_timed:{provider}', 'hour', now, 24)
+            total_ok, total_fail, total_ms, total_timed = total_ok + ok, total_fail + fail, total_ms + ms, total_timed + timed
+            providers[provider] = {
+                'requests_24h': int(ok + fail),
+                'success_rate_24h': round(ok / (ok + fail) * 100, 1) if ok + fail else None,
+                'avg_latency_ms_24h': round(ms / timed, 1) if timed else None,
+                'requests_total': int(self._totals.get(f'provider_ok:{provider}', 0)
+                                      + self._totals.get(f'provider_fail:{provider}', 0)),
+            }
+
+        return {
+            'verses_displayed': int(self._totals.get('verses', 0)),
+            'verses_today': int(self._window_total('verses', 'day', now, 1)),
+            'verses_last_hour': int(self._window_total('verses', 'minute', now, 60)),
+            'books_accessed': books,
+            'book_counts': book_counts,
+            'translation_usage': {t: int(self._totals[f'translation:{t}']) for t in self._names('translation:')},
+            'mode_usage': mode_usage,
+            'daily_activity': daily_activity,
+            'hourly_activity': [int(count) for count in hourly],
+            'api_success_rate': round(total_ok / (total_ok + total_fail) * 100, 1) if total_ok + total_fail else None,
+            'average_response_time': round(total_ms / total_timed / 1000, 3) if total_timed else None,
+            'providers': providers,
+            'tracking_since': self._tracking_since,
+            'generated_at': datetime.fromtimestamp(now).isoformat(),
+        }
+
+    # --- Persistence ---
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._loaded = True
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read usage statistics, starting fresh: {e}")
+            return
+        if data.get('version') != STATS_VERSION:
+            return
+
+        for name, buffers in data.get('series', {}).items():
+            restored = {}
+            for res, saved in buffers.items():
+                if res not in RESOLUTIONS:
+                    continue
+                values = array('f')
+                values.frombytes(base64.b64decode(saved['values']))
+                if len(values) == RESOLUTIONS[res][1]:
+                    restored[res] = RingBuffer(len(values), values, saved.get('head'))
+            if restored:
+                self._series[name] = restored
+        self._totals = {name: float(value) for name, value in data.get('totals', {}).items()}
+        self._tracking_since = data.get('tracking_since')
+        self.logger.info(f"Loaded usage statistics: {len(self._series)} series since {self._tracking_since}")
+
+    def save(self):
+        """Atomically write all series to disk."""
+        with self._save_lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        """Write a snapshot of all series; the caller holds _save_lock."""
+        with self._lock:
+            if not self._loaded:
+                return
+            data = {
+                'version': STATS_VERSION,
+                'saved_at': datetime.now().isoformat(),
+                'tracking_since': self._tracking_since,
+                'totals': dict(self._totals),  # json.dump runs after the lock is released
+                'series': {
+                    name: {res: {'head': buffer.head,
+                                 'values': base64.b64encode(buffer.values.tobytes()).decode('ascii')}
+                           for res, buffer in buffers.items()}
+                    for name, buffers in self._series.items()
+                },
+            }
+            changes = self._changes
+
+        saved = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+            saved = True
+        except OSError as e:
+            self.logger.error(f"Failed to save usage statistics: {e}")
+
+        with self._lock:
+            # A failed write is retried after the next interval rather than on every record
+            self._last_save = time.monotonic()
+            if saved and self._changes == changes:
+                self._dirty = False
+
+    def _maybe_save(self):
+        # A save already in progress covers this change or leaves it dirty for the next one
+        if not self._save_lock.acquire(blocking=False):
+            return
+        try:
+            with self._lock:
+                due = self._dirty and time.monotonic() - self._last_save >= SAVE_INTERVAL
+            if due:
+                self._save_locked()
+        finally:
+            self._save_lock.release()
+
+# Global usage statistics instance
+usage_stats = UsageStats()
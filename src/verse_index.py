@@ -0,0 +1,280 @@
+"""
+Inverted full-text index over a translation's verse store.
+
+Each term maps to a sorted posting list of verse ids (the same dense ids the
+verse store uses). The lists live in one flat u32 array with an offset per
+term, so a translation's index is a few megabytes and loads without parsing.
+Verses cached after the index was built go to a small overlay that is merged
+when the index is saved.
+
+Queries are words (all must match), "quoted phrases" and prefix* terms.
+Phrases are checked against the verse text of the candidates, so the index
+does not need to store word positions.
+"""
+
+import bisect
+import logging
+import math
+import os
+import re
+import struct
+import threading
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    from src.verse_store import VerseLayout, VerseStore
+except ImportError:
+    from verse_store import VerseLayout, VerseStore
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+QUERY_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+# Most candidates read back and ranked per query; broader matches are sampled
+# evenly across the Bible so a one-word query stays fast on the Pi
+MAX_RANKED_CANDIDATES = 1500
+
+# Words too common to narrow a search; they still count inside quoted phrases
+STOPWORDS = frozenset(
+    'a an and are as at be but by for from he her him his i in into is it its me my of on or our '
+    'she so that the thee their them they thou thy this to unto us was we were which who with ye you your'.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms, folding possessives ("God's" -> "god")."""
+    words = TOKEN_PATTERN.findall(text.lower().replace('’', "'"))
+    return [word[:-2] if word.endswith("'s") else word.replace("'", '') for word in words]
+
+
+class VerseIndex:
+    """Term -> verse id posting lists for one translation."""
+
+    MAGIC = b'BCVI'
+    VERSION = 1
+    # magic, version, flags, term count, layout checksum, verses in the store when saved
+    HEADER = struct.Struct('<4sHHIII')
+
+    def __init__(self, layout: VerseLayout):
+        self.logger = logging.getLogger(__name__)
+        self.layout = layout
+        self.dirty = False
+        self._terms: List[str] = []
+        self._offsets = array('I', [0])
+        self._postings = array('I')
+        self._added: Dict[str, Set[int]] = {}
+        self._lock = threading.RLock()
+
+    # --- Building ---
+
+    def build(self, store: VerseStore):
+        """Index every verse in a store, keeping verses added while it runs."""
+        postings: Dict[str, array] = {}
+        for verse_id, text in store.iter_texts():
+            for term in set(tokenize(text)):
+                if term not in postings:
+                    postings[term] = array('I')
+                postings[term].append(verse_id)
+        with self._lock:
+            for term, ids in self._added.items():
+                postings.setdefault(term, array('I')).extend(ids)
+            self._freeze(postings)
+            self.dirty = True
+
+    def _freeze(self, postings: Dict[str, Iterable[int]]):
+        """Replace the posting arrays with the given term -> verse ids mapping."""
+        terms = sorted(postings)
+        offsets = array('I', [0])
+        flat = array('I')
+        for term in terms:
+            flat.extend(sorted(set(postings[term])))
+            offsets.append(len(flat))
+        self._terms, self._offsets, self._postings = terms, offsets, flat
+        self._added = {}
+
+    def add(self, book: str, chapter: int, verse: int, text: str):
+        """Index a newly cached verse."""
+        self.add_chapter(book, chapter, {verse: text})
+
+    def add_chapter(self, book: str, chapter: int, verses: Dict[int, str]):
+        """Index newly cached verses of a chapter, tokenized before taking the lock once."""
+        texts = []
+        for verse, text in verses.items():
+            verse_id = self.layout.verse_id(book, chapter, int(verse))
+            if verse_id is not None:
+                texts.append((verse_id, text))
+        self.add_texts(texts)
+
+    def add_texts(self, texts: Iterable[Tuple[int, str]]):
+        """Index (verse id, text) pairs, e.g. verses another process stored."""
+        postings = [(verse_id, set(tokenize(text))) for verse_id, text in texts if text]
+        if not postings:
+            return
+        with self._lock:
+            for verse_id, terms in postings:
+                for term in terms:
+                    self._added.setdefault(term, set()).add(verse_id)
+            self.dirty = True
+
+    # --- Persistence ---
+
+    def save(self, path: Path, store_verses: int):
+        """Merge added verses and atomically write the index.
+
+        store_verses is the store's verse count, read before the merge, so a
+        saved index always covers at least that many verses.
+        """
+        with self._lock:
+            if self._added:
+                self._freeze({term: self._term_postings(term) for term in set(self._terms) | set(self._added)})
+
+            term_blob = '\n'.join(self._terms).encode('utf-8')
+            path = Path(path)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, 0, len(self._terms),
+                                         self.layout.checksum, store_verses))
+                f.write(struct.pack('<I', len(term_blob)))
+                f.write(term_blob)
+                f.write(self._offsets.tobytes())
+                f.write(self._postings.tobytes())
+            os.replace(tmp_path, path)
+            self.dirty = False
+
+    def load(self, path: Path, store_verses: int) -> bool:
+        """Load a saved index; False if it is missing or out of date with the store."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return False
+
+        try:
+            magic, version, _flags, term_count, checksum, saved_verses = self.HEADER.unpack_from(data, 0)
+            if magic != self.MAGIC or version != self.VERSION or checksum != self.layout.checksum:
+                return False
+            if saved_verses != store_verses:
+                return False
+
+            position = self.HEADER.size
+            (blob_size,) = struct.unpack_from('<I', data, position)
+            position += 4
+            terms = data[position:position + blob_size].decode('utf-8').split('\n') if term_count else []
+            position += blob_size
+
+            offsets = array('I')
+            offsets.frombytes(data[position:position + (term_count + 1) * offsets.itemsize])
+            position += (term_count + 1) * offsets.itemsize
+            postings = array('I')
+            postings.frombytes(data[position:position + offsets[-1] * postings.itemsize])
+        except (struct.error, ValueError, IndexError, UnicodeDecodeError):
+            self.logger.warning(f"Ignoring unreadable search index {path}")
+            return False
+
+        if len(terms) != term_count or len(postings) != offsets[-1]:
+            return False
+
+        with self._lock:
+            self._terms, self._offsets, self._postings = terms, offsets, postings
+        return True
+
+    # --- Queries ---
+
+    def _term_postings(self, term: str) -> Set[int]:
+        """Verse ids containing an exact term."""
+        ids = set()
+        position = bisect.bisect_left(self._terms, term)
+        if position < len(self._terms) and self._terms[position] == term:
+            ids.update(self._postings[self._offsets[position]:self._offsets[position + 1]])
+        ids.update(self._added.get(term, ()))
+        return ids
+
+    def postings(self, term: str) -> Set[int]:
+        """Verse ids containing an exact (already tokenized) term."""
+        with self._lock:
+            return self._term_postings(term)
+
+    def _prefix_postings(self, prefix: str) -> Set[int]:
+        """Verse ids containing any term that starts with prefix."""
+        ids = set()
+        position = bisect.bisect_left(self._terms, prefix)
+        while position < len(self._terms) and self._terms[position].startswith(prefix):
+            ids.update(self._postings[self._offsets[position]:self._offsets[position + 1]])
+            position += 1
+        for term, added in self._added.items():
+            if term.startswith(prefix):
+                ids.update(added)
+        return ids
+
+    @staticmethod
+    def parse_query(query: str) -> Tuple[List[str], List[str], List[List[str]]]:
+        """Split a query into (words, prefixes, phrases)."""
+        words, prefixes, phrases = [], [], []
+        for phrase, word in QUERY_PATTERN.findall(query):
+            if phrase:
+                terms = tokenize(phrase)
+                if len(terms) > 1:
+                    phrases.append(terms)
+                else:
+                    words.extend(terms)
+            elif word.endswith('*') and len(word) > 2:
+                prefixes.extend(tokenize(word[:-1])[:1])
+            else:
+                words.extend(term for term in tokenize(word) if term not in STOPWORDS)
+        return words, prefixes, phrases
+
+    def search(self, query: str, store: VerseStore, limit: int = 10) -> List[Tuple[int, str]]:
+        """Find verses matching every query term, best matches first.
+
+        Returns (verse id, text) pairs. Verses are ranked by how often the
+        query terms occur, favouring shorter verses, then in canonical order.
+        Phrase queries only rank verses that contain the whole phrase.
+        """
+        words, prefixes, phrases = self.parse_query(query)
+        if not (words or prefixes or phrases):
+            return []
+
+        with self._lock:
+            candidate_sets = [self._term_postings(term) for term in words]
+            candidate_sets += [self._prefix_postings(prefix) for prefix in prefixes]
+            candidate_sets += [self._term_postings(term) for phrase in phrases for term in phrase]
+        candidate_sets.sort(key=len)
+        candidates = set(candidate_sets[0])
+        for ids in candidate_sets[1:]:
+            candidates &= ids
+            if not candidates:
+                return []
+
+        ranked = sorted(candidates)
+        if len(ranked) > MAX_RANKED_CANDIDATES:
+            step = len(ranked) / MAX_RANKED_CANDIDATES
+            ranked = [ranked[int(i * step)] for i in range(MAX_RANKED_CANDIDATES)]
+
+        scored = []
+        for verse_id in ranked:
+            text = store.get_by_id(verse_id)
+            if not text:
+                continue
+            tokens = tokenize(text)
+            if phrases and not all(self._contains_phrase(tokens, phrase) for phrase in phrases):
+                continue
+            counts = Counter(tokens)
+            hits = sum(counts[term] for term in words)
+            hits += sum(count for term, count in counts.items() if any(term.startswith(p) for p in prefixes))
+            hits += sum(2 * len(phrase) for phrase in phrases)
+            scored.append((-hits / math.log(len(tokens) + 2), verse_id, text))
+
+        scored.sort()
+        return [(verse_id, text) for _score, verse_id, text in scored[:limit]]
+
+    @staticmethod
+    def _contains_phrase(tokens: List[str], phrase: List[str]) -> bool:
+        size = len(phrase)
+        return any(tokens[i:i + size] == phrase for i in range(len(tokens) - size + 1))
+
+    @property
+    def term_count(self) -> int:
+        """Distinct terms in the saved arrays (added verses are counted once merged)."""
+        return len(self._terms)
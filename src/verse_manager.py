@@ -3,14 +3,169 @@ Manages Bible verse retrieval and scheduling.
 """
 
 import json
+import queue
 import random
+import re
 import requests
 import logging
-from datetime import datetime, time, date
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, time, date, timedelta
 from pathlib import Path
+from time import monotonic
 from typing import Dict, List, Optional
 import os
 import calendar
+import zlib
+
+try:
+    from src.current_frame import CurrentFrame
+except ImportError:
+    from current_frame import CurrentFrame
+
+try:
+    from src.date_schedule import SLOTS_PER_DAY, DateSchedule, prune_schedules
+except ImportError:
+    from date_schedule import SLOTS_PER_DAY, DateSchedule, prune_schedules
+
+try:
+    from src.http_client import http_client
+except ImportError:
+    from http_client import http_client
+
+try:
+    from src.provider_health import provider_health
+except ImportError:
+    from provider_health import provider_health
+
+try:
+    from src.scraper_sidecar import ScraperSidecar, SidecarError
+except ImportError:
+    from scraper_sidecar import ScraperSidecar, SidecarError
+
+try:
+    from src.usage_stats import usage_stats
+except ImportError:
+    from usage_stats import usage_stats
+
+try:
+    from src.verse_index import VerseIndex
+except ImportError:
+    from verse_index import VerseIndex
+
+try:
+    from src.verse_store import (BOOK_ALIASES, ShardCache, VerseLayout, VerseStore,
+                                 open_translation_store, peek_cached_verses)
+except ImportError:
+    from verse_store import (BOOK_ALIASES, ShardCache, VerseLayout, VerseStore,
+                             open_translation_store, peek_cached_verses)
+
+# Translation codes that share a cache with another translation key
+CACHE_KEY_ALIASES = {'nasb1995': 'nasb'}
+
+# Book codes used by the wldeh bible-api
+WLDEH_BOOK_CODES = {
+    'Genesis': 'GEN', 'Exodus': 'EXO', 'Leviticus': 'LEV', 'Numbers': 'NUM',
+    'Deuteronomy': 'DEU', 'Joshua': 'JOS', 'Judges': 'JDG', 'Ruth': 'RUT',
+    '1 Samuel': '1SA', '2 Samuel': '2SA', '1 Kings': '1KI', '2 Kings': '2KI',
+    '1 Chronicles': '1CH', '2 Chronicles': '2CH', 'Ezra': 'EZR', 'Nehemiah': 'NEH',
+    'Esther': 'EST', 'Job': 'JOB', 'Psalms': 'PSA', 'Proverbs': 'PRO',
+    'Ecclesiastes': 'ECC', 'Song of Solomon': 'SNG', 'Isaiah': 'ISA',
+    'Jeremiah': 'JER', 'Lamentations': 'LAM', 'Ezekiel': 'EZE', 'Daniel': 'DAN',
+    'Hosea': 'HOS', 'Joel': 'JOL', 'Amos': 'AMO', 'Obadiah': 'OBA',
+    'Jonah': 'JON', 'Micah': 'MIC', 'Nahum': 'NAH', 'Habakkuk': 'HAB',
+    'Zephaniah': 'ZEP', 'Haggai': 'HAG', 'Zechariah': 'ZEC', 'Malachi': 'MAL',
+    'Matthew': 'MAT', 'Mark': 'MRK', 'Luke': 'LUK', 'John': 'JHN',
+    'Acts': 'ACT', 'Romans': 'ROM', '1 Corinthians': '1CO', '2 Corinthians': '2CO',
+    'Galatians': 'GAL', 'Ephesians': 'EPH', 'Philippians': 'PHP', 'Colossians': 'COL',
+    '1 Thessalonians': '1TH', '2 Thessalonians': '2TH', '1 Timothy': '1TI',
+    '2 Timothy': '2TI', 'Titus': 'TIT', 'Philemon': 'PHM', 'Hebrews': 'HEB',
+    'James': 'JAS', '1 Peter': '1PE', '2 Peter': '2PE', '1 John': '1JN',
+    '2 John': '2JN', '3 John': '3JN', 'Jude': 'JUD', 'Revelation': 'REV'
+}
+
+# Translation codes used by the wldeh bible-api
+WLDEH_TRANSLATIONS = {
+    'web': 'engWEB2019eb',  # World English Bible
+    'kjv': 'engKJV1611',     # King James Version
+    'asv': 'engASV1901',     # American Standard Version
+}
+
+# Optimized hierarchical fallback chains for each translation: (source, source translation code)
+FALLBACK_CHAINS = {
+    # Primary translation - highest reliability (bible-api.com)
+    'kjv': [
+        ('local_cache', 'kjv'),     # Primary: Local cache
+        ('bible-api', 'kjv'),       # Secondary: bible-api.com (reliable)
+        ('wldeh_api', 'kjv')        # Tertiary: wldeh API backup
+    ],
+    
+    # Young's Literal Translation - bible-api.com supported
+    'ylt': [
+        ('local_cache', 'ylt'),     # Primary: Local cache
+        ('bible-api', 'ylt'),       # Secondary: bible-api.com (reliable)
+        ('bible-api', 'kjv')        # Tertiary: KJV fallback
+    ],
+    
+    # Modern copyrighted translations (require scraping/special APIs)
+    'amp': [
+        ('local_cache', 'amp'),     # Primary: Growing local cache
+        ('web_scraping', 'AMP'),    # Secondary: Direct website scraping (BibleGateway)
+        ('bible_scraper', 'AMP'),   # Tertiary: YouVersion scraper
+        ('scripture_api', 'AMP'),   # Quaternary: Scripture API (api.bible)
+        ('biblegateway', 'AMP'),    # Quinary: BibleGateway API (with credentials)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ],
+    'nlt': [
+        ('local_cache', 'nlt'),     # Primary: Growing local cache
+        ('web_scraping', 'NLT'),    # Secondary: Direct web scraping (reliable)
+        ('biblegateway', 'NLT'),    # Tertiary: BibleGateway API
+        ('bible_scraper', 'NLT'),   # Quaternary: YouVersion scraper (may have 404 issues)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ],
+    'msg': [
+        ('local_cache', 'msg'),     # Primary: Growing local cache
+        ('web_scraping', 'MSG'),    # Secondary: Direct web scraping (reliable)
+        ('biblegateway', 'MSG'),    # Tertiary: BibleGateway API
+        ('bible_scraper', 'MSG'),   # Quaternary: YouVersion scraper (may have 404 issues)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ],
+    'esv': [
+        ('local_cache', 'esv'),     # Primary: Growing local cache
+        ('web_scraping', 'ESV'),    # Secondary: Direct web scraping (reliable)
+        ('esv_api', None),          # Tertiary: Official ESV API
+        ('bible_scraper', 'ESV'),   # Quaternary: YouVersion scraper (may have 404 issues)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ],
+    'nasb': [
+        ('local_cache', 'nasb'),        # Primary: Growing local cache
+        ('web_scraping', 'NASB1995'),  # Secondary: Direct web scraping (reliable)
+        ('biblegateway', 'NASB1995'),   # Tertiary: BibleGateway API (NASB 1995)
+        ('bible_scraper', 'NASB1995'),  # Quaternary: YouVersion scraper (may have 404 issues)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ],
+    'cev': [
+        ('local_cache', 'cev'),     # Primary: Growing local cache
+        ('web_scraping', 'CEV'),    # Secondary: Direct website scraping (BibleGateway)
+        ('bible_scraper', 'CEV'),   # Tertiary: YouVersion scraper
+        ('scripture_api', 'CEV'),   # Quaternary: Scripture API (api.bible)
+        ('biblegateway', 'CEV'),    # Quinary: BibleGateway API (with credentials)
+        ('bible-api', 'kjv')        # Final: KJV fallback
+    ]
+}
+
+# Fallback chain sources that never leave the device
+LOCAL_SOURCES = {'local_cache', 'local_amp', 'local_kjv'}
+
+# Sources fetched through http_client, which records their outcomes itself
+HTTP_SOURCES = {'bible-api', 'wldeh_api', 'esv_api', 'scripture_api', 'biblegateway', 'web_scraping'}
+
+# Sources that can return a whole chapter in one request
+CHAPTER_SOURCES = {'bible-api', 'wldeh_api', 'esv_api', 'web_scraping'}
+
+# "Book chapter:verse[-end]", where the book may itself contain digits and spaces ("1 John 4:7-8")
+REFERENCE_PATTERN = re.compile(r'^\s*(.+?)\s+(\d+)\s*:\s*(\d+)(?:\s*[-\u2013]\s*(\d+))?\s*$')
 
 class VerseManager:
     def __init__(self):
@@ -19,6 +174,81 @@ class VerseManager:
         self.translation = os.getenv('DEFAULT_TRANSLATION', 'kjv')
         self.timeout = int(os.getenv('REQUEST_TIMEOUT', '10'))
         
+        # Offline-first: time mode reads the local verse store and only misses go upstream,
+        # fetched by a background worker so the minute render never waits on the network
+        self.offline_first = os.getenv('OFFLINE_FIRST', 'true').lower() == 'true'
+        self._upstream_queue = queue.Queue()
+        self._upstream_pending = set()
+        self._upstream_lock = threading.Lock()
+        self._upstream_thread = None
+        
+        # Lookahead prefetch: resolve the next N minutes in the background so the
+        # minute update is a cache hit (time, date and devotional modes are clock-driven)
+        self.prefetch_minutes = int(os.getenv('PREFETCH_MINUTES', '5'))
+        self.prefetch_interval = int(os.getenv('PREFETCH_INTERVAL', '20'))
+        self.MAX_PREFETCH_ENTRIES = max(16, self.prefetch_minutes * 4)
+        self._prefetch_cache = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_stop = threading.Event()
+        self._prefetch_thread = None
+        self._resolution_state = threading.local()
+        # Called with each newly prefetched verse (e.g. to lay out pages ahead of time)
+        self.prefetch_callback = None
+        
+        # Snapshot of the frame on the display, published once per tick by the service
+        self._current_frame: Optional[CurrentFrame] = None
+        self._recorded_frame_key: Optional[tuple] = None
+        self._frame_lock = threading.Lock()
+        
+        # Write-behind for translation caches: new verses go to per-translation
+        # journals that a background thread fsyncs and compacts into the stores
+        self.JOURNAL_SYNC_INTERVAL = 5  # Seconds between journal fsyncs
+        self.JOURNAL_COMPACT_ENTRIES = 500  # Compact once this many verses are journaled
+        self.JOURNAL_COMPACT_INTERVAL = 1800  # Compact any journaled verses at least this often
+        self._cache_writer_stop = threading.Event()
+        self._cache_writer_thread = None
+        self._cache_writer_lock = threading.Lock()
+        self._total_bible_verses = None
+        
+        # Translation stores open on first use; their per-book shards share one memory budget
+        self.CACHEABLE_TRANSLATIONS = ['kjv', 'ylt', 'esv', 'amp', 'nlt', 'msg', 'nasb', 'cev']
+        self.shard_cache = ShardCache(int(float(os.getenv('VERSE_CACHE_BUDGET_MB', '8')) * 1024 * 1024))
+        self._store_open_lock = threading.Lock()
+        self.STORE_RETRY_INTERVAL = 300  # Seconds before a store that failed to open is tried again
+        self._store_open_failures: Dict[str, float] = {}
+        
+        # Full-text search indexes, loaded or built per translation on first search
+        self.verse_indexes: Dict[str, VerseIndex] = {}
+        self._building_indexes: Dict[str, VerseIndex] = {}
+        self._index_lock = threading.Lock()
+        
+        # Hedged provider requests (opt-in): start the next fallback hop when the
+        # current one is slow, keep the first answer, and give up at the deadline
+        self.provider_hedging = os.getenv('PROVIDER_HEDGING', 'false').lower() == 'true'
+        self.hedge_delay = float(os.getenv('HEDGE_DELAY', '0.75'))
+        self.provider_deadline = float(os.getenv('PROVIDER_DEADLINE', '8'))
+        
+        # Batch lookups resolve each missing chapter on its own worker
+        batch_workers = 4
+        self._batch_executor = ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix='verse-batch')
+        # Room for every remote hop of the longest chain, for each batch worker plus one direct lookup;
+        # hops stop at their lookup's deadline, so a slow provider cannot hold a worker longer
+        longest_chain = max(sum(1 for source, _ in chain if source not in LOCAL_SOURCES)
+                            for chain in FALLBACK_CHAINS.values())
+        self._hedge_executor = ThreadPoolExecutor(max_workers=longest_chain * (batch_workers + 1),
+                                                  thread_name_prefix='verse-hedge')
+        self._book_names = None
+        
+        # Date mode reads precompiled per-day schedules (see prepare_date_schedules)
+        self._date_schedules = {}
+        self._date_schedule_lock = threading.Lock()
+        self._date_source_checksum = None
+        
+        # Long-running bible-scraper process, started on first YouVersion lookup
+        self._scraper_sidecar = None
+        self._scraper_sidecar_lock = threading.Lock()
+        self._scraper_sidecar_closed = False
+        
         # Initialize devotional manager
         try:
             from src.devotional_manager import DevotionalManager
@@ -54,39 +284,26 @@ class VerseManager:
         self.parallel_mode = False  # Parallel mode off by default - user can enable
         self.secondary_translation = 'amp'  # Default secondary translation when parallel mode enabled
         self.time_format = '12'  # '12' for 12-hour format, '24' for 24-hour format
-        # Memory optimization settings
-        self.MAX_DAILY_ACTIVITY_DAYS = 30  # Keep only last 30 days
-        self.MAX_BOOKS_ACCESSED = 50  # Limit books accessed tracking
-        self.MAX_TRANSLATION_USAGE = 20  # Limit translation usage tracking
-        
         # Book summary pagination tracking
         self.current_book_summary = None  # Store current book summary for pagination
         self.book_summary_minute = None  # Track which minute the book summary started
         
-        self.statistics = {
-            'verses_displayed': 0,
-            'verses_today': 0,
-            'books_accessed': set(),
-            'translation_usage': {},
-            'mode_usage': {'time': 0, 'date': 0, 'random': 0, 'devotional': 0},
-            'daily_activity': {}  # Date -> count mapping for rotation
-        }
         self.start_time = datetime.now()
-        self.daily_reset_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Load local data
         self._load_fallback_verses()
         self._load_book_summaries()
-        self._load_kjv_bible()
-        self._load_amp_bible()
-        self._load_all_translation_caches()
-        self._load_biblical_calendar()
         self._load_bible_structure()
+        self._init_translation_caches()
+        self._load_biblical_calendar()
         
         # All available Bible books (must be populated before completion calculation)
         self.available_books = []
         self._populate_available_books()
         
+        # Time-mode candidate books for every chapter:verse the clock can show
+        self._build_time_slot_index()
+        
         # Verse caching system for building complete translations
         self.translation_cache_enabled = True
         self.translation_completion = self._calculate_all_translation_completion()
@@ -114,61 +331,54 @@ class VerseManager:
             self.logger.error(f"Failed to load book summaries: {e}")
             self.book_summaries = {}
     
-    def _load_kjv_bible(self):
-        """Load complete KJV Bible for offline use."""
-        try:
-            kjv_path = Path('data/translations/bible_kjv.json')
-            with open(kjv_path, 'r') as f:
-                self.kjv_bible = json.load(f)
-            self.logger.info("Loaded complete KJV Bible")
-        except Exception as e:
-            self.logger.error(f"Failed to load KJV Bible: {e}")
-            self.kjv_bible = {}
-    
-    def _load_amp_bible(self):
-        """Load complete AMP Bible for offline use."""
+    def _init_translation_caches(self):
+        """Build the verse layout; translation stores are opened lazily on first access."""
+        # Holds only the stores opened so far
+        self.translation_caches = {}
+        
         try:
-            amp_path = Path('data/translations/bible_amp.json')
-            with open(amp_path, 'r') as f:
-                self.amp_bible = json.load(f)
-            self.logger.info("Loaded complete AMP Bible")
+            self.verse_layout = VerseLayout(self.bible_structure)
         except Exception as e:
-            self.logger.warning(f"AMP Bible not found: {e}. Will use API or fallback methods.")
-            self.amp_bible = {}
-    
-    def _load_all_translation_caches(self):
-        """Load all cached translation files."""
-        try:
-            # Initialize translation caches dictionary
-            self.translation_caches = {}
-            
-            # List of supported translations that can be cached
-            cacheable_translations = ['kjv', 'ylt', 'esv', 'amp', 'nlt', 'msg', 'nasb']
-            
-            for translation in cacheable_translations:
-                # Handle special case for NASB which uses nasb1995 file
-                file_name = translation
-                if translation == 'nasb':
-                    file_name = 'nasb1995'
-                
-                cache_path = Path(f'data/translations/bible_{file_name}.json')
+            self.logger.error(f"Failed to initialize translation caches: {e}")
+            self.verse_layout = None
+    
+    @property
+    def kjv_bible(self) -> Optional[VerseStore]:
+        """Offline KJV lookups share the KJV translation store."""
+        return self._get_translation_store('kjv')
+    
+    @property
+    def amp_bible(self) -> Optional[VerseStore]:
+        """Offline AMP lookups share the AMP translation store."""
+        return self._get_translation_store('amp')
+    
+    def _get_translation_store(self, translation: str) -> Optional[VerseStore]:
+        """Get (opening if necessary) the verse store for a translation cache key."""
+        translation = CACHE_KEY_ALIASES.get(translation, translation)
+        store = self.translation_caches.get(translation)
+        if store is not None or getattr(self, 'verse_layout', None) is None:
+            return store
+        
+        failed_at = self._store_open_failures.get(translation)
+        if failed_at is not None and monotonic() - failed_at < self.STORE_RETRY_INTERVAL:
+            return None
+        
+        with self._store_open_lock:
+            store = self.translation_caches.get(translation)
+            if store is None:
                 try:
-                    if cache_path.exists():
-                        with open(cache_path, 'r') as f:
-                            self.translation_caches[translation] = json.load(f)
-                        self.logger.debug(f"Loaded {translation.upper()} translation cache from {file_name}")
-                    else:
-                        self.translation_caches[translation] = {}
-                        self.logger.debug(f"Initialized empty cache for {translation.upper()}")
+                    store = open_translation_store(translation, self.verse_layout, shard_cache=self.shard_cache)
+                    self.translation_caches[translation] = store
+                    self._store_open_failures.pop(translation, None)
+                    self.logger.info(f"Opened {translation.upper()} verse store ({store.cached_verses} verses)")
+                    # A JSON cache converted on open may change the startup estimate
+                    if hasattr(self, 'translation_completion'):
+                        self.translation_completion[translation] = self._store_completion(store)
                 except Exception as e:
-                    self.logger.warning(f"Failed to load {translation} cache: {e}")
-                    self.translation_caches[translation] = {}
-            
-            self.logger.info(f"Loaded translation caches for {len(self.translation_caches)} translations")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize translation caches: {e}")
-            self.translation_caches = {}
+                    self._store_open_failures[translation] = monotonic()
+                    self.logger.warning(f"Failed to open {translation} verse store, "
+                                        f"retrying in {self.STORE_RETRY_INTERVAL}s: {e}")
+        return store
     
     def _load_biblical_calendar(self):
         """Load biblical events calendar."""
@@ -232,23 +442,74 @@ class VerseManager:
         
         self.logger.info(f"Available books: {len(self.available_books)}")
     
+    def _build_time_slot_index(self):
+        """Precompute time-mode candidate books for every clock chapter:verse.
+        
+        Chapters 1-24 cover both the 12- and 24-hour mappings and verses 1-59
+        cover every minute except :00 (book summary), so picking a verse for a
+        minute becomes a dictionary lookup instead of a scan of all 66 books.
+        """
+        self.book_order = {book: index for index, book in enumerate(self.available_books)}
+        self.chapter_books = {}
+        self.time_slot_index = {}
+        
+        for chapter in range(1, 25):
+            books = [book for book in self.available_books if self._book_has_chapter(book, chapter)]
+            self.chapter_books[chapter] = books
+            max_verses = [(book, self._get_max_verse_for_chapter(book, chapter)) for book in books]
+            
+            for verse in range(1, 60):
+                exact_matches = []
+                adjusted = []
+                for book, max_verse in max_verses:
+                    if not max_verse:
+                        continue
+                    if verse <= max_verse:
+                        exact_matches.append({'book': book, 'verse': verse, 'exact_match': True})
+                    else:
+                        adjusted.append({'book': book, 'verse': max_verse, 'exact_match': False})
+                self.time_slot_index[(chapter, verse)] = (exact_matches + adjusted, exact_matches)
+        
+        self.logger.info(f"Built time slot index for {len(self.time_slot_index)} chapter:verse slots")
+    
+    def _get_time_slot_candidates(self, chapter: int, verse: int):
+        """Get (all candidates, exact-match candidates) for a chapter:verse."""
+        slot = self.time_slot_index.get((chapter, verse))
+        if slot is not None:
+            return slot
+        candidates = self._get_all_books_with_valid_verse(chapter, verse)
+        return candidates, [book for book in candidates if book['exact_match']]
+    
+    def _get_time_chapter(self, hour_24: int) -> int:
+        """Map the current hour to a chapter number for the configured time format."""
+        if self.time_format == '12':
+            # 12-hour format mapping:
+            # 00:XX (12:XX AM) = Chapter 12
+            # 01:XX (1:XX AM) = Chapter 1, 02:XX (2:XX AM) = Chapter 2, etc.
+            # 12:XX (12:XX PM) = Chapter 12  
+            # 13:XX (1:XX PM) = Chapter 1, 14:XX (2:XX PM) = Chapter 2, etc.
+            if hour_24 == 0:
+                return 12  # 12:XX AM = Chapter 12
+            elif hour_24 <= 12:
+                return hour_24  # 1:XX AM to 12:XX PM = Chapter 1-12
+            else:
+                return hour_24 - 12  # 1:XX PM to 11:XX PM = Chapter 1-11
+        
+        # 24-hour format mapping:
+        # 00:XX = Chapter 24, 01:XX = Chapter 1, etc.
+        return hour_24 if hour_24 > 0 else 24
+    
     def _get_books_with_chapter(self, chapter_num: int) -> list:
         """Get list of books that have the specified chapter number."""
         books_with_chapter = []
         
         for book in self.available_books:
-            if self.kjv_bible and book in self.kjv_bible:
+            if self.kjv_bible and self.kjv_bible.has_chapter(book, chapter_num):
                 # Check local KJV data first
-                book_data = self.kjv_bible[book]
-                if str(chapter_num) in book_data:
-                    books_with_chapter.append(book)
+                books_with_chapter.append(book)
+            elif self._book_likely_has_chapter(book, chapter_num):
                 # If not in local data, use estimates (local data is incomplete)
-                elif self._book_likely_has_chapter(book, chapter_num):
-                    books_with_chapter.append(book)
-            else:
-                # For books not in local data, make educated guesses
-                if self._book_likely_has_chapter(book, chapter_num):
-                    books_with_chapter.append(book)
+                books_with_chapter.append(book)
         
         return books_with_chapter
     
@@ -300,18 +561,20 @@ class VerseManager:
                     return book_data[str(chapter)]
         
         # Fallback: check local KJV data if available
-        if self.kjv_bible and book in self.kjv_bible:
-            chapter_data = self.kjv_bible[book].get(str(chapter), {})
+        if self.kjv_bible:
+            chapter_data = self.kjv_bible.chapter_verses(book, chapter)
             if chapter_data:
-                available_verses = [int(v) for v in chapter_data.keys() if v.isdigit()]
-                if available_verses:
-                    return max(available_verses)
+                return max(chapter_data)
         
         # No data found for this book/chapter
         return None
     
     def _get_all_books_with_valid_verse(self, chapter: int, verse: int) -> List[Dict]:
         """Get all books that have a valid verse for the given chapter:verse, with actual verse numbers."""
+        slot = getattr(self, 'time_slot_index', {}).get((chapter, verse))
+        if slot is not None:
+            return list(slot[0])
+        
         candidate_books = []
         
         # Check all 66 Bible books systematically
@@ -330,7 +593,8 @@ class VerseManager:
                 })
         
         # Sort to prioritize exact matches, then by book order
-        candidate_books.sort(key=lambda x: (not x['exact_match'], self.available_books.index(x['book'])))
+        book_order = getattr(self, 'book_order', {})
+        candidate_books.sort(key=lambda x: (not x['exact_match'], book_order.get(x['book'], 0)))
         
         return candidate_books
     
@@ -370,31 +634,63 @@ class VerseManager:
         ]
     
     def get_current_verse(self) -> Dict:
-        """Get verse based on current display mode."""
-        # Check if we need to reset daily counter
-        now = datetime.now()
-        if now.date() > self.daily_reset_time.date():
-            self.statistics['verses_today'] = 0
-            self.daily_reset_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        self.statistics['verses_displayed'] += 1
-        self.statistics['verses_today'] += 1
-        
-        # Track daily activity with rotation
-        today_str = now.strftime('%Y-%m-%d')
-        self.statistics['daily_activity'][today_str] = self.statistics['daily_activity'].get(today_str, 0) + 1
-        
-        # Rotate old daily activity data to prevent unbounded growth
-        self._rotate_daily_activity()
-        
+        """Get the verse for the current minute without side effects.
+        
+        Returns the displayed frame's verse when it is still current, so every
+        reader sees what is on the screen; otherwise resolves the minute.
+        """
+        frame = self.get_current_frame()
+        if frame is not None:
+            return frame.verse()
+        return self.resolve_current_verse()
+    
+    def resolve_current_verse(self, now: Optional[datetime] = None) -> Dict:
+        """Resolve the verse for a minute (prefetched if available) under the current settings."""
+        now = now or datetime.now()
+        verse_data = self._get_prefetched_verse(now)
+        if verse_data is None:
+            verse_data = self._resolve_and_cache_verse(now.replace(second=0, microsecond=0))
+        return verse_data
+    
+    def frame_key(self, now: Optional[datetime] = None) -> tuple:
+        """Key a frame built now would carry: the minute plus the verse settings."""
+        return self._prefetch_key((now or datetime.now()).replace(second=0, microsecond=0))
+    
+    def get_current_frame(self) -> Optional[CurrentFrame]:
+        """Get the published frame if it is for this minute and the current settings."""
+        with self._frame_lock:
+            frame = self._current_frame
+        if frame is None or frame.settings_key != self.frame_key():
+            return None
+        return frame
+    
+    def publish_frame(self, frame: CurrentFrame):
+        """Make a frame the current one."""
+        with self._frame_lock:
+            self._current_frame = frame
+    
+    def record_frame_displayed(self, frame: CurrentFrame):
+        """Count a frame that reached the display in the usage statistics, once per frame key."""
+        with self._frame_lock:
+            if frame.settings_key == self._recorded_frame_key:
+                return
+            self._recorded_frame_key = frame.settings_key
+        self._record_display(frame.verse_data)
+    
+    def _record_display(self, verse_data) -> None:
+        """Count a verse that was actually displayed in the usage statistics."""
+        usage_stats.record_display(verse_data.get('book'), getattr(self, 'translation', 'kjv'), self.display_mode)
+    
+    def _resolve_verse(self, now: datetime) -> Dict:
+        """Resolve the verse shown at the given time for the current settings."""
         if self.display_mode == 'date':
-            verse_data = self._get_date_based_verse()
+            verse_data = self._get_date_based_verse(now)
         elif self.display_mode == 'random':
             verse_data = self._get_random_verse()
         elif self.display_mode == 'devotional':
-            verse_data = self._get_devotional_verse()
+            verse_data = self._get_devotional_verse(now)
         else:  # time mode
-            verse_data = self._get_time_based_verse()
+            verse_data = self._get_time_based_verse(now)
         
         # Ensure translation field is set if not already present
         if verse_data and not verse_data.get('translation'):
@@ -408,21 +704,94 @@ class VerseManager:
         if self.parallel_mode and verse_data and not verse_data.get('is_date_event'):
             verse_data = self._add_parallel_translation(verse_data)
         
-        # Update statistics with rotation
-        self.statistics['mode_usage'][self.display_mode] += 1
-        if verse_data.get('book'):
-            self.statistics['books_accessed'].add(verse_data['book'])
-            # Limit books_accessed set size to prevent memory growth
-            self._rotate_books_accessed()
-        
-        translation = getattr(self, 'translation', 'kjv')
-        self.statistics['translation_usage'][translation] = self.statistics['translation_usage'].get(translation, 0) + 1
-        # Limit translation_usage dict size
-        self._rotate_translation_usage()
+        return verse_data
+    
+    def _prefetch_key(self, minute: datetime) -> tuple:
+        """Cache key for a resolved minute under the current settings."""
+        rotation_minutes = self.devotional_manager.rotation_minutes if self.devotional_manager else None
+        return (minute.strftime('%Y-%m-%d %H:%M'), self.display_mode, self.translation,
+                self.parallel_mode, self.secondary_translation, self.time_format, rotation_minutes)
+    
+    def _note_resolution_miss(self):
+        """Mark the resolution in progress as incomplete (waiting on upstream data)."""
+        self._resolution_state.missed = True
+    
+    def _resolve_and_cache_verse(self, minute: datetime) -> Dict:
+        """Resolve a minute and keep the result in the bounded prefetch cache."""
+        self._resolution_state.missed = False
+        verse_data = self._resolve_verse(minute)
+        settled = not self._resolution_state.missed
+        
+        # Random mode is not a function of the clock, so it is never cached
+        if verse_data and self.display_mode != 'random':
+            with self._prefetch_lock:
+                self._prefetch_cache[self._prefetch_key(minute)] = (dict(verse_data), settled)
+                self._prefetch_cache.move_to_end(self._prefetch_key(minute))
+                while len(self._prefetch_cache) > self.MAX_PREFETCH_ENTRIES:
+                    self._prefetch_cache.popitem(last=False)
         
         return verse_data
     
-    def _get_devotional_verse(self) -> Dict:
+    def _get_prefetched_verse(self, now: datetime) -> Optional[Dict]:
+        """Get a copy of the prefetched verse for the current minute, if settled."""
+        if self.display_mode == 'random':
+            return None
+        key = self._prefetch_key(now.replace(second=0, microsecond=0))
+        with self._prefetch_lock:
+            entry = self._prefetch_cache.get(key)
+        if entry is None or not entry[1]:
+            return None
+        return dict(entry[0])
+    
+    def prefetch_upcoming(self):
+        """Resolve the next prefetch_minutes minutes that are not cached yet."""
+        if self.display_mode == 'random' or self.prefetch_minutes <= 0:
+            return
+        
+        current_minute = datetime.now().replace(second=0, microsecond=0)
+        for offset in range(1, self.prefetch_minutes + 1):
+            minute = current_minute + timedelta(minutes=offset)
+            with self._prefetch_lock:
+                entry = self._prefetch_cache.get(self._prefetch_key(minute))
+            if entry is not None and entry[1]:
+                continue
+            verse_data = self._resolve_and_cache_verse(minute)
+            if verse_data and self.prefetch_callback:
+                self.prefetch_callback(dict(verse_data))
+        
+        # Drop minutes that have already passed
+        current_key = current_minute.strftime('%Y-%m-%d %H:%M')
+        with self._prefetch_lock:
+            for key in [k for k in self._prefetch_cache if k[0] < current_key]:
+                del self._prefetch_cache[key]
+    
+    def start_prefetching(self):
+        """Start the background lookahead prefetcher."""
+        if self.prefetch_minutes <= 0 or (self._prefetch_thread and self._prefetch_thread.is_alive()):
+            return
+        
+        self._prefetch_stop.clear()
+        self._prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self._prefetch_thread.start()
+        self.logger.info(f"Verse prefetching started ({self.prefetch_minutes} minutes ahead)")
+    
+    def stop_prefetching(self):
+        """Stop the background lookahead prefetcher."""
+        self._prefetch_stop.set()
+        if self._prefetch_thread:
+            self._prefetch_thread.join(timeout=1)
+        self.logger.info("Verse prefetching stopped")
+    
+    def _prefetch_loop(self):
+        """Prefetch loop run by the background thread."""
+        while not self._prefetch_stop.is_set():
+            try:
+                self.prefetch_upcoming()
+            except Exception as e:
+                self.logger.error(f"Verse prefetch error: {e}")
+            self._prefetch_stop.wait(self.prefetch_interval)
+    
+    def _get_devotional_verse(self, now: Optional[datetime] = None) -> Dict:
         """Get devotional content using the devotional manager."""
         if not self.devotional_manager:
             self.logger.warning("Devotional manager not available, falling back to random verse")
@@ -430,7 +799,7 @@ class VerseManager:
         
         try:
             # Get rotating devotional from the devotional manager
-            devotional_data = self.devotional_manager.get_rotating_devotional()
+            devotional_data = self.devotional_manager.get_rotating_devotional(now=now)
             
             if devotional_data:
                 # Convert devotional data to verse format
@@ -461,54 +830,42 @@ class VerseManager:
             self.logger.error(f"Error getting devotional verse: {e}")
             return self._get_random_verse()
     
-    def _get_time_based_verse(self) -> Dict:
+    def _get_time_based_verse(self, now: Optional[datetime] = None) -> Dict:
         """Time-based verse logic: HH:MM = Chapter:Verse, minute 00 = book summary."""
-        now = datetime.now()
+        now = now or datetime.now()
         hour_24 = now.hour
         minute = now.minute
         
         # At minute 00, show a book summary
         if minute == 0:
-            return self._get_random_book_summary()
+            return self._get_random_book_summary(now)
         
         # Determine chapter based on time format setting
-        if self.time_format == '12':
-            # 12-hour format mapping:
-            # 00:XX (12:XX AM) = Chapter 12
-            # 01:XX (1:XX AM) = Chapter 1, 02:XX (2:XX AM) = Chapter 2, etc.
-            # 12:XX (12:XX PM) = Chapter 12  
-            # 13:XX (1:XX PM) = Chapter 1, 14:XX (2:XX PM) = Chapter 2, etc.
-            if hour_24 == 0:
-                chapter = 12  # 12:XX AM = Chapter 12
-            elif hour_24 <= 12:
-                chapter = hour_24  # 1:XX AM to 12:XX PM = Chapter 1-12
-            else:
-                chapter = hour_24 - 12  # 1:XX PM to 11:XX PM = Chapter 1-11
-        else:  # 24-hour format
-            # 24-hour format mapping:
-            # 00:XX = Chapter 24, 01:XX = Chapter 1, etc.
-            chapter = hour_24 if hour_24 > 0 else 24
-        
+        chapter = self._get_time_chapter(hour_24)
         verse = minute
         
-        verse_data = self._get_verse_from_api(chapter, verse)
-        if not verse_data:
-            verse_data = self._get_verse_from_local_data(chapter, verse)
+        if self.offline_first:
+            # A store miss stays on the selected slot (KJV stand-in or summary) rather
+            # than jumping to random local KJV text labelled as the active translation
+            verse_data = self._get_verse_from_local_store(chapter, verse, now)
+        else:
+            verse_data = self._get_verse_from_api(chapter, verse, now)
+            if not verse_data:
+                verse_data = self._get_verse_from_local_data(chapter, verse)
         if not verse_data:
             # No exact verse found - check if we should show a summary instead
-            verse_data = self._get_time_based_summary_or_fallback(chapter, verse)
+            verse_data = self._get_time_based_summary_or_fallback(chapter, verse, now)
         
         return verse_data
     
-    def _get_time_based_summary_or_fallback(self, chapter: int, verse: int) -> Dict:
+    def _get_time_based_summary_or_fallback(self, chapter: int, verse: int, now: Optional[datetime] = None) -> Dict:
         """Get a time-based book summary when no exact verse exists, or fallback."""
-        now = datetime.now()
+        now = now or datetime.now()
         
         # Get books that have the requested chapter
-        books_with_chapter = []
-        for book in self.available_books:
-            if self._book_has_chapter(book, chapter):
-                books_with_chapter.append(book)
+        books_with_chapter = self.chapter_books.get(chapter)
+        if books_with_chapter is None:
+            books_with_chapter = [book for book in self.available_books if self._book_has_chapter(book, chapter)]
         
         if books_with_chapter:
             # Select a book based on time for consistency
@@ -516,19 +873,17 @@ class VerseManager:
             selected_book = books_with_chapter[book_index]
             
             # Check if ANY book has the exact verse
-            has_exact_verse = any(
-                self._validate_verse_number(book, chapter, verse) == verse 
-                for book in books_with_chapter
-            )
+            _, exact_match_books = self._get_time_slot_candidates(chapter, verse)
+            has_exact_verse = bool(exact_match_books)
             
             # If no book has the exact verse, show summary instead
             if not has_exact_verse:
-                return self._get_time_based_book_summary(selected_book, chapter, verse)
+                return self._get_time_based_book_summary(selected_book, chapter, verse, now)
         
         # Final fallback to random verse
         return random.choice(self.fallback_verses)
     
-    def _get_time_based_book_summary(self, book: str, chapter: int, verse: int) -> Dict:
+    def _get_time_based_book_summary(self, book: str, chapter: int, verse: int, now: Optional[datetime] = None) -> Dict:
         """Get a book summary for time-based display when exact verse doesn't exist."""
         # Get book summary
         if self.book_summaries and book in self.book_summaries:
@@ -545,7 +900,7 @@ class VerseManager:
                 'summary': f'{book} is a book of the Bible containing wisdom and spiritual guidance.'
             }
         
-        now = datetime.now()
+        now = now or datetime.now()
         # Format time with leading zeros for hours
         if self.time_format == '12':
             hour_12 = now.hour % 12
@@ -570,112 +925,155 @@ class VerseManager:
             'time_correlation': f'Time {time_display} → Chapter {chapter:02d}:Verse {verse:02d} → {book} Summary'
         }
     
-    def _get_date_based_verse(self) -> Dict:
-        """Get verse based on today's date and biblical events with enhanced hierarchical cycling."""
-        now = datetime.now()
-        today = now.date()
+    def _get_date_based_verse(self, now: Optional[datetime] = None) -> Dict:
+        """Get the date-mode verse for this minute from the day's precompiled schedule."""
+        now = now or datetime.now()
+        
+        # 1440 verse slots per day, one per minute
+        schedule = self._get_date_schedule(now.date())
+        verse_data = schedule.record_for(now.hour * 60 + now.minute)
         
-        # Calculate which event and verse to show based on 1-minute intervals for frequent cycling
-        # This gives us 60 verse slots per hour, 1440 verse slots per day
-        minutes_since_midnight = now.hour * 60 + now.minute
-        verse_slot = minutes_since_midnight // 1  # 1-minute intervals
+        if verse_data.get('date_match') == 'fallback':
+            verse_data['next_change_minutes'] = 5 - (now.minute % 5)
+        else:
+            verse_data['next_change_minutes'] = 1  # 1-minute intervals
+            verse_data['current_time'] = now.strftime('%I:%M %p')
+            verse_data['current_date'] = now.strftime('%B %d, %Y')
+        return verse_data
+    
+    def _select_date_events(self, day: date) -> tuple:
+        """Pick the events for a day by priority: exact date, weekday, month, then season.
         
-        # Hierarchical event selection: day -> week -> month -> season
-        selected_events = []
-        match_type = "exact"
+        Returns (events, match type); events is empty when nothing matches.
+        """
+        calendar_data = self.biblical_events_calendar
         
         # 1. First priority: Exact date events (MM-DD format)
-        date_key = f"{today.month:02d}-{today.day:02d}"
-        if date_key in self.biblical_events_calendar.get('events', {}):
-            events = self.biblical_events_calendar['events'][date_key]
-            selected_events.extend(events)
-            match_type = "exact"
-        
-        # 2. Second priority: Weekly themes (if no daily events or to supplement)
-        if not selected_events:
-            weekday_name = calendar.day_name[today.weekday()].lower()
-            weekly_themes = self.biblical_events_calendar.get('weekly_themes', {})
-            if weekday_name in weekly_themes:
-                selected_events.extend(weekly_themes[weekday_name])
-                match_type = "week"
-        
-        # 3. Third priority: Monthly themes (if no weekly events)
-        if not selected_events:
-            month_name = calendar.month_name[today.month].lower()
-            monthly_themes = self.biblical_events_calendar.get('monthly_themes', {})
-            if month_name in monthly_themes:
-                selected_events.extend(monthly_themes[month_name])
-                match_type = "month"
-        
-        # 4. Fourth priority: Seasonal themes (final fallback)
-        if not selected_events:
-            season = self._get_current_season(today)
-            seasonal_themes = self.biblical_events_calendar.get('seasonal_themes', {})
-            if season in seasonal_themes:
-                selected_events.extend(seasonal_themes[season])
-                match_type = "season"
-        
-        # 5. Final fallback: Random verse
-        if not selected_events:
-            return self._get_fallback_verse(match_type="fallback")
-        
-        # Cycle through events based on time slot
-        event_index = verse_slot % len(selected_events)
-        current_event = selected_events[event_index]
-        
-        # If we have verses, cycle through them based on time
-        available_verses = current_event.get('verses', [])
-        if available_verses:
-            verse_in_event = verse_slot % len(available_verses)
-            verse = available_verses[verse_in_event]
-            
-            # Parse reference to extract book, chapter, verse
-            ref_parts = verse['reference'].split()
-            book = ref_parts[0]
-            if len(ref_parts) > 1 and ':' in ref_parts[-1]:
-                chapter_verse = ref_parts[-1].split(':')
-                chapter = int(chapter_verse[0]) if chapter_verse[0].isdigit() else 1
-                verse_num = int(chapter_verse[1]) if len(chapter_verse) > 1 and chapter_verse[1].isdigit() else 1
+        date_key = f"{day.month:02d}-{day.day:02d}"
+        if calendar_data.get('events', {}).get(date_key):
+            return list(calendar_data['events'][date_key]), "exact"
+        
+        # 2. Second priority: Weekly themes
+        weekday_name = calendar.day_name[day.weekday()].lower()
+        if calendar_data.get('weekly_themes', {}).get(weekday_name):
+            return list(calendar_data['weekly_themes'][weekday_name]), "week"
+        
+        # 3. Third priority: Monthly themes
+        month_name = calendar.month_name[day.month].lower()
+        if calendar_data.get('monthly_themes', {}).get(month_name):
+            return list(calendar_data['monthly_themes'][month_name]), "month"
+        
+        # 4. Fourth priority: Seasonal themes
+        season = self._get_current_season(day)
+        if calendar_data.get('seasonal_themes', {}).get(season):
+            return list(calendar_data['seasonal_themes'][season]), "season"
+        
+        return [], "fallback"
+    
+    def _date_schedule_checksum(self) -> int:
+        """Checksum of the data schedules are compiled from, so edits invalidate saved schedules."""
+        if self._date_source_checksum is None:
+            source = json.dumps([self.biblical_events_calendar, self.fallback_verses], sort_keys=True)
+            self._date_source_checksum = zlib.crc32(source.encode('utf-8'))
+        return self._date_source_checksum
+    
+    def _compile_date_schedule(self, day: date) -> DateSchedule:
+        """Compile a day's 1440 date-mode slots into a table of fully parsed verse records."""
+        events, match_type = self._select_date_events(day)
+        records: List[Dict] = []
+        record_index: Dict[tuple, int] = {}
+        slots: List[int] = []
+        
+        # Events cycle once per minute, and within an event its verses cycle too
+        events = [event for event in events if event.get('verses')]
+        for slot in range(SLOTS_PER_DAY):
+            if events:
+                event_index = slot % len(events)
+                event = events[event_index]
+                verse_index = slot % len(event['verses'])
+                key = (event_index, verse_index)
             else:
-                chapter = 1
-                verse_num = 1
+                # Final fallback: a different fallback verse each minute, repeatable for the day
+                key = ('fallback', random.Random(day.toordinal() * SLOTS_PER_DAY + slot).randrange(len(self.fallback_verses)))
             
-            return {
-                'reference': verse['reference'],
-                'text': verse['text'],
-                'book': book,
-                'chapter': chapter,
-                'verse': verse_num,
-                'is_date_event': True,
-                'event_name': current_event.get('title', f"Biblical Event for {today.strftime('%B %d')}"),
-                'event_description': current_event.get('description', 'Biblical wisdom for today'),
-                'date_match': match_type,
-                'verse_cycle_position': f"{verse_in_event + 1} of {len(available_verses)}",
-                'event_cycle_position': f"{event_index + 1} of {len(selected_events)}",
-                'next_change_minutes': 1 - (now.second // 60),  # 1-minute intervals
-                'current_time': now.strftime('%I:%M %p'),
-                'current_date': now.strftime('%B %d, %Y')
-            }
-        
-        # Ultimate fallback to random verse with date context
-        return self._get_fallback_verse(match_type="fallback")
-    
-    def _get_fallback_verse(self, match_type: str) -> Dict:
-        """Get fallback verse for date mode."""
-        now = datetime.now()
-        today = now.date()
-        
-        fallback = random.choice(self.fallback_verses)
-        fallback['is_date_event'] = True
-        fallback['event_name'] = f"Daily Blessing for {today.strftime('%B %d')}"
-        fallback['event_description'] = "God's word for today"
-        fallback['date_match'] = match_type
-        fallback['verse_cycle_position'] = "1 of 1"
-        fallback['event_cycle_position'] = "1 of 1"
-        fallback['next_change_minutes'] = 5 - (now.minute % 5)
-        
-        return fallback
-    
+            if key not in record_index:
+                if events:
+                    record = self._date_event_record(day, event, event_index, len(events), verse_index, match_type)
+                else:
+                    record = self._date_fallback_record(day, self.fallback_verses[key[1]])
+                record_index[key] = len(records)
+                records.append(record)
+            slots.append(record_index[key])
+        
+        return DateSchedule(day, records, slots, self._date_schedule_checksum())
+    
+    def _date_event_record(self, day: date, event: Dict, event_index: int, event_count: int,
+                           verse_index: int, match_type: str) -> Dict:
+        """Build the display record for one verse of a date event."""
+        verse = event['verses'][verse_index]
+        parts = self.split_reference(verse['reference'])
+        book, chapter, verse_num, end_verse = parts if parts else (verse['reference'], 1, 1, None)
+        
+        record = {
+            'reference': verse['reference'],
+            'text': verse['text'],
+            'book': book,
+            'chapter': chapter,
+            'verse': verse_num,
+            'is_date_event': True,
+            'event_name': event.get('title', f"Biblical Event for {day.strftime('%B %d')}"),
+            'event_description': event.get('description', 'Biblical wisdom for today'),
+            'date_match': match_type,
+            'verse_cycle_position': f"{verse_index + 1} of {len(event['verses'])}",
+            'event_cycle_position': f"{event_index + 1} of {event_count}",
+        }
+        if end_verse:
+            record['end_verse'] = end_verse
+        return record
+    
+    def _date_fallback_record(self, day: date, fallback_verse: Dict) -> Dict:
+        """Build the display record for a fallback verse on a day without events."""
+        record = dict(fallback_verse)
+        record['is_date_event'] = True
+        record['event_name'] = f"Daily Blessing for {day.strftime('%B %d')}"
+        record['event_description'] = "God's word for today"
+        record['date_match'] = 'fallback'
+        record['verse_cycle_position'] = "1 of 1"
+        record['event_cycle_position'] = "1 of 1"
+        return record
+    
+    def _get_date_schedule(self, day: date) -> DateSchedule:
+        """Get a day's schedule from memory, then disk, compiling and saving it if needed."""
+        with self._date_schedule_lock:
+            schedule = self._date_schedules.get(day)
+            if schedule is not None:
+                return schedule
+            
+            schedule = DateSchedule.load(day, self._date_schedule_checksum())
+            if schedule is None:
+                schedule = self._compile_date_schedule(day)
+                try:
+                    schedule.save()
+                except OSError as e:
+                    self.logger.warning(f"Could not save date schedule for {day}: {e}")
+                self.logger.info(f"Compiled date-mode schedule for {day} ({len(schedule.records)} verse records)")
+            
+            # Only today and tomorrow are ever needed
+            self._date_schedules = {d: s for d, s in self._date_schedules.items() if d >= day - timedelta(days=1)}
+            self._date_schedules[day] = schedule
+            return schedule
+    
+    def prepare_date_schedules(self, now: Optional[datetime] = None):
+        """Make sure today's and tomorrow's date-mode schedules are compiled, and drop old ones.
+        
+        Called by the daily maintenance job so tomorrow's schedule is ready before midnight.
+        """
+        today = (now or datetime.now()).date()
+        for day in (today, today + timedelta(days=1)):
+            self._get_date_schedule(day)
+        removed = prune_schedules(keep_from=today)
+        if removed:
+            self.logger.debug(f"Removed {removed} old date-mode schedules")
     
     def _get_verse_from_api_with_translation(self, book: str, chapter: int, verse: int, translation: str) -> Optional[Dict]:
         """Get verse from API with specific translation and validation."""
@@ -704,9 +1102,9 @@ class VerseManager:
         """Get a completely random verse."""
         return random.choice(self.fallback_verses)
     
-    def _get_random_book_summary(self) -> Dict:
+    def _get_random_book_summary(self, now: Optional[datetime] = None) -> Dict:
         """Get a random book summary, using cached summary for pagination within the same minute."""
-        now = datetime.now()
+        now = now or datetime.now()
         current_minute = now.minute
         
         # Check if we need a new book summary (new minute or no cached summary)
@@ -760,35 +1158,16 @@ class VerseManager:
             'time_format': self.time_format  # Include time format for image generator
         }
     
-    def _get_verse_from_api(self, chapter: int, verse: int) -> Optional[Dict]:
+    def _get_verse_from_api(self, chapter: int, verse: int, now: Optional[datetime] = None) -> Optional[Dict]:
         """Get verse from API using systematic book selection and comprehensive validation."""
         if not self.api_url:
             return None
         
         try:
-            # Get all books that have this chapter systematically
-            all_candidate_books = self._get_all_books_with_valid_verse(chapter, verse)
-            
-            if not all_candidate_books:
-                self.logger.debug(f"No books found with valid verse {chapter}:{verse}")
+            selected_book_data = self._select_time_slot_book(chapter, verse, now or datetime.now())
+            if not selected_book_data:
                 return None
             
-            # Prioritize books with exact verse match, then use time-based selection
-            exact_match_books = [book for book in all_candidate_books if book['exact_match']]
-            
-            if exact_match_books:
-                # Use time-based selection among books with exact verse match
-                now = datetime.now()
-                book_index = (now.hour + now.minute) % len(exact_match_books)
-                selected_book_data = exact_match_books[book_index]
-                self.logger.debug(f"Selected exact match: {selected_book_data['book']} {chapter}:{selected_book_data['verse']}")
-            else:
-                # Fall back to any valid book
-                now = datetime.now()
-                book_index = (now.hour + now.minute) % len(all_candidate_books)
-                selected_book_data = all_candidate_books[book_index]
-                self.logger.debug(f"Selected adjusted verse: {selected_book_data['book']} {chapter}:{selected_book_data['verse']} (requested {verse})")
-            
             book = selected_book_data['book']
             actual_verse = selected_book_data['verse']
             
@@ -797,7 +1176,7 @@ class VerseManager:
             url += f"?translation={self.translation}"
             
             try:
-                response = requests.get(url, timeout=self.timeout)
+                response = http_client.get(url, provider='bible-api')
                 response.raise_for_status()
                 
                 data = response.json()
@@ -826,6 +1205,117 @@ class VerseManager:
             self.logger.warning(f"API request failed: {e}")
             return None
     
+    def _select_time_slot_book(self, chapter: int, verse: int, when: datetime) -> Optional[Dict]:
+        """Pick the book shown for a chapter:verse at the given time."""
+        # Get all books that have this chapter from the precomputed slot index
+        all_candidate_books, exact_match_books = self._get_time_slot_candidates(chapter, verse)
+        
+        if not all_candidate_books:
+            self.logger.debug(f"No books found with valid verse {chapter}:{verse}")
+            return None
+        
+        # Prioritize books with exact verse match, then use time-based selection
+        if exact_match_books:
+            # Use time-based selection among books with exact verse match
+            book_index = (when.hour + when.minute) % len(exact_match_books)
+            selected_book_data = exact_match_books[book_index]
+            self.logger.debug(f"Selected exact match: {selected_book_data['book']} {chapter}:{selected_book_data['verse']}")
+        else:
+            # Fall back to any valid book
+            book_index = (when.hour + when.minute) % len(all_candidate_books)
+            selected_book_data = all_candidate_books[book_index]
+            self.logger.debug(f"Selected adjusted verse: {selected_book_data['book']} {chapter}:{selected_book_data['verse']} (requested {verse})")
+        
+        return selected_book_data
+    
+    def _get_verse_from_local_store(self, chapter: int, verse: int, now: Optional[datetime] = None) -> Optional[Dict]:
+        """Resolve the time-mode verse from the local verse store, queueing misses upstream."""
+        selected_book_data = self._select_time_slot_book(chapter, verse, now or datetime.now())
+        if not selected_book_data:
+            return None
+        
+        book = selected_book_data['book']
+        actual_verse = selected_book_data['verse']
+        
+        store = self._get_translation_store(self.translation)
+        verse_text = store.get(book, chapter, actual_verse) if store is not None else None
+        
+        if not verse_text:
+            self.logger.debug(f"{self.translation.upper()} {book} {chapter}:{actual_verse} not stored locally, queueing upstream fetch")
+            self._note_resolution_miss()
+            self._queue_upstream_fetch(book, chapter, actual_verse, self.translation)
+            if self.parallel_mode:
+                # Queue the secondary too so both translations resolve in the same batch
+                self._queue_upstream_fetch(book, chapter, actual_verse, self.secondary_translation)
+            # Until the fetch lands, show the same verse in KJV labelled as such, or the book's summary
+            kjv_text = self.kjv_bible.get(book, chapter, actual_verse) if self.kjv_bible else None
+            if not kjv_text:
+                summary = self._get_time_based_book_summary(book, chapter, verse, now)
+                summary['summary_reason'] = f'{book} {chapter}:{actual_verse} is not stored locally yet'
+                return summary
+            verse_data = self._time_slot_verse(book, chapter, verse, actual_verse, kjv_text)
+            verse_data['translation'] = 'KJV'
+            return verse_data
+        
+        return self._time_slot_verse(book, chapter, verse, actual_verse, verse_text)
+    
+    def _time_slot_verse(self, book: str, chapter: int, verse: int, actual_verse: int, text: str) -> Dict:
+        """Verse data for a time-mode slot; verse is the requested minute."""
+        return {
+            'reference': f"{book} {chapter:02d}:{actual_verse:02d}",
+            'text': text,
+            'book': book,
+            'chapter': chapter,
+            'verse': actual_verse,
+            'original_request': f"{chapter}:{verse}",
+            'adjusted': actual_verse != verse
+        }
+    
+    def _queue_upstream_fetch(self, book: str, chapter: int, verse: int, translation: str):
+        """Queue a verse for the background worker to fetch and store."""
+        if not self.api_url:
+            return
+        
+        key = (translation, book, chapter, verse)
+        with self._upstream_lock:
+            if key in self._upstream_pending:
+                return
+            self._upstream_pending.add(key)
+            
+            if self._upstream_thread is None or not self._upstream_thread.is_alive():
+                self._upstream_thread = threading.Thread(target=self._upstream_worker, daemon=True)
+                self._upstream_thread.start()
+        
+        self._upstream_queue.put(key)
+    
+    def _upstream_worker(self):
+        """Fetch queued verse misses from upstream providers into the local store."""
+        while True:
+            keys = [self._upstream_queue.get()]
+            # Take everything else already queued so the misses go upstream as one batch
+            while True:
+                try:
+                    keys.append(self._upstream_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                results = self.get_verses([((book, chapter, verse), translation)
+                                           for translation, book, chapter, verse in keys])
+                for (translation, book, chapter, verse), result in zip(keys, results):
+                    # Only store real answers for the requested translation, not fallback text
+                    if (result and result.get('text') and
+                            result.get('translation') == translation.upper() and
+                            result.get('api_source') not in ('local_cache', 'fallback_collection', 'absolute_fallback')):
+                        self._cache_translation_verse(book, chapter, verse, result['text'], translation)
+            except Exception as e:
+                self.logger.debug(f"Background fetch failed for {len(keys)} queued verses: {e}")
+            finally:
+                with self._upstream_lock:
+                    self._upstream_pending.difference_update(keys)
+                for _ in keys:
+                    self._upstream_queue.task_done()
+    
     def _get_verse_from_local_data(self, chapter: int, verse: int) -> Optional[Dict]:
         """Get verse from local KJV data."""
         try:
@@ -839,10 +1329,11 @@ class VerseManager:
             # Try each book until we find one with the verse
             random.shuffle(books_with_chapter)  # Randomize the order
             
+            if not self.kjv_bible:
+                return None
+            
             for book in books_with_chapter:
-                book_data = self.kjv_bible.get(book, {})
-                chapter_data = book_data.get(str(chapter), {})
-                verse_text = chapter_data.get(str(verse))
+                verse_text = self.kjv_bible.get(book, chapter, verse)
                 
                 if verse_text:
                     return {
@@ -855,12 +1346,11 @@ class VerseManager:
             
             # If exact verse not found, try to find a verse in the chapter
             for book in books_with_chapter:
-                book_data = self.kjv_bible.get(book, {})
-                chapter_data = book_data.get(str(chapter), {})
+                chapter_data = self.kjv_bible.chapter_verses(book, chapter)
                 
                 if chapter_data:
                     # Get the highest verse number available in this chapter
-                    available_verses = [int(v) for v in chapter_data.keys() if v.isdigit()]
+                    available_verses = list(chapter_data)
                     if available_verses:
                         # Use the verse number closest to what we want, but not exceeding it
                         suitable_verses = [v for v in available_verses if v <= verse]
@@ -869,7 +1359,7 @@ class VerseManager:
                         else:
                             actual_verse = min(available_verses)
                         
-                        verse_text = chapter_data[str(actual_verse)]
+                        verse_text = chapter_data[actual_verse]
                         
                         return {
                             'reference': f"{book} {chapter:02d}:{actual_verse:02d}",
@@ -962,13 +1452,15 @@ class VerseManager:
         }
     
     def get_statistics(self) -> Dict:
-        """Get usage statistics."""
-        stats = self.statistics.copy()
-        stats['books_accessed'] = list(stats['books_accessed'])
+        """Get usage statistics rolled up from the persisted time series."""
+        stats = usage_stats.rollup()
         stats['uptime'] = self.start_time.isoformat()
-        
         return stats
     
+    def save_statistics(self):
+        """Write the usage statistics to disk (they are also saved periodically)."""
+        usage_stats.save()
+    
     def set_display_mode(self, mode: str):
         """Set display mode."""
         if mode in ['time', 'date', 'random']:
@@ -999,19 +1491,37 @@ class VerseManager:
             chapter = verse_data['chapter']
             verse = verse_data['verse']
             
-            # Use the multi-API system to get the secondary translation
-            secondary_verse = self._fetch_verse_from_multi_api(book, chapter, verse, self.secondary_translation)
+            if self.offline_first:
+                # Local store only, like the primary: a miss is fetched in the background
+                # and the primary text renders alone until it lands
+                store = self._get_translation_store(self.secondary_translation)
+                secondary_text = store.get(book, chapter, verse) if store is not None else None
+                if not secondary_text:
+                    self._note_resolution_miss()
+                    self._queue_upstream_fetch(book, chapter, verse, self.secondary_translation)
+                    self.logger.debug(f"{self.secondary_translation.upper()} {book} {chapter}:{verse} not stored locally, "
+                                      f"showing the primary translation alone")
+                    return verse_data
+                secondary_verse = {'text': secondary_text, 'translation': self.secondary_translation.upper()}
+            else:
+                # Use the batch lookup so a local hit skips the fallback chain entirely
+                secondary_verse = self.get_verses([((book, chapter, verse), self.secondary_translation)])[0]
             
             if secondary_verse and secondary_verse.get('text'):
+                if secondary_verse.get('translation', '').upper() != self.secondary_translation.upper():
+                    # Substituted text (e.g. KJV fallback); resolve again on the next prefetch pass
+                    self._note_resolution_miss()
                 verse_data['parallel_mode'] = True
                 verse_data['secondary_text'] = secondary_verse['text']
-                verse_data['primary_translation'] = self.translation.upper()
+                verse_data['primary_translation'] = verse_data.get('translation') or self.translation.upper()
                 verse_data['secondary_translation'] = self.secondary_translation.upper()
                 self.logger.info(f"Added parallel translation: {self.secondary_translation}")
             else:
+                self._note_resolution_miss()
                 self.logger.warning(f"Empty secondary translation for {book} {chapter}:{verse}")
                 
         except Exception as e:
+            self._note_resolution_miss()
             self.logger.warning(f"Failed to get parallel translation {self.secondary_translation}: {e}")
             
             # For translations marked as 'fallback', try KJV as fallback
@@ -1070,134 +1580,477 @@ class VerseManager:
             return 'winter'
 
 
-    def _fetch_verse_from_multi_api(self, book: str, chapter: int, verse: int, translation: str) -> Optional[Dict]:
-        """Fetch verse using hierarchical fallback system for maximum reliability."""
-        if translation not in self.supported_translations:
-            self.logger.warning(f"Unsupported translation: {translation}, falling back to KJV")
-            translation = 'kjv'
+    def _canonical_book(self, book: str) -> Optional[str]:
+        """Resolve a book name (any case, aliases like "Psalm") to its Bible structure name."""
+        if self._book_names is None:
+            names = {alias.lower(): name for alias, name in BOOK_ALIASES.items()}
+            names.update((name.lower(), name) for name in self.bible_structure)
+            self._book_names = names
+        return self._book_names.get(' '.join(str(book).split()).lower())
+    
+    def split_reference(self, reference: str) -> Optional[tuple]:
+        """Split "1 John 4:7-8" into (book, chapter, verse, end verse or None).
+        
+        Known book names are returned in their Bible structure spelling; the
+        reference is not checked against the structure.
+        """
+        match = REFERENCE_PATTERN.match(str(reference))
+        if not match:
+            return None
+        book, chapter, verse, end_verse = match.groups()
+        book = self._canonical_book(book) or ' '.join(book.split())
+        return book, int(chapter), int(verse), int(end_verse) if end_verse else None
+    
+    def parse_reference(self, reference) -> Optional[tuple]:
+        """Parse "John 3:16" or a (book, chapter, verse) tuple into a reference in the Bible structure."""
+        if isinstance(reference, (tuple, list)) and len(reference) == 3:
+            book, chapter, verse = reference
+        else:
+            parts = self.split_reference(reference)
+            if not parts:
+                return None
+            book, chapter, verse, _end_verse = parts
         
-        # Define optimized hierarchical fallback chains for each translation
-        fallback_chains = {
-            # Primary translation - highest reliability (bible-api.com)
-            'kjv': [
-                ('local_cache', 'kjv'),     # Primary: Local cache
-                ('bible-api', 'kjv'),       # Secondary: bible-api.com (reliable)
-                ('wldeh_api', 'kjv')        # Tertiary: wldeh API backup
-            ],
-            
-            # Young's Literal Translation - bible-api.com supported
-            'ylt': [
-                ('local_cache', 'ylt'),     # Primary: Local cache
-                ('bible-api', 'ylt'),       # Secondary: bible-api.com (reliable)
-                ('bible-api', 'kjv')        # Tertiary: KJV fallback
-            ],
-            
-            # Modern copyrighted translations (require scraping/special APIs)
-            'amp': [
-                ('local_cache', 'amp'),     # Primary: Growing local cache
-                ('web_scraping', 'AMP'),    # Secondary: Direct website scraping (BibleGateway)
-                ('bible_scraper', 'AMP'),   # Tertiary: YouVersion scraper
-                ('scripture_api', 'AMP'),   # Quaternary: Scripture API (api.bible)
-                ('biblegateway', 'AMP'),    # Quinary: BibleGateway API (with credentials)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ],
-            'nlt': [
-                ('local_cache', 'nlt'),     # Primary: Growing local cache
-                ('web_scraping', 'NLT'),    # Secondary: Direct web scraping (reliable)
-                ('biblegateway', 'NLT'),    # Tertiary: BibleGateway API
-                ('bible_scraper', 'NLT'),   # Quaternary: YouVersion scraper (may have 404 issues)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ],
-            'msg': [
-                ('local_cache', 'msg'),     # Primary: Growing local cache
-                ('web_scraping', 'MSG'),    # Secondary: Direct web scraping (reliable)
-                ('biblegateway', 'MSG'),    # Tertiary: BibleGateway API
-                ('bible_scraper', 'MSG'),   # Quaternary: YouVersion scraper (may have 404 issues)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ],
-            'esv': [
-                ('local_cache', 'esv'),     # Primary: Growing local cache
-                ('web_scraping', 'ESV'),    # Secondary: Direct web scraping (reliable)
-                ('esv_api', None),          # Tertiary: Official ESV API
-                ('bible_scraper', 'ESV'),   # Quaternary: YouVersion scraper (may have 404 issues)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ],
-            'nasb': [
-                ('local_cache', 'nasb'),        # Primary: Growing local cache
-                ('web_scraping', 'NASB1995'),  # Secondary: Direct web scraping (reliable)
-                ('biblegateway', 'NASB1995'),   # Tertiary: BibleGateway API (NASB 1995)
-                ('bible_scraper', 'NASB1995'),  # Quaternary: YouVersion scraper (may have 404 issues)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ],
-            'cev': [
-                ('local_cache', 'cev'),     # Primary: Growing local cache
-                ('web_scraping', 'CEV'),    # Secondary: Direct website scraping (BibleGateway)
-                ('bible_scraper', 'CEV'),   # Tertiary: YouVersion scraper
-                ('scripture_api', 'CEV'),   # Quaternary: Scripture API (api.bible)
-                ('biblegateway', 'CEV'),    # Quinary: BibleGateway API (with credentials)
-                ('bible-api', 'kjv')        # Final: KJV fallback
-            ]
-        }
+        book = self._canonical_book(book)
+        try:
+            chapter, verse = int(chapter), int(verse)
+        except (TypeError, ValueError):
+            return None
         
-        # Get the fallback chain for this translation
-        chain = fallback_chains.get(translation, [('bible-api', 'kjv')])
+        max_verse = self._get_max_verse_for_chapter(book, chapter) if book else None
+        if not max_verse or not 1 <= verse <= max_verse:
+            return None
+        return book, chapter, verse
+    
+    def get_verses(self, lookups: List[tuple]) -> List[Optional[Dict]]:
+        """Look up several (reference, translation) pairs in one batch.
+        
+        Local hits are answered straight from the verse stores. The misses are
+        grouped by translation and chapter, so each chapter goes upstream once
+        (chapter-capable providers then answer the rest of the group from the
+        store), and the groups are resolved concurrently. Results come back in
+        request order; None marks a reference that could not be parsed or was
+        not found - a batch lookup never substitutes an unrelated verse.
+        """
+        results: List[Optional[Dict]] = [None] * len(lookups)
+        groups: Dict[tuple, List[tuple]] = {}
+        
+        for index, (reference, translation) in enumerate(lookups):
+            parsed = self.parse_reference(reference)
+            if not parsed:
+                self.logger.debug(f"Skipping unrecognised reference: {reference}")
+                continue
+            book, chapter, verse = parsed
+            translation = (translation or self.translation).lower()
+            
+            local = self._fetch_local_verse(book, chapter, verse, translation)
+            if local:
+                results[index] = local
+            else:
+                groups.setdefault((translation, book, chapter), []).append((index, verse))
         
-        for api_source, source_code in chain:
+        if groups:
+            futures = {
+                self._batch_executor.submit(self._resolve_chapter_group, translation, book, chapter,
+                                            sorted({verse for _, verse in members})): members
+                for (translation, book, chapter), members in groups.items()
+            }
+            for future, members in futures.items():
+                try:
+                    resolved = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Batch verse lookup failed: {e}")
+                    continue
+                for index, verse in members:
+                    if resolved.get(verse):
+                        results[index] = dict(resolved[verse])
+        
+        return results
+    
+    # --- Full-text search ---
+    
+    def search_verses(self, query: str, translation: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """Search the locally cached verses of a translation.
+        
+        Words must all appear in a verse; "quoted phrases" must appear in order
+        and a trailing * matches a prefix (e.g. hope*). Only verses already in
+        the translation cache are searched, so no request leaves the device.
+        """
+        source = self.search_index(translation)
+        if source is None:
+            return []
+        translation, index, store = source
+        
+        results = []
+        for verse_id, text in index.search(query, store, limit):
+            book, chapter, verse = self.verse_layout.reference(verse_id)
+            results.append({
+                'reference': f"{book} {chapter}:{verse}",
+                'text': text,
+                'book': book,
+                'chapter': chapter,
+                'verse': verse,
+                'translation': translation.upper(),
+                'source_note': 'Local search'
+            })
+        return results
+    
+    def search_index(self, translation: Optional[str] = None) -> Optional[tuple]:
+        """(translation, index, store) for searching a translation's cache, or None if it is empty."""
+        translation = (translation or self.translation).lower()
+        translation = CACHE_KEY_ALIASES.get(translation, translation)
+        index = self._get_verse_index(translation)
+        store = self.translation_caches.get(translation)
+        if index is None or store is None:
+            return None
+        return translation, index, store
+    
+    def _indexing(self, translation: str) -> Optional[VerseIndex]:
+        """The search index that should see newly cached verses of a translation, if any."""
+        return self.verse_indexes.get(translation) or self._building_indexes.get(translation)
+    
+    def _get_verse_index(self, translation: str) -> Optional[VerseIndex]:
+        """Get the search index for a translation, loading or building it on first use."""
+        index = self.verse_indexes.get(translation)
+        if index is not None:
+            return index
+        store = self._get_translation_store(translation)
+        if store is None or not store.cached_verses:
+            return None
+        
+        with self._index_lock:
+            index = self.verse_indexes.get(translation)
+            if index is not None:
+                return index
+            
+            # Register before filling so verses cached meanwhile reach the index
+            index = VerseIndex(self.verse_layout)
+            self._building_indexes[translation] = index
             try:
-                result = None
-                
-                if api_source == 'local_cache':
-                    result = self._fetch_from_local_cache(book, chapter, verse, source_code)
-                elif api_source == 'local_amp':  # Legacy support
-                    result = self._fetch_from_local_amp(book, chapter, verse)
-                elif api_source == 'local_kjv':  # Legacy support
-                    result = self._fetch_from_local_kjv(book, chapter, verse)
-                elif api_source == 'youversion':
-                    result = self._fetch_from_youversion(book, chapter, verse, source_code)
-                elif api_source == 'web_scraping':
-                    result = self._fetch_from_web_scraping(book, chapter, verse, source_code)
-                elif api_source == 'bible_scraper':
-                    result = self._fetch_from_bible_scraper(book, chapter, verse, source_code)
-                elif api_source == 'wldeh_api':
-                    result = self._fetch_from_wldeh_api(book, chapter, verse, source_code)
-                elif api_source == 'bible-api':
-                    result = self._fetch_from_bible_api(book, chapter, verse, source_code)
-                elif api_source == 'esv_api':
-                    result = self._fetch_from_esv_api(book, chapter, verse)
-                elif api_source == 'scripture_api':
-                    result = self._fetch_from_scripture_api(book, chapter, verse, source_code)
-                elif api_source == 'biblegateway':
-                    result = self._fetch_from_biblegateway_api(book, chapter, verse, source_code)
-                    
-                if result and result.get('text'):
-                    # Add source information for debugging
-                    result['api_source'] = api_source
-                    result['source_translation'] = source_code or translation
-                    
-                    # Add fallback notation if not the original translation
-                    # Special case: treat NASB and NASB1995 as equivalent
-                    is_nasb_equivalent = (
-                        (translation.lower() == 'nasb' and source_code.lower() == 'nasb1995') or
-                        (translation.lower() == 'nasb1995' and source_code.lower() == 'nasb')
-                    )
-                    
-                    if source_code and source_code.lower() != translation.lower() and not is_nasb_equivalent:
-                        result['text'] = f"[{translation.upper()} unavailable - showing {source_code.upper()}] {result['text']}"
-                        result['translation'] = f"{translation.upper()} (fallback: {source_code.upper()})"
-                    else:
-                        result['translation'] = translation.upper()
-                    
-                    self.logger.info(f"Successfully fetched {source_code or translation} verse from {api_source}")
-                    return result
-                    
+                path = store.path.with_suffix('.idx')
+                if not index.load(path, store.cached_verses):
+                    started = monotonic()
+                    index.build(store)
+                    self.logger.info(f"Built {translation.upper()} search index: {index.term_count} terms "
+                                     f"in {monotonic() - started:.1f}s")
+                    self._write_verse_index(translation, index, store)
+                self.verse_indexes[translation] = index
             except Exception as e:
-                self.logger.debug(f"Failed to fetch from {api_source} for {translation}: {e}")
+                self.logger.warning(f"Failed to prepare {translation} search index: {e}")
+                return None
+            finally:
+                self._building_indexes.pop(translation, None)
+        return index
+    
+    def _index_picked_up(self, translation: str, store: VerseStore, verse_ids: List[int]):
+        """Add verses another process stored to the translation's search index.
+        
+        A saved index claims to cover the store's verse count, so verses that
+        reach the store from outside must be indexed before it is next saved.
+        """
+        if not verse_ids:
+            return
+        index = self._indexing(translation)
+        if index is not None:
+            index.add_texts((verse_id, store.get_by_id(verse_id)) for verse_id in verse_ids)
+        self.translation_completion[translation] = self._store_completion(store)
+    
+    def _save_verse_index(self, translation: str):
+        """Persist a translation's search index if it has unsaved verses."""
+        index = self.verse_indexes.get(translation)
+        store = self.translation_caches.get(translation)
+        if index is not None and store is not None and index.dirty:
+            self._write_verse_index(translation, index, store)
+    
+    def _write_verse_index(self, translation: str, index: VerseIndex, store: VerseStore):
+        try:
+            index.save(store.path.with_suffix('.idx'), store.cached_verses)
+        except OSError as e:
+            self.logger.error(f"Failed to save {translation} search index: {e}")
+    
+    def warm_search_index(self):
+        """Load or build the search index for the current translation ahead of the first query."""
+        self._get_verse_index(CACHE_KEY_ALIASES.get(self.translation, self.translation))
+    
+    def _fetch_local_verse(self, book: str, chapter: int, verse: int, translation: str) -> Optional[Dict]:
+        """Answer a lookup from the on-device hops of the translation's fallback chain."""
+        for api_source, source_code in FALLBACK_CHAINS.get(translation, []):
+            if api_source not in LOCAL_SOURCES:
                 continue
+            result = self._fetch_from_source(api_source, source_code, book, chapter, verse, translation)
+            if result:
+                return self._label_source_result(result, api_source, source_code, translation)
+        return None
+    
+    def _resolve_chapter_group(self, translation: str, book: str, chapter: int, verses: List[int]) -> Dict[int, Dict]:
+        """Resolve the missing verses of one chapter, going upstream once where the provider allows."""
+        resolved = {}
+        for verse in verses:
+            # The first fetch stores the whole chapter when the provider serves chapters
+            result = self._fetch_local_verse(book, chapter, verse, translation) if resolved else None
+            resolved[verse] = result or self._fetch_verse_from_multi_api(book, chapter, verse, translation,
+                                                                          fallback=False)
+        return resolved
+    
+    def _fetch_verse_from_multi_api(self, book: str, chapter: int, verse: int, translation: str,
+                                    fallback: bool = True) -> Optional[Dict]:
+        """Fetch verse using hierarchical fallback system for maximum reliability.
+        
+        With fallback=False a verse no source has returns None instead of a
+        stand-in verse from the fallback collection.
+        """
+        if translation not in self.supported_translations:
+            self.logger.warning(f"Unsupported translation: {translation}, falling back to KJV")
+            translation = 'kjv'
+        
+        # Get the fallback chain for this translation
+        chain = FALLBACK_CHAINS.get(translation, [('bible-api', 'kjv')])
+        
+        if self.provider_hedging:
+            result = self._fetch_hedged(chain, book, chapter, verse, translation)
+            if result:
+                return result
+        else:
+            for api_source, source_code in chain:
+                if not self._source_available(api_source, source_code, book, chapter, verse):
+                    continue
+                result = self._fetch_from_source(api_source, source_code, book, chapter, verse, translation)
+                if result:
+                    return self._label_source_result(result, api_source, source_code, translation)
         
         # Final fallback to default verses
         self.logger.warning(f"All API sources failed for {translation} {book} {chapter}:{verse}")
+        if not fallback:
+            return None
         return self._get_final_fallback_verse(book, chapter, verse, translation)
     
+    def _source_available(self, api_source: str, source_code: str, book: str, chapter: int, verse: int) -> bool:
+        """Check whether a fallback-chain hop is worth calling right now."""
+        if api_source in LOCAL_SOURCES:
+            return True
+        
+        # Skip hops that cannot answer: unconfigured, known miss, or circuit open
+        if not self._provider_configured(api_source):
+            return False
+        if provider_health.is_known_miss((api_source, source_code, book, chapter, verse)):
+            self.logger.debug(f"Skipping {api_source}: {source_code} {book} {chapter}:{verse} is a known miss")
+            return False
+        if not provider_health.allow(api_source):
+            self.logger.debug(f"Skipping {api_source}: circuit open")
+            return False
+        return True
+    
+    def _fetch_from_source(self, api_source: str, source_code: str, book: str, chapter: int, verse: int,
+                           translation: str) -> Optional[Dict]:
+        """Fetch a verse from one fallback-chain hop, recording the outcome for remote providers."""
+        remote = api_source not in LOCAL_SOURCES
+        miss_key = (api_source, source_code, book, chapter, verse)
+        if remote:
+            provider_health.begin_call()
+        
+        started = monotonic()
+        try:
+            result = None
+            chapter_answered = False
+            
+            # Pull the whole chapter once so the following minutes are local hits
+            if api_source in CHAPTER_SOURCES:
+                chapter_verses = self._fetch_chapter_from_source(api_source, source_code, book, chapter)
+                if chapter_verses:
+                    chapter_answered = True
+                    if chapter_verses.get(verse):
+                        result = {
+                            'reference': f"{book} {chapter:02d}:{verse:02d}",
+                            'text': chapter_verses[verse],
+                            'book': book,
+                            'chapter': chapter,
+                            'verse': verse,
+                            'translation': (source_code or translation).upper()
+                        }
+                    elif remote:
+                        # The provider returned the chapter without this verse
+                        provider_health.record_not_found()
+            
+            # Single-verse request unless the chapter answered, or the provider just failed
+            # or said the chapter does not exist
+            if not chapter_answered and not (remote and (provider_health.call_failed() or
+                                                         provider_health.call_not_found())):
+                result = self._fetch_verse_from_source_api(api_source, source_code, book, chapter, verse)
+            
+            found = bool(result and result.get('text'))
+            if remote:
+                self._record_provider_outcome(api_source, miss_key, found, monotonic() - started)
+            return result if found else None
+            
+        except Exception as e:
+            if remote:
+                self._record_provider_outcome(api_source, miss_key, False, monotonic() - started, str(e))
+            self.logger.debug(f"Failed to fetch from {api_source} for {translation}: {e}")
+            return None
+    
+    def _fetch_verse_from_source_api(self, api_source: str, source_code: str, book: str, chapter: int,
+                                     verse: int) -> Optional[Dict]:
+        """Fetch a single verse from one fallback-chain hop."""
+        if api_source == 'local_cache':
+            return self._fetch_from_local_cache(book, chapter, verse, source_code)
+        elif api_source == 'local_amp':  # Legacy support
+            return self._fetch_from_local_amp(book, chapter, verse)
+        elif api_source == 'local_kjv':  # Legacy support
+            return self._fetch_from_local_kjv(book, chapter, verse)
+        elif api_source == 'youversion':
+            return self._fetch_from_youversion(book, chapter, verse, source_code)
+        elif api_source == 'web_scraping':
+            return self._fetch_from_web_scraping(book, chapter, verse, source_code)
+        elif api_source == 'bible_scraper':
+            return self._fetch_from_bible_scraper(book, chapter, verse, source_code)
+        elif api_source == 'wldeh_api':
+            return self._fetch_from_wldeh_api(book, chapter, verse, source_code)
+        elif api_source == 'bible-api':
+            return self._fetch_from_bible_api(book, chapter, verse, source_code)
+        elif api_source == 'esv_api':
+            return self._fetch_from_esv_api(book, chapter, verse)
+        elif api_source == 'scripture_api':
+            return self._fetch_from_scripture_api(book, chapter, verse, source_code)
+        elif api_source == 'biblegateway':
+            return self._fetch_from_biblegateway_api(book, chapter, verse, source_code)
+        return None
+    
+    def _is_substitute_source(self, source_code: str, translation: str) -> bool:
+        """Whether a hop returns a different translation than the one requested."""
+        if not source_code or source_code.lower() == translation.lower():
+            return False
+        # Special case: treat NASB and NASB1995 as equivalent
+        return {source_code.lower(), translation.lower()} != {'nasb', 'nasb1995'}
+    
+    def _label_source_result(self, result: Dict, api_source: str, source_code: str, translation: str) -> Dict:
+        """Add source information and fallback notation to a hop's result."""
+        # Add source information for debugging
+        result['api_source'] = api_source
+        result['source_translation'] = source_code or translation
+        
+        # Add fallback notation if not the original translation
+        if self._is_substitute_source(source_code, translation):
+            result['text'] = f"[{translation.upper()} unavailable - showing {source_code.upper()}] {result['text']}"
+            result['translation'] = f"{translation.upper()} (fallback: {source_code.upper()})"
+        else:
+            result['translation'] = translation.upper()
+        
+        self.logger.info(f"Successfully fetched {source_code or translation} verse from {api_source}")
+        return result
+    
+    def _fetch_hedged(self, chain: List, book: str, chapter: int, verse: int, translation: str) -> Optional[Dict]:
+        """Walk the fallback chain with hedged requests under an overall deadline.
+        
+        Local hops run first. Remote hops start one at a time; if the running
+        ones have not answered within hedge_delay (or have all failed), the next
+        hop starts alongside them. The first answer in the requested translation
+        wins; a substitute-translation answer is only used once nothing better
+        is pending. Hops still running at the end are abandoned; their HTTP
+        requests time out at the deadline, so they free their workers then.
+        """
+        deadline = monotonic() + self.provider_deadline
+        remote_hops = []
+        for api_source, source_code in chain:
+            if api_source in LOCAL_SOURCES:
+                result = self._fetch_from_source(api_source, source_code, book, chapter, verse, translation)
+                if result:
+                    return self._label_source_result(result, api_source, source_code, translation)
+            else:
+                remote_hops.append((api_source, source_code))
+        
+        pending = {}
+        substitute = None
+        hops = iter(remote_hops)
+        
+        def launch_next() -> bool:
+            for api_source, source_code in hops:
+                if self._source_available(api_source, source_code, book, chapter, verse):
+                    future = self._hedge_executor.submit(
+                        self._fetch_before_deadline, deadline, api_source, source_code, book, chapter, verse,
+                        translation
+                    )
+                    pending[future] = (api_source, source_code)
+                    return True
+            return False
+        
+        hops_left = launch_next()
+        try:
+            while pending:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    self.logger.warning(f"Provider deadline of {self.provider_deadline}s reached for "
+                                        f"{translation} {book} {chapter}:{verse}")
+                    break
+                
+                done, _ = wait(pending, timeout=min(self.hedge_delay, remaining) if hops_left else remaining,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    api_source, source_code = pending.pop(future)
+                    result = future.result()
+                    if not result:
+                        continue
+                    if not self._is_substitute_source(source_code, translation):
+                        return self._label_source_result(result, api_source, source_code, translation)
+                    if substitute is None:
+                        substitute = (result, api_source, source_code)
+                
+                # Hedge: nothing usable yet, so start the next hop alongside the running ones
+                if hops_left:
+                    hops_left = launch_next()
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        if substitute:
+            return self._label_source_result(*substitute, translation)
+        return None
+    
+    def _fetch_before_deadline(self, deadline: float, api_source: str, source_code: str, book: str, chapter: int,
+                               verse: int, translation: str) -> Optional[Dict]:
+        """Run one hedged hop, with its HTTP requests cut off at the lookup's deadline."""
+        if monotonic() >= deadline:
+            # Queued behind other hops until the lookup was abandoned
+            return None
+        with http_client.deadline(deadline):
+            return self._fetch_from_source(api_source, source_code, book, chapter, verse, translation)
+    
+    def _provider_configured(self, api_source: str) -> bool:
+        """Check whether a provider has the credentials it needs."""
+        if api_source == 'esv_api':
+            return bool(self.esv_api_key)
+        if api_source == 'scripture_api':
+            return bool(self.scripture_api_key)
+        if api_source == 'biblegateway':
+            return bool(self.biblegateway_username and self.biblegateway_password)
+        return True
+    
+    def _record_provider_outcome(self, api_source: str, miss_key: tuple, found: bool,
+                                 latency: float, error: str = None):
+        """Feed a fallback-chain hop's outcome into provider health."""
+        if api_source in HTTP_SOURCES:
+            # http_client recorded transport failures and held the answered requests until now.
+            # Only a provider saying the verse does not exist is a known miss; anything else
+            # unusable counts against its circuit
+            not_found = not found and provider_health.call_not_found()
+            provider_health.settle_call(found or not_found, error or 'No usable verse in response')
+            if not_found and not provider_health.call_failed():
+                provider_health.record_miss(miss_key)
+        else:
+            provider_health.settle_call(found, error or 'No verse returned')
+            if found:
+                provider_health.record_success(api_source, latency)
+            else:
+                provider_health.record_failure(api_source, latency, error or 'No verse returned')
+    
+    def get_provider_status(self) -> Dict:
+        """Get circuit breaker state for the upstream verse providers."""
+        status = provider_health.status()
+        status['unconfigured'] = sorted(
+            source for source in ('esv_api', 'scripture_api', 'biblegateway')
+            if not self._provider_configured(source)
+        )
+        return status
+    
     def _fetch_from_local_amp(self, book: str, chapter: int, verse: int) -> Optional[Dict]:
         """Fetch verse from local AMP Bible file (limited sample data only)."""
         if not hasattr(self, 'amp_bible') or not self.amp_bible:
@@ -1205,11 +2058,8 @@ class VerseManager:
             return None
             
         try:
-            if (book in self.amp_bible and 
-                str(chapter) in self.amp_bible[book] and 
-                str(verse) in self.amp_bible[book][str(chapter)]):
-                
-                amp_text = self.amp_bible[book][str(chapter)][str(verse)]
+            amp_text = self.amp_bible.get(book, chapter, verse)
+            if amp_text:
                 self.logger.info(f"Found AMP verse in limited local data: {book} {chapter}:{verse}")
                 return {
                     'reference': f"{book} {chapter:02d}:{verse:02d}",
@@ -1233,11 +2083,8 @@ class VerseManager:
             return None
             
         try:
-            if (book in self.kjv_bible and 
-                str(chapter) in self.kjv_bible[book] and 
-                str(verse) in self.kjv_bible[book][str(chapter)]):
-                
-                kjv_text = self.kjv_bible[book][str(chapter)][str(verse)]
+            kjv_text = self.kjv_bible.get(book, chapter, verse)
+            if kjv_text:
                 return {
                     'reference': f"{book} {chapter:02d}:{verse:02d}",
                     'text': kjv_text,
@@ -1303,49 +2150,19 @@ class VerseManager:
     def _fetch_from_wldeh_api(self, book: str, chapter: int, verse: int, translation_code: str) -> Optional[Dict]:
         """Fetch verse from wldeh bible-api (free GitHub-hosted API with 200+ versions)."""
         try:
-            import requests
-            
-            # Book name mapping for the wldeh API
-            book_mapping = {
-                'Genesis': 'GEN', 'Exodus': 'EXO', 'Leviticus': 'LEV', 'Numbers': 'NUM',
-                'Deuteronomy': 'DEU', 'Joshua': 'JOS', 'Judges': 'JDG', 'Ruth': 'RUT',
-                '1 Samuel': '1SA', '2 Samuel': '2SA', '1 Kings': '1KI', '2 Kings': '2KI',
-                '1 Chronicles': '1CH', '2 Chronicles': '2CH', 'Ezra': 'EZR', 'Nehemiah': 'NEH',
-                'Esther': 'EST', 'Job': 'JOB', 'Psalms': 'PSA', 'Proverbs': 'PRO',
-                'Ecclesiastes': 'ECC', 'Song of Solomon': 'SNG', 'Isaiah': 'ISA',
-                'Jeremiah': 'JER', 'Lamentations': 'LAM', 'Ezekiel': 'EZE', 'Daniel': 'DAN',
-                'Hosea': 'HOS', 'Joel': 'JOL', 'Amos': 'AMO', 'Obadiah': 'OBA',
-                'Jonah': 'JON', 'Micah': 'MIC', 'Nahum': 'NAH', 'Habakkuk': 'HAB',
-                'Zephaniah': 'ZEP', 'Haggai': 'HAG', 'Zechariah': 'ZEC', 'Malachi': 'MAL',
-                'Matthew': 'MAT', 'Mark': 'MRK', 'Luke': 'LUK', 'John': 'JHN',
-                'Acts': 'ACT', 'Romans': 'ROM', '1 Corinthians': '1CO', '2 Corinthians': '2CO',
-                'Galatians': 'GAL', 'Ephesians': 'EPH', 'Philippians': 'PHP', 'Colossians': 'COL',
-                '1 Thessalonians': '1TH', '2 Thessalonians': '2TH', '1 Timothy': '1TI',
-                '2 Timothy': '2TI', 'Titus': 'TIT', 'Philemon': 'PHM', 'Hebrews': 'HEB',
-                'James': 'JAS', '1 Peter': '1PE', '2 Peter': '2PE', '1 John': '1JN',
-                '2 John': '2JN', '3 John': '3JN', 'Jude': 'JUD', 'Revelation': 'REV'
-            }
-            
-            book_code = book_mapping.get(book, book.upper()[:3])
-            
-            # Translation mapping for wldeh API (they use specific codes)
-            wldeh_translation_map = {
-                'web': 'engWEB2019eb',  # World English Bible
-                'kjv': 'engKJV1611',     # King James Version 
-                'asv': 'engASV1901',     # American Standard Version
-            }
-            
-            api_translation = wldeh_translation_map.get(translation_code.lower(), 'engWEB2019eb')
+            book_code = WLDEH_BOOK_CODES.get(book, book.upper()[:3])
+            api_translation = WLDEH_TRANSLATIONS.get(translation_code.lower(), 'engWEB2019eb')
             
             url = f"https://cdn.jsdelivr.net/gh/wldeh/bible-api/bibles/{api_translation}/books/{book_code}/chapters/{chapter}/verses/{verse}.json"
             
-            response = requests.get(url, timeout=self.timeout)
+            response = http_client.get(url, provider='wldeh_api')
             response.raise_for_status()
             
             data = response.json()
             verse_text = data.get('text', '').strip()
             
             if not verse_text:
+                provider_health.record_not_found()
                 return None
             
             return {
@@ -1363,145 +2180,36 @@ class VerseManager:
             return None
     
     def _fetch_from_bible_scraper(self, book: str, chapter: int, verse: int, translation_code: str) -> Optional[Dict]:
-        """Fetch verse using IonicaBizau/bible-scraper for YouVersion scraping."""
+        """Fetch verse using IonicaBizau/bible-scraper for YouVersion scraping (via the Node.js sidecar)."""
         self.logger.info(f"Attempting to scrape {translation_code} verse: {book} {chapter}:{verse}")
         try:
-            import subprocess
-            import json
-            import tempfile
-            import os
+            output = self._get_scraper_sidecar().verse(translation_code, f"{book} {chapter}:{verse}", timeout=self.timeout)
+            self.logger.debug(f"Scraper output: {output}")
             
-            # Check if Node.js and npm are available
-            try:
-                node_result = subprocess.run(['node', '--version'], capture_output=True, check=True)
-                self.logger.debug(f"Node.js version: {node_result.stdout.decode().strip()}")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self.logger.warning("Node.js not available for bible-scraper")
-                return None
-            
-            # Create a temporary directory for bible-scraper
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Create a simple Node.js script to use bible-scraper
-                scraper_script = f"""
-const BibleScraper = require('bible-scraper');
-
-async function getVerse() {{
-    try {{
-        // YouVersion translation IDs for web scraping
-        const translationId = {{
-            'AMP': 1588,
-            'NLT': 116,
-            'MSG': 97,
-            'ESV': 59,
-            'NASB': 100,        // NASB 1995
-            'NASB1995': 100,    // NASB 1995 (alternative name)
-            'NASB2020': 2692,   // NASB 2020
-            'NIV': 111,         // NIV (existing)
-            'CEV': 392          // Contemporary English Version
-        }};
-        const id = translationId['{translation_code}'] || 1588;
-        
-        const scraper = new BibleScraper(id);
-        const reference = '{book} {chapter}:{verse}';
-        const result = await scraper.verse(reference);
-        
-        console.log(JSON.stringify({{
-            success: true,
-            data: result
-        }}));
-    }} catch (error) {{
-        console.log(JSON.stringify({{
-            success: false,
-            error: error.message
-        }}));
-    }}
-}}
-
-getVerse();
-"""
-                
-                script_path = os.path.join(temp_dir, 'scraper.js')
-                package_json = os.path.join(temp_dir, 'package.json')
-                
-                # Create package.json
-                with open(package_json, 'w') as f:
-                    json.dump({
-                        "name": "bible-scraper-temp",
-                        "version": "1.0.0",
-                        "dependencies": {
-                            "bible-scraper": "latest"
-                        }
-                    }, f)
-                
-                # Write the scraper script
-                with open(script_path, 'w') as f:
-                    f.write(scraper_script)
-                
-                # Install bible-scraper (this might take a moment on first run)
-                self.logger.debug(f"Installing bible-scraper npm package for {translation_code}")
-                install_result = subprocess.run(
-                    ['npm', 'install'], 
-                    cwd=temp_dir,
-                    capture_output=True,
-                    timeout=30
-                )
+            if output.get('success') and output.get('data'):
+                verse_text = output['data'].get('text', '').strip()
                 
-                if install_result.returncode != 0:
-                    self.logger.warning(f"Failed to install bible-scraper npm package: {install_result.stderr.decode()}")
-                    return None
-                else:
-                    self.logger.debug("bible-scraper npm package installed successfully")
-                
-                # Run the scraper script
-                result = subprocess.run(
-                    ['node', script_path],
-                    cwd=temp_dir,
-                    capture_output=True,
-                    timeout=self.timeout,
-                    text=True
-                )
-                
-                self.logger.debug(f"Scraper result code: {result.returncode}")
-                if result.stdout:
-                    self.logger.debug(f"Scraper stdout: {result.stdout}")
-                if result.stderr:
-                    self.logger.debug(f"Scraper stderr: {result.stderr}")
-                
-                if result.returncode == 0:
-                    try:
-                        output = json.loads(result.stdout.strip())
-                        self.logger.debug(f"Scraper JSON output: {output}")
-                        
-                        if output.get('success') and output.get('data'):
-                            verse_data = output['data']
-                            verse_text = verse_data.get('text', '').strip()
-                            
-                            if verse_text:
-                                self.logger.info(f"Successfully scraped {translation_code} verse: {verse_text[:100]}...")
-                                # Cache the verse for any translation
-                                self._cache_translation_verse(book, chapter, verse, verse_text, translation_code.lower())
-                                
-                                return {
-                                    'reference': f"{book} {chapter:02d}:{verse:02d}",
-                                    'text': verse_text,
-                                    'book': book,
-                                    'chapter': chapter,
-                                    'verse': verse,
-                                    'translation': translation_code.upper(),
-                                    'api_source': 'bible_scraper_youversion'
-                                }
-                            else:
-                                self.logger.warning(f"bible-scraper returned empty text for {translation_code}")
-                        else:
-                            self.logger.warning(f"bible-scraper returned unsuccessful result: {output}")
-                    except json.JSONDecodeError as je:
-                        self.logger.error(f"Failed to parse scraper JSON output: {je}")
-                        self.logger.error(f"Raw output: {result.stdout}")
+                if verse_text:
+                    self.logger.info(f"Successfully scraped {translation_code} verse: {verse_text[:100]}...")
+                    # Cache the verse for any translation
+                    self._cache_translation_verse(book, chapter, verse, verse_text, translation_code.lower())
+                    
+                    return {
+                        'reference': f"{book} {chapter:02d}:{verse:02d}",
+                        'text': verse_text,
+                        'book': book,
+                        'chapter': chapter,
+                        'verse': verse,
+                        'translation': translation_code.upper(),
+                        'api_source': 'bible_scraper_youversion'
+                    }
                 else:
-                    self.logger.warning(f"bible-scraper script failed with code {result.returncode}: {result.stderr}")
+                    self.logger.warning(f"bible-scraper returned empty text for {translation_code}")
+            else:
+                self.logger.warning(f"bible-scraper returned unsuccessful result: {output}")
                     
-        except subprocess.TimeoutExpired:
-            self.logger.warning(f"bible-scraper timed out for {translation_code}")
+        except SidecarError as e:
+            self.logger.warning(f"bible-scraper unavailable for {translation_code}: {e}")
         except Exception as e:
             self.logger.error(f"bible-scraper fetch failed for {translation_code}: {e}")
             
@@ -1538,13 +2246,14 @@ getVerse();
         # Always add translation parameter - bible-api.com default is NOT KJV
         url += f"?translation={translation_code}"
         
-        response = requests.get(url, timeout=self.timeout)
+        response = http_client.get(url, provider='bible-api')
         response.raise_for_status()
         
         data = response.json()
         verse_text = data.get('text', '').strip()
         
         if not verse_text:
+            provider_health.record_not_found()
             return None
         
         # Cache the successful result
@@ -1559,6 +2268,183 @@ getVerse();
             'translation': translation_code.upper()
         }
     
+    def chapter_sources(self, translation: str) -> List[tuple]:
+        """Remote hops that can fetch a whole chapter of the translation itself (no substitutes)."""
+        return [
+            (api_source, source_code) for api_source, source_code in FALLBACK_CHAINS.get(translation, [])
+            if api_source in CHAPTER_SOURCES and not self._is_substitute_source(source_code, translation)
+        ]
+    
+    def source_ready(self, api_source: str) -> bool:
+        """Check whether a provider is configured and its circuit would let a request through."""
+        return self._provider_configured(api_source) and provider_health.breaker(api_source).available()
+    
+    def fetch_chapter(self, api_source: str, source_code: str, book: str, chapter: int) -> Optional[Dict[int, str]]:
+        """Fetch a whole chapter from one provider into the translation cache.
+        
+        Returns the verses; an empty dict when the provider reported the chapter
+        missing; None when it could not be asked or failed (worth retrying).
+        """
+        if not self._provider_configured(api_source) or not provider_health.allow(api_source):
+            return None
+        provider_health.begin_call()
+        verses = None
+        try:
+            verses = self._fetch_chapter_from_source(api_source, source_code, book, chapter)
+        finally:
+            not_found = not verses and provider_health.call_not_found()
+            provider_health.settle_call(bool(verses) or not_found, 'No usable chapter in response')
+        return verses if verses else ({} if not_found else None)
+    
+    def translation_store(self, translation: str) -> Optional[VerseStore]:
+        """The verse store backing a translation cache, opened on first use."""
+        return self._get_translation_store(translation.lower())
+    
+    def cache_chapter(self, translation: str, book: str, chapter: int, verses: Dict[int, str]) -> int:
+        """Add a chapter obtained elsewhere (e.g. a bulk download) to a translation cache."""
+        return self._cache_translation_chapter(book, chapter, verses, translation.lower())
+    
+    def is_chapter_cached(self, translation: str, book: str, chapter: int) -> bool:
+        """Check whether every verse of a chapter is in the translation cache (no verse text is read)."""
+        store = self._get_translation_store(CACHE_KEY_ALIASES.get(translation, translation))
+        return store is not None and store.chapter_complete(book, chapter)
+    
+    def _fetch_chapter_from_source(self, api_source: str, source_code: str, book: str, chapter: int) -> Optional[Dict[int, str]]:
+        """Fetch a whole chapter from a provider and bulk-cache it.
+        
+        Returns verse number -> text, or None if the chapter could not be fetched
+        (the caller then falls back to a single-verse request).
+        """
+        try:
+            if api_source == 'bible-api':
+                verses = self._fetch_chapter_from_bible_api(book, chapter, source_code)
+                cache_translation = source_code.lower()
+            elif api_source == 'wldeh_api':
+                verses = self._fetch_chapter_from_wldeh_api(book, chapter, source_code)
+                # Unmapped translations are served as WEB, which must not land in their cache
+                cache_translation = source_code.lower() if source_code.lower() in WLDEH_TRANSLATIONS else None
+            elif api_source == 'esv_api':
+                verses = self._fetch_chapter_from_esv_api(book, chapter)
+                cache_translation = 'esv'
+            elif api_source == 'web_scraping':
+                verses = self._fetch_chapter_from_web_scraping(book, chapter, source_code)
+                cache_translation = source_code.lower()
+            else:
+                return None
+        except Exception as e:
+            self.logger.debug(f"Chapter fetch from {api_source} failed for {book} {chapter}: {e}")
+            return None
+        
+        if not verses:
+            return None
+        
+        if cache_translation:
+            self._cache_translation_chapter(book, chapter, verses, cache_translation)
+        self.logger.info(f"Fetched {len(verses)} verses of {book} {chapter} ({source_code}) from {api_source}")
+        return verses
+    
+    def _fetch_chapter_from_bible_api(self, book: str, chapter: int, translation_code: str) -> Dict[int, str]:
+        """Fetch a chapter from bible-api.com."""
+        url = f"{self.api_url}/{book} {chapter}?translation={translation_code}"
+        
+        response = http_client.get(url, provider='bible-api')
+        response.raise_for_status()
+        
+        verses = {}
+        for entry in response.json().get('verses', []):
+            text = (entry.get('text') or '').strip()
+            if text and entry.get('chapter', chapter) == chapter:
+                verses[int(entry['verse'])] = text
+        return verses
+    
+    def _fetch_chapter_from_wldeh_api(self, book: str, chapter: int, translation_code: str) -> Dict[int, str]:
+        """Fetch a chapter from the wldeh bible-api."""
+        book_code = WLDEH_BOOK_CODES.get(book, book.upper()[:3])
+        api_translation = WLDEH_TRANSLATIONS.get(translation_code.lower(), 'engWEB2019eb')
+        url = f"https://cdn.jsdelivr.net/gh/wldeh/bible-api/bibles/{api_translation}/books/{book_code}/chapters/{chapter}.json"
+        
+        response = http_client.get(url, provider='wldeh_api')
+        response.raise_for_status()
+        
+        verses = {}
+        for entry in response.json().get('data', []):
+            text = (entry.get('text') or '').strip()
+            if text:
+                verses[int(entry['verse'])] = text
+        return verses
+    
+    def _fetch_chapter_from_esv_api(self, book: str, chapter: int) -> Dict[int, str]:
+        """Fetch a chapter from the ESV API, splitting the passage on its [n] verse numbers."""
+        import re
+        
+        url = "https://api.esv.org/v3/passage/text/"
+        headers = {
+            'Authorization': f'Token {self.esv_api_key}'
+        }
+        params = {
+            'q': f'{book} {chapter}',
+            'format': 'json',
+            'include-headings': False,
+            'include-footnotes': False,
+            'include-verse-numbers': True,
+            'include-first-verse-numbers': True,
+            'include-short-copyright': False,
+            'include-passage-references': False
+        }
+        
+        response = http_client.get(url, headers=headers, params=params, provider='esv_api')
+        response.raise_for_status()
+        
+        passages = response.json().get('passages', [])
+        if not passages:
+            return {}
+        
+        verses = {}
+        for number, text in re.findall(r'\[(\d+)\]\s*(.*?)(?=\[\d+\]|$)', passages[0], re.DOTALL):
+            text = re.sub(r'\s+', ' ', text).strip()
+            if text:
+                verses[int(number)] = text
+        return verses
+    
+    def _fetch_chapter_from_web_scraping(self, book: str, chapter: int, translation_code: str) -> Optional[Dict[int, str]]:
+        """Scrape a whole chapter from BibleGateway (one page instead of one page per verse)."""
+        import re
+        try:
+            from bs4 import BeautifulSoup
+        except ImportError:
+            # The regex scraper only handles single verses
+            return None
+        
+        url = f"https://www.biblegateway.com/passage/?search={book} {chapter}&version={translation_code}"
+        response = http_client.get(url, provider='web_scraping')
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.content, 'html.parser')
+        passage_content = soup.find('div', class_='passage-content')
+        if not passage_content:
+            return {}
+        
+        # Drop headings, footnotes, cross references and verse/chapter numbers
+        for tag in passage_content.select('h3, h4, sup.footnote, sup.crossreference, div.footnotes, '
+                                          'div.crossrefs, span.chapternum, sup.versenum'):
+            tag.decompose()
+        
+        # Verse text spans carry a class like "John-3-16"; poetry splits a verse over several spans
+        parts = {}
+        for span in passage_content.find_all('span', class_='text'):
+            for css_class in span.get('class', []):
+                match = re.match(r'^.+-(\d+)-(\d+)$', css_class)
+                if match and int(match.group(1)) == chapter:
+                    parts.setdefault(int(match.group(2)), []).append(span.get_text(' '))
+                    break
+        
+        verses = {}
+        for number, texts in parts.items():
+            text = re.sub(r'\s+', ' ', ' '.join(texts)).strip()
+            if text:
+                verses[number] = text
+        return verses
+    
     def _fetch_from_esv_api(self, book: str, chapter: int, verse: int) -> Optional[Dict]:
         """Fetch verse from ESV API."""
         if not self.esv_api_key:
@@ -1579,17 +2465,16 @@ getVerse();
             'include-passage-references': False
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+        response = http_client.get(url, headers=headers, params=params, provider='esv_api')
         response.raise_for_status()
         
         data = response.json()
         passages = data.get('passages', [])
-        if not passages:
+        if not passages or not passages[0].strip():
+            provider_health.record_not_found()
             return None
         
         verse_text = passages[0].strip()
-        if not verse_text:
-            return None
         
         # Cache the successful ESV result
         self._cache_translation_verse(book, chapter, verse, verse_text, 'esv')
@@ -1608,8 +2493,8 @@ getVerse();
         # First, try to get verse from local AMP Bible
         if hasattr(self, 'amp_bible') and self.amp_bible:
             try:
-                if book in self.amp_bible and str(chapter) in self.amp_bible[book] and str(verse) in self.amp_bible[book][str(chapter)]:
-                    amp_text = self.amp_bible[book][str(chapter)][str(verse)]
+                amp_text = self.amp_bible.get(book, chapter, verse)
+                if amp_text:
                     return {
                         'reference': f"{book} {chapter:02d}:{verse:02d}",
                         'text': amp_text,
@@ -1653,7 +2538,7 @@ getVerse();
             'include-verse-numbers': 'false'
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+        response = http_client.get(url, headers=headers, params=params, provider='scripture_api')
         response.raise_for_status()
         
         data = response.json()
@@ -1692,7 +2577,7 @@ getVerse();
                 'translation-list': translation_code
             }
             
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_client.get(url, params=params, provider='biblegateway')
             response.raise_for_status()
             
             data = response.json()
@@ -1732,7 +2617,7 @@ getVerse();
                 'password': self.biblegateway_password
             }
             
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_client.get(url, params=params, provider='biblegateway')
             response.raise_for_status()
             
             data = response.json()
@@ -1751,7 +2636,6 @@ getVerse();
     def _fetch_from_web_scraping(self, book: str, chapter: int, verse: int, translation_code: str) -> Optional[Dict]:
         """Fetch verse by scraping Bible websites directly."""
         try:
-            import requests
             try:
                 from bs4 import BeautifulSoup
                 has_bs4 = True
@@ -1771,7 +2655,7 @@ getVerse();
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = http_client.get(url, headers=headers, provider='web_scraping')
             response.raise_for_status()
             
             verse_text = None
@@ -1898,7 +2782,7 @@ getVerse();
             # First, we need to find the Bible ID for AMP translation
             # This is a simplified approach - in practice you'd cache these IDs
             bibles_url = f"{base_url}/bibles"
-            response = requests.get(bibles_url, headers=headers, timeout=self.timeout)
+            response = http_client.get(bibles_url, headers=headers, provider='scripture_api')
             response.raise_for_status()
             
             bibles_data = response.json()
@@ -1933,7 +2817,7 @@ getVerse();
                 'include-verse-numbers': 'false'
             }
             
-            response = requests.get(verse_url, headers=headers, params=params, timeout=self.timeout)
+            response = http_client.get(verse_url, headers=headers, params=params, provider='scripture_api')
             response.raise_for_status()
             
             data = response.json()
@@ -2026,71 +2910,26 @@ getVerse();
             'cev': 'Contemporary English Version (CEV)'
         }
     
-    def _rotate_daily_activity(self):
-        """Rotate daily activity data to keep only recent days."""
-        if len(self.statistics['daily_activity']) <= self.MAX_DAILY_ACTIVITY_DAYS:
-            return
-        
-        # Sort dates and keep only the most recent ones
-        sorted_dates = sorted(self.statistics['daily_activity'].keys())
-        excess_count = len(sorted_dates) - self.MAX_DAILY_ACTIVITY_DAYS
-        
-        for old_date in sorted_dates[:excess_count]:
-            del self.statistics['daily_activity'][old_date]
-        
-        self.logger.debug(f"Rotated daily activity: removed {excess_count} old entries")
-    
-    def _rotate_books_accessed(self):
-        """Limit books_accessed set size to prevent memory growth."""
-        if len(self.statistics['books_accessed']) > self.MAX_BOOKS_ACCESSED:
-            # Convert to list, sort, and keep only recent ones
-            # Since it's a set, we'll just trim to the limit
-            books_list = list(self.statistics['books_accessed'])
-            # Keep random subset to maintain variety
-            import random
-            random.shuffle(books_list)
-            self.statistics['books_accessed'] = set(books_list[:self.MAX_BOOKS_ACCESSED])
-            self.logger.debug(f"Rotated books accessed: trimmed to {self.MAX_BOOKS_ACCESSED} entries")
-    
-    def _rotate_translation_usage(self):
-        """Limit translation_usage dict size to prevent memory growth."""
-        if len(self.statistics['translation_usage']) > self.MAX_TRANSLATION_USAGE:
-            # Sort by usage count and keep the most used ones
-            sorted_translations = sorted(
-                self.statistics['translation_usage'].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            
-            # Keep only the top translations
-            self.statistics['translation_usage'] = dict(sorted_translations[:self.MAX_TRANSLATION_USAGE])
-            removed_count = len(sorted_translations) - self.MAX_TRANSLATION_USAGE
-            self.logger.debug(f"Rotated translation usage: removed {removed_count} entries")
-
     def _fetch_from_local_cache(self, book: str, chapter: int, verse: int, translation: str) -> Optional[Dict]:
         """Fetch verse from local translation cache."""
-        if not hasattr(self, 'translation_caches') or translation not in self.translation_caches:
+        store = self._get_translation_store(translation)
+        if store is None:
             self.logger.debug(f"No local cache available for {translation}")
             return None
             
         try:
-            cache = self.translation_caches[translation]
-            if (book in cache and 
-                str(chapter) in cache[book] and 
-                str(verse) in cache[book][str(chapter)]):
-                
-                verse_text = cache[book][str(chapter)][str(verse)]
-                if verse_text and verse_text.strip():
-                    self.logger.debug(f"Found {translation.upper()} verse in local cache: {book} {chapter}:{verse}")
-                    return {
-                        'reference': f"{book} {chapter:02d}:{verse:02d}",
-                        'text': verse_text.strip(),
-                        'book': book,
-                        'chapter': chapter,
-                        'verse': verse,
-                        'translation': translation.upper(),
-                        'source_note': 'Local cache'
-                    }
+            verse_text = store.get(book, chapter, verse)
+            if verse_text:
+                self.logger.debug(f"Found {translation.upper()} verse in local cache: {book} {chapter}:{verse}")
+                return {
+                    'reference': f"{book} {chapter:02d}:{verse:02d}",
+                    'text': verse_text,
+                    'book': book,
+                    'chapter': chapter,
+                    'verse': verse,
+                    'translation': translation.upper(),
+                    'source_note': 'Local cache'
+                }
             else:
                 self.logger.debug(f"{translation.upper()} verse not in local cache: {book} {chapter}:{verse}")
                 
@@ -2103,31 +2942,23 @@ getVerse();
         if not self.translation_cache_enabled or not text or not text.strip():
             return False
         
-        if not hasattr(self, 'translation_caches'):
-            self.translation_caches = {}
-        
-        if translation not in self.translation_caches:
-            self.translation_caches[translation] = {}
+        translation = CACHE_KEY_ALIASES.get(translation, translation)
+        store = self._get_translation_store(translation)
+        if store is None:
+            return False
         
         try:
-            # Ensure the structure exists
-            cache = self.translation_caches[translation]
-            if book not in cache:
-                cache[book] = {}
-            if str(chapter) not in cache[book]:
-                cache[book][str(chapter)] = {}
-            
-            # Only cache if we don't already have this verse
-            if str(verse) not in cache[book][str(chapter)]:
-                cache[book][str(chapter)][str(verse)] = text.strip()
-                
-                # Save to file immediately (to persist across restarts)
-                self._save_translation_cache(translation)
+            # Only cache if we don't already have this verse; the store journals it
+            if store.add(book, chapter, verse, text):
+                self._ensure_cache_writer()
+                index = self._indexing(translation)
+                if index is not None:
+                    index.add(book, chapter, verse, text.strip())
                 
-                # Update completion percentage
+                # Update completion percentage from the store's verse count
                 old_completion = self.translation_completion.get(translation, 0.0)
-                self.translation_completion = self._calculate_all_translation_completion()
-                new_completion = self.translation_completion.get(translation, 0.0)
+                new_completion = self._store_completion(store)
+                self.translation_completion[translation] = new_completion
                 
                 if new_completion > old_completion:
                     self.logger.info(f"{translation.upper()} Bible cache updated: {book} {chapter}:{verse} - "
@@ -2139,46 +2970,121 @@ getVerse();
         
         return False
     
+    def _cache_translation_chapter(self, book: str, chapter: int, verses: Dict[int, str], translation: str) -> int:
+        """Bulk-cache the verses of a chapter. Returns how many were new."""
+        if not self.translation_cache_enabled or not verses:
+            return 0
+        
+        translation = CACHE_KEY_ALIASES.get(translation, translation)
+        store = self._get_translation_store(translation)
+        if store is None:
+            return 0
+        
+        try:
+            added = store.add_many(book, chapter, verses)
+            if added:
+                self._ensure_cache_writer()
+                index = self._indexing(translation)
+                if index is not None:
+                    index.add_chapter(book, chapter, {verse: text.strip() for verse, text in verses.items()})
+                self.translation_completion[translation] = self._store_completion(store)
+                self.logger.info(f"{translation.upper()} Bible cache updated: {book} {chapter} (+{added} verses) - "
+                                 f"completion now {self.translation_completion[translation]:.1f}%")
+            return added
+        except Exception as e:
+            self.logger.error(f"Failed to cache {translation} chapter {book} {chapter}: {e}")
+        return 0
+    
     def _save_translation_cache(self, translation: str):
-        """Save a specific translation cache to file."""
+        """Save a specific translation cache, compacting its journal into the verse store file."""
         try:
-            # Handle special case for NASB which uses nasb1995 file
-            file_name = translation
-            if translation == 'nasb':
-                file_name = 'nasb1995'
-            
-            cache_path = Path(f'data/translations/bible_{file_name}.json')
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(cache_path, 'w') as f:
-                json.dump(self.translation_caches[translation], f, indent=2)
+            store = self.translation_caches.get(translation)
+            if store is not None:
+                self._index_picked_up(translation, store, store.compact())
+                self._save_verse_index(translation)
             
         except Exception as e:
             self.logger.error(f"Failed to save {translation} cache: {e}")
     
+    def _get_scraper_sidecar(self) -> ScraperSidecar:
+        """The shared bible-scraper sidecar, created once even under concurrent lookups."""
+        sidecar = self._scraper_sidecar
+        if sidecar is None:
+            with self._scraper_sidecar_lock:
+                if self._scraper_sidecar_closed:
+                    raise SidecarError("bible-scraper sidecar is shut down")
+                if self._scraper_sidecar is None:
+                    self._scraper_sidecar = ScraperSidecar()
+                sidecar = self._scraper_sidecar
+        return sidecar
+    
+    def close_scraper_sidecar(self):
+        """Stop the bible-scraper sidecar process if it is running."""
+        with self._scraper_sidecar_lock:
+            # Lookups still in flight on the executors must not start a new process
+            self._scraper_sidecar_closed = True
+            sidecar, self._scraper_sidecar = self._scraper_sidecar, None
+        if sidecar:
+            sidecar.close()
+    
+    def save_translation_caches(self):
+        """Stop the background cache writer and compact every translation journal."""
+        self._cache_writer_stop.set()
+        if self._cache_writer_thread:
+            self._cache_writer_thread.join(timeout=1)
+        for translation in list(self.translation_caches):
+            self._save_translation_cache(translation)
+    
+    def _ensure_cache_writer(self):
+        """Start the background cache writer if it is not running."""
+        with self._cache_writer_lock:
+            if self._cache_writer_thread is None or not self._cache_writer_thread.is_alive():
+                self._cache_writer_stop.clear()
+                self._cache_writer_thread = threading.Thread(target=self._cache_writer, daemon=True)
+                self._cache_writer_thread.start()
+    
+    def _cache_writer(self):
+        """Sync translation journals in batches and compact them in the background."""
+        last_compaction = datetime.now()
+        while not self._cache_writer_stop.wait(self.JOURNAL_SYNC_INTERVAL):
+            compaction_due = (datetime.now() - last_compaction).total_seconds() >= self.JOURNAL_COMPACT_INTERVAL
+            for translation, store in list(self.translation_caches.items()):
+                try:
+                    # Pick up verses another process (downloader, voice assistant) stored
+                    self._index_picked_up(translation, store, store.refresh())
+                    store.sync()
+                    journaled = store.journal_entries
+                    if journaled >= self.JOURNAL_COMPACT_ENTRIES or (compaction_due and journaled):
+                        self._index_picked_up(translation, store, store.compact())
+                        self._save_verse_index(translation)
+                        self.logger.info(f"Compacted {journaled} journaled {translation.upper()} verses into the verse store")
+                except Exception as e:
+                    self.logger.error(f"Failed to write {translation} cache: {e}")
+            if compaction_due:
+                last_compaction = datetime.now()
+    
+    def _store_completion(self, store: VerseStore) -> float:
+        """Completion percentage of a verse store."""
+        total_verses = self._get_total_bible_verses()
+        return (store.cached_verses / total_verses * 100.0) if total_verses > 0 else 0.0
+    
     def _calculate_all_translation_completion(self) -> Dict[str, float]:
-        """Calculate completion percentage for all translations."""
-        if not self.bible_structure or not hasattr(self, 'translation_caches'):
+        """Calculate completion percentage for all translations.
+        
+        Stores that are not open yet are estimated from their file headers so
+        startup does not open every translation.
+        """
+        if not self.bible_structure or getattr(self, 'verse_layout', None) is None:
             return {}
         
-        completion = {}
         total_verses = self._get_total_bible_verses()
-        
-        for translation in self.translation_caches:
-            cached_verses = 0
-            cache = self.translation_caches[translation]
-            
-            # Count cached verses for this translation
-            for book in self.available_books:
-                if book in cache:
-                    for chapter_str in cache[book]:
-                        chapter_data = cache[book][chapter_str]
-                        for verse_str, verse_text in chapter_data.items():
-                            if verse_text and verse_text.strip():
-                                cached_verses += 1
-            
-            completion[translation] = (cached_verses / total_verses * 100.0) if total_verses > 0 else 0.0
-        
+        completion = {}
+        for translation in self.CACHEABLE_TRANSLATIONS:
+            store = self.translation_caches.get(translation)
+            if store is not None:
+                completion[translation] = self._store_completion(store)
+            elif total_verses > 0:
+                completion[translation] = peek_cached_verses(translation, self.verse_layout) / total_verses * 100.0
         return completion
     
     def _get_total_bible_verses(self) -> int:
@@ -2186,12 +3092,15 @@ getVerse();
         if not self.bible_structure:
             return 31100  # Approximate Bible verse count
         
-        total = 0
-        for book in self.bible_structure:
-            if book in self.available_books:
-                for chapter_str, verse_count in self.bible_structure[book].items():
-                    total += verse_count
-        return total
+        # Structure and book list are fixed after startup, so count once
+        if self._total_bible_verses is None:
+            total = 0
+            for book in self.bible_structure:
+                if book in self.available_books:
+                    for chapter_str, verse_count in self.bible_structure[book].items():
+                        total += verse_count
+            self._total_bible_verses = total
+        return self._total_bible_verses
     
     def _format_completion_summary(self) -> str:
         """Format a summary of translation completion percentages."""
@@ -2213,74 +3122,15 @@ getVerse();
         if not self.bible_structure or not self.amp_bible:
             return 0.0
         
-        total_verses = 0
-        cached_verses = 0
-        
-        # Count total verses and cached verses
-        for book in self.bible_structure:
-            if book in self.available_books:  # Only count books we recognize
-                for chapter_str, verse_count in self.bible_structure[book].items():
-                    chapter = int(chapter_str)
-                    total_verses += verse_count
-                    
-                    # Count how many verses we have cached for this chapter
-                    if (book in self.amp_bible and 
-                        str(chapter) in self.amp_bible[book]):
-                        chapter_data = self.amp_bible[book][str(chapter)]
-                        # Count actual verse entries (not just keys)
-                        for verse_num in range(1, verse_count + 1):
-                            if str(verse_num) in chapter_data and chapter_data[str(verse_num)].strip():
-                                cached_verses += 1
-        
-        if total_verses == 0:
-            return 0.0
-        
-        return (cached_verses / total_verses) * 100.0
+        return self._store_completion(self.amp_bible)
     
     def _cache_amp_verse(self, book: str, chapter: int, verse: int, text: str) -> bool:
         """Cache a newly scraped AMP verse to build the complete Bible."""
-        if not self.amp_cache_enabled or not text or not text.strip():
-            return False
-        
-        try:
-            # Ensure the structure exists
-            if book not in self.amp_bible:
-                self.amp_bible[book] = {}
-            if str(chapter) not in self.amp_bible[book]:
-                self.amp_bible[book][str(chapter)] = {}
-            
-            # Only cache if we don't already have this verse
-            if str(verse) not in self.amp_bible[book][str(chapter)]:
-                self.amp_bible[book][str(chapter)][str(verse)] = text.strip()
-                
-                # Save to file immediately (to persist across restarts)
-                self._save_amp_bible()
-                
-                # Update completion percentage
-                old_percentage = self.amp_completion_percentage
-                self.amp_completion_percentage = self._calculate_amp_completion()
-                
-                if self.amp_completion_percentage > old_percentage:
-                    self.logger.info(f"AMP Bible cache updated: {book} {chapter}:{verse} - "
-                                   f"completion now {self.amp_completion_percentage:.1f}%")
-                
-                return True
-        except Exception as e:
-            self.logger.error(f"Failed to cache AMP verse {book} {chapter}:{verse}: {e}")
-        
-        return False
+        return self._cache_translation_verse(book, chapter, verse, text, 'amp')
     
     def _save_amp_bible(self):
         """Save the AMP Bible cache to file."""
-        try:
-            amp_path = Path('data/translations/bible_amp.json')
-            amp_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(amp_path, 'w') as f:
-                json.dump(self.amp_bible, f, indent=2)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save AMP Bible cache: {e}")
+        self._save_translation_cache('amp')
     
     def get_amp_completion_stats(self) -> Dict:
         """Get detailed AMP completion statistics."""
@@ -2297,15 +3147,9 @@ getVerse();
                 book_cached = 0
                 
                 for chapter_str, verse_count in self.bible_structure[book].items():
-                    chapter = int(chapter_str)
                     book_total += verse_count
-                    
-                    if (book in self.amp_bible and 
-                        str(chapter) in self.amp_bible[book]):
-                        chapter_data = self.amp_bible[book][str(chapter)]
-                        for verse_num in range(1, verse_count + 1):
-                            if str(verse_num) in chapter_data and chapter_data[str(verse_num)].strip():
-                                book_cached += 1
+                    if self.amp_bible:
+                        book_cached += len(self.amp_bible.chapter_verses(book, int(chapter_str)))
                 
                 book_stats[book] = {
                     "total_verses": book_total,
@@ -2317,7 +3161,7 @@ getVerse();
                 cached_verses += book_cached
         
         return {
-            "completion_percentage": self.amp_completion_percentage,
+            "completion_percentage": self._calculate_amp_completion(),
             "total_verses": total_verses,
             "cached_verses": cached_verses,
             "book_stats": book_stats
@@ -0,0 +1,795 @@
+"""
+Compact memory-mapped verse store for Bible translations.
+
+Each translation is kept in a single binary file: a small header, a table of
+verse offsets indexed by verse id, and a UTF-8 text blob.  Verse ids are
+assigned in canonical order from data/bible_structure.json, so a lookup is an
+offset-table read plus a slice of the mapped file - nothing is parsed up front.
+
+New verses are appended to a per-translation journal (one JSON line per verse)
+and merged into the binary file by compact(), so growing a cache never
+rewrites the whole translation for a single verse.
+
+Because ids follow canonical order, each book occupies one contiguous byte
+range of the file - a shard.  A ShardCache shared by the open stores pages a
+book's shard in on first access and releases the least recently used shards
+once a memory budget is exceeded, so resident memory follows the books
+actually read rather than the size of every cached translation.
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # No advisory file locks on this platform
+
+TRANSLATIONS_DIR = Path('data/translations')
+
+# Translations whose cache file uses a different name than the translation code
+TRANSLATION_FILE_NAMES = {'nasb': 'nasb1995'}
+
+# Alternate book names found in downloaded/scraped data
+BOOK_ALIASES = {
+    'Psalm': 'Psalms',
+    'Song of Songs': 'Song of Solomon',
+    'Canticles': 'Song of Solomon',
+}
+
+
+def translation_file_stem(translation: str) -> str:
+    """Get the data file stem (without extension) for a translation code."""
+    return f"bible_{TRANSLATION_FILE_NAMES.get(translation, translation)}"
+
+
+@contextmanager
+def store_lock(store_path: Path, exclusive: bool = True):
+    """Hold a store's cross-process lock for the duration of a block.
+
+    Writers (conversion, journal appends, compaction) take it exclusive and
+    readers opening the store take it shared, so any number of processes can
+    use a store while each rewrite is merged from the current files.
+    """
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(store_path.with_suffix('.lock'), 'a') as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield  # Closing the handle releases the lock
+
+
+class VerseLayout:
+    """Maps (book, chapter, verse) to a dense verse id using the Bible structure."""
+
+    def __init__(self, structure: Dict[str, Dict[str, int]]):
+        self.books = list(structure.keys())
+        self._chapters: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        self._books: Dict[str, Tuple[int, int]] = {}
+        self._bases: List[int] = []
+        self._base_refs: List[Tuple[str, int]] = []
+
+        next_id = 0
+        for book in self.books:
+            book_start = next_id
+            for chapter_str in sorted(structure[book], key=int):
+                chapter = int(chapter_str)
+                verse_count = int(structure[book][chapter_str])
+                self._chapters[(book, chapter)] = (next_id, verse_count)
+                self._bases.append(next_id)
+                self._base_refs.append((book, chapter))
+                next_id += verse_count
+            self._books[book] = (book_start, next_id - book_start)
+
+        self.slot_count = next_id
+        self.checksum = zlib.crc32(json.dumps(structure, sort_keys=True).encode('utf-8'))
+
+    @staticmethod
+    def normalize_book(book: str) -> str:
+        """Resolve alternate book names to the names used in the structure file."""
+        return BOOK_ALIASES.get(book, book)
+
+    def verse_id(self, book: str, chapter: int, verse: int) -> Optional[int]:
+        """Get the verse id for a reference, or None if it is outside the structure."""
+        try:
+            base, verse_count = self._chapters[(self.normalize_book(book), int(chapter))]
+            verse = int(verse)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if 1 <= verse <= verse_count:
+            return base + verse - 1
+        return None
+
+    def chapter_range(self, book: str, chapter: int) -> Optional[Tuple[int, int]]:
+        """Get the (first verse id, verse count) of a chapter."""
+        try:
+            return self._chapters[(self.normalize_book(book), int(chapter))]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def book_range(self, book: str) -> Optional[Tuple[int, int]]:
+        """Get the (first verse id, verse count) of a book."""
+        return self._books.get(self.normalize_book(book))
+
+    def reference(self, verse_id: int) -> Tuple[str, int, int]:
+        """Get the (book, chapter, verse) for a verse id."""
+        if not 0 <= verse_id < self.slot_count:
+            raise IndexError(f"Verse id {verse_id} out of range")
+        index = bisect.bisect_right(self._bases, verse_id) - 1
+        book, chapter = self._base_refs[index]
+        return book, chapter, verse_id - self._bases[index] + 1
+
+
+class ShardCache:
+    """LRU of per-book shards paged in across all open verse stores, bounded by a byte budget."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.resident_bytes = 0
+        self._shards: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def touch(self, store: 'VerseStore', book: str):
+        """Mark a book of a store as used, loading its shard if it is not resident."""
+        key = (store, book)
+        with self._lock:
+            if key in self._shards:
+                self._shards.move_to_end(key)
+                return
+            size = store._load_shard(book)
+            self._shards[key] = size
+            self.resident_bytes += size
+
+            # Keep the shard just loaded even if it alone exceeds the budget
+            while self.resident_bytes > self.budget_bytes and len(self._shards) > 1:
+                (old_store, old_book), old_size = self._shards.popitem(last=False)
+                self.resident_bytes -= old_size
+                old_store._release_shard(old_book)
+
+    def forget(self, store: 'VerseStore'):
+        """Drop a store's shards after it has been unmapped or rewritten."""
+        with self._lock:
+            for key in [key for key in self._shards if key[0] is store]:
+                self.resident_bytes -= self._shards.pop(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'resident_shards': len(self._shards),
+                'resident_bytes': self.resident_bytes,
+                'budget_bytes': self.budget_bytes,
+            }
+
+
+class VerseStore:
+    """Read-mostly verse store backed by a memory-mapped binary file.
+
+    Newly cached verses are held in a pending overlay and appended to a
+    journal file; sync() makes the journal durable and compact() merges the
+    overlay into the binary file. The journal is replayed when the store opens.
+
+    Several processes may open the same store. Appends and compaction hold the
+    store's lock exclusively, and compaction merges the journal as found on
+    disk, so verses cached by one process survive another's rewrite; refresh()
+    picks up a file rewritten elsewhere.
+    """
+
+    MAGIC = b'BCVS'
+    VERSION = 1
+    # magic, version, flags, slot count, layout checksum, cached verse count
+    HEADER = struct.Struct('<4sHHIII')
+    OFFSET = struct.Struct('<I')
+    OFFSET_PAIR = struct.Struct('<II')
+    # Journal appends are fsynced once this many are outstanding
+    JOURNAL_SYNC_BATCH = 32
+
+    def __init__(self, path: Path, layout: VerseLayout, shard_cache: ShardCache = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.journal_path = self.path.with_suffix('.journal')
+        self.layout = layout
+        self.shard_cache = shard_cache
+        self._lock = threading.RLock()
+        self._file = None
+        self._mm = None
+        self._blob_start = 0
+        self._stored_count = 0
+        self._pending: Dict[int, str] = {}
+        self._journal = None
+        self._unsynced = 0
+        self._mapped_inode = None
+        self._journal_seen = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = open(self.path.with_suffix('.lock'), 'a')
+        try:
+            with self._flock(exclusive=False):
+                self._open()
+                self._replay_journal()
+        except Exception:
+            self._lock_file.close()
+            raise
+
+    @contextmanager
+    def _flock(self, exclusive: bool):
+        """Hold the store's cross-process lock; see store_lock()."""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    # --- File handling ---
+
+    def _open(self):
+        """Map the backing file if it exists and matches the layout."""
+        if not self.path.exists() or self.path.stat().st_size < self.HEADER.size:
+            return
+
+        handle = open(self.path, 'rb')
+        try:
+            mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            handle.close()
+            return
+
+        magic, version, _flags, slots, checksum, cached = self.HEADER.unpack_from(mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            mm.close()
+            handle.close()
+            raise ValueError(f"{self.path} is not a verse store (version {version})")
+        if slots != self.layout.slot_count or checksum != self.layout.checksum:
+            mm.close()
+            handle.close()
+            raise ValueError(f"{self.path} was built for a different Bible structure")
+
+        self._file = handle
+        self._mm = mm
+        self._mapped_inode = os.fstat(handle.fileno()).st_ino
+        self._blob_start = self.HEADER.size + (slots + 1) * self.OFFSET.size
+        self._stored_count = cached
+
+    def close(self):
+        """Sync the journal and release the memory map and file handles."""
+        with self._lock:
+            self._close_journal()
+            self._unmap()
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+
+    def _unmap(self):
+        with self._lock:
+            if self.shard_cache is not None:
+                self.shard_cache.forget(self)
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._mapped_inode = None
+
+    def _read_stored(self, verse_id: int, touch: bool = True) -> Optional[str]:
+        """Read a verse from the mapped file, paging in its book's shard unless touch is False."""
+        if self._mm is None:
+            return None
+        start, end = self.OFFSET_PAIR.unpack_from(self._mm, self.HEADER.size + verse_id * self.OFFSET.size)
+        if start == end:
+            return None
+        if touch and self.shard_cache is not None:
+            self.shard_cache.touch(self, self.layout.reference(verse_id)[0])
+        return self._mm[self._blob_start + start:self._blob_start + end].decode('utf-8')
+
+    def _is_stored(self, verse_id: int) -> bool:
+        """Check the offset table for a verse without reading its text."""
+        if self._mm is None:
+            return False
+        start, end = self.OFFSET_PAIR.unpack_from(self._mm, self.HEADER.size + verse_id * self.OFFSET.size)
+        return start != end
+
+    # --- Shards ---
+
+    def _shard_bounds(self, book: str) -> Optional[Tuple[int, int]]:
+        """Page-aligned (start, length) of a book's text in the mapped file."""
+        book_range = self.layout.book_range(book)
+        if self._mm is None or not book_range:
+            return None
+        first, count = book_range
+        start = self.OFFSET.unpack_from(self._mm, self.HEADER.size + first * self.OFFSET.size)[0]
+        end = self.OFFSET.unpack_from(self._mm, self.HEADER.size + (first + count) * self.OFFSET.size)[0]
+        start += self._blob_start
+        end += self._blob_start
+        aligned = start - start % mmap.PAGESIZE
+        return aligned, end - aligned
+
+    def _madvise_shard(self, book: str, advice: Optional[int]) -> int:
+        """Apply madvise to a book's shard. Returns the shard size in bytes."""
+        try:
+            bounds = self._shard_bounds(book)
+            if not bounds:
+                return 0
+            start, length = bounds
+            if advice is not None and length > 0:
+                self._mm.madvise(advice, start, length)
+            return length
+        except (AttributeError, ValueError, OSError):
+            # Store was unmapped concurrently, or the platform refused the hint
+            return 0
+
+    def _load_shard(self, book: str) -> int:
+        """Read a book's shard ahead in one go. Returns its size in bytes."""
+        return self._madvise_shard(book, getattr(mmap, 'MADV_WILLNEED', None))
+
+    def _release_shard(self, book: str):
+        """Drop a book's pages from this process; they are re-read from the page cache on next use."""
+        self._madvise_shard(book, getattr(mmap, 'MADV_DONTNEED', None))
+
+    @classmethod
+    def write(cls, path: Path, layout: VerseLayout, texts: Dict[int, str]):
+        """Atomically write a store file from a verse id -> text mapping."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        offsets = bytearray((layout.slot_count + 1) * cls.OFFSET.size)
+        blob = bytearray()
+        cached = 0
+        for verse_id in range(layout.slot_count):
+            cls.OFFSET.pack_into(offsets, verse_id * cls.OFFSET.size, len(blob))
+            text = texts.get(verse_id)
+            if text:
+                blob += text.encode('utf-8')
+                cached += 1
+        cls.OFFSET.pack_into(offsets, layout.slot_count * cls.OFFSET.size, len(blob))
+
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, layout.slot_count, layout.checksum, cached))
+                f.write(offsets)
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return cached
+
+    def compact(self) -> List[int]:
+        """Merge the journal and pending verses into the backing file and drop the journal.
+
+        Returns the ids of verses another process stored that this one had not seen yet.
+        """
+        with self._lock, self._flock(exclusive=True):
+            if not self._pending and not self.journal_path.exists():
+                return []
+            # Another process may have rewritten the file or journaled verses since we last looked
+            picked_up = self._pick_up_external()
+            texts = {}
+            for verse_id in range(self.layout.slot_count):
+                text = self._pending.get(verse_id)
+                if text is None:
+                    text = self._read_stored(verse_id, touch=False)
+                if text:
+                    texts[verse_id] = text
+            self._close_journal()
+            self._unmap()
+            try:
+                self.write(self.path, self.layout, texts)
+            finally:
+                # Remap whichever file is in place; on failure the old file and journal still hold everything
+                self._open()
+            self._pending.clear()
+            # The journal is only dropped once the merged file is in place
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+            self._journal_seen = None
+            return picked_up
+
+    def refresh(self) -> List[int]:
+        """Pick up a backing file or journal entries written by another process.
+
+        Returns the ids of verses that were not visible to this process before.
+        """
+        with self._lock, self._flock(exclusive=False):
+            return self._pick_up_external()
+
+    def _pick_up_external(self) -> List[int]:
+        """Remap a replaced backing file and replay the journal. Returns the newly visible verse ids."""
+        if not self._file_replaced():
+            return self._replay_journal()
+
+        known = {verse_id for verse_id in range(self.layout.slot_count)
+                 if verse_id in self._pending or self._is_stored(verse_id)}
+        self._unmap()
+        self._open()
+        # Verses the other process compacted no longer need the overlay
+        for verse_id in [verse_id for verse_id in self._pending if self._is_stored(verse_id)]:
+            del self._pending[verse_id]
+        self._replay_journal()
+        return [verse_id for verse_id in range(self.layout.slot_count)
+                if verse_id not in known and (verse_id in self._pending or self._is_stored(verse_id))]
+
+    def _file_replaced(self) -> bool:
+        """Check whether the backing file was replaced since it was mapped."""
+        try:
+            inode = self.path.stat().st_ino
+        except FileNotFoundError:
+            return False
+        return inode != self._mapped_inode
+
+    # --- Journal ---
+
+    def _replay_journal(self) -> List[int]:
+        """Load verses appended since the last compaction into the pending overlay. Returns their ids."""
+        try:
+            stat = self.journal_path.stat()
+        except FileNotFoundError:
+            return []
+        # Skip the read when the journal has not changed since the last replay
+        if (stat.st_ino, stat.st_size) == self._journal_seen:
+            return []
+
+        replayed = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    book, chapter, verse, text = json.loads(line)
+                except ValueError:
+                    # Torn write from an interrupted append
+                    continue
+                verse_id = self.layout.verse_id(book, chapter, verse)
+                if verse_id is None or verse_id in self._pending or self._is_stored(verse_id):
+                    continue
+                self._pending[verse_id] = text
+                replayed.append(verse_id)
+        self._journal_seen = (stat.st_ino, stat.st_size)
+        if replayed:
+            self.logger.info(f"Replayed {len(replayed)} journaled verses into {self.path.name}")
+        return replayed
+
+    def _append_journal(self, book: str, chapter: int, verse: int, text: str):
+        """Append a verse to the journal, syncing once a batch is outstanding."""
+        with self._flock(exclusive=True):
+            if self._journal is not None and not self._journal_current():
+                # Another process compacted and removed the journal this handle points at
+                self._close_journal()
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+                # Start on a fresh line if the last append was torn
+                if self._journal.tell() > 0:
+                    with open(self.journal_path, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            self._journal.write('\n')
+            self._journal.write(json.dumps([book, chapter, verse, text], ensure_ascii=False) + '\n')
+            # Flushed under the lock so other processes see complete lines
+            self._journal.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.JOURNAL_SYNC_BATCH:
+                self.sync()
+
+    def _journal_current(self) -> bool:
+        """Check that the open journal handle is still the file at journal_path."""
+        try:
+            return os.fstat(self._journal.fileno()).st_ino == self.journal_path.stat().st_ino
+        except FileNotFoundError:
+            return False
+
+    def sync(self):
+        """Flush and fsync outstanding journal appends."""
+        with self._lock:
+            if self._journal is None or not self._unsynced:
+                return
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._unsynced = 0
+
+    def _close_journal(self):
+        with self._lock:
+            if self._journal is not None:
+                self.sync()
+                self._journal.close()
+                self._journal = None
+
+    @property
+    def journal_entries(self) -> int:
+        """Number of verses waiting to be compacted into the backing file."""
+        return len(self._pending)
+
+    # --- Queries ---
+
+    def get(self, book: str, chapter: int, verse: int) -> Optional[str]:
+        """Get the text of a verse, or None if it is not stored."""
+        verse_id = self.layout.verse_id(book, chapter, verse)
+        if verse_id is None:
+            return None
+        with self._lock:
+            text = self._pending.get(verse_id)
+            if text is None:
+                text = self._read_stored(verse_id)
+        return text
+
+    def get_by_id(self, verse_id: int) -> Optional[str]:
+        """Get the text of a verse by its layout id, or None if it is not stored."""
+        with self._lock:
+            text = self._pending.get(verse_id)
+            if text is None:
+                text = self._read_stored(verse_id)
+        return text
+
+    def chapter_verses(self, book: str, chapter: int) -> Dict[int, str]:
+        """Get all stored verses of a chapter as verse number -> text."""
+        chapter_range = self.layout.chapter_range(book, chapter)
+        if not chapter_range:
+            return {}
+        base, verse_count = chapter_range
+        verses = {}
+        with self._lock:
+            for offset in range(verse_count):
+                text = self._pending.get(base + offset)
+                if text is None:
+                    text = self._read_stored(base + offset)
+                if text:
+                    verses[offset + 1] = text
+        return verses
+
+    def chapter_complete(self, book: str, chapter: int) -> bool:
+        """Check whether every verse of a chapter is stored, from the offset table alone."""
+        chapter_range = self.layout.chapter_range(book, chapter)
+        if not chapter_range:
+            return False
+        base, verse_count = chapter_range
+        with self._lock:
+            return all(base + offset in self._pending or self._is_stored(base + offset)
+                       for offset in range(verse_count))
+
+    def has_chapter(self, book: str, chapter: int) -> bool:
+        """Check whether any verse of a chapter is stored."""
+        return bool(self.chapter_verses(book, chapter))
+
+    def contains(self, book: str, chapter: int, verse: int) -> bool:
+        """Check whether a verse is stored."""
+        return self.get(book, chapter, verse) is not None
+
+    def _iter_entries(self) -> Iterator[Tuple[int, str, int, int, str]]:
+        for verse_id in range(self.layout.slot_count):
+            text = self._pending.get(verse_id)
+            if text is None:
+                text = self._read_stored(verse_id, touch=False)
+            if text:
+                book, chapter, verse = self.layout.reference(verse_id)
+                yield verse_id, book, chapter, verse, text
+
+    def iter_verses(self) -> Iterator[Tuple[str, int, int, str]]:
+        """Iterate over all stored verses in canonical order."""
+        with self._lock:
+            entries = list(self._iter_entries())
+        for _verse_id, book, chapter, verse, text in entries:
+            yield book, chapter, verse, text
+
+    def iter_texts(self) -> Iterator[Tuple[int, str]]:
+        """Iterate over (verse id, text) for all stored verses in canonical order."""
+        with self._lock:
+            entries = list(self._iter_entries())
+        for verse_id, _book, _chapter, _verse, text in entries:
+            yield verse_id, text
+
+    @property
+    def cached_verses(self) -> int:
+        """Number of verses stored, including pending ones."""
+        return self._stored_count + len(self._pending)
+
+    def __len__(self) -> int:
+        return self.cached_verses
+
+    # --- Updates ---
+
+    def add(self, book: str, chapter: int, verse: int, text: str) -> bool:
+        """Add a verse if it is not already stored. Returns True if it was new."""
+        verse_id = self.layout.verse_id(book, chapter, verse)
+        if verse_id is None:
+            return False
+        with self._lock:
+            return self._insert(verse_id, text)
+
+    def add_many(self, book: str, chapter: int, verses: Dict[int, str]) -> int:
+        """Add every verse of a chapter that is not already stored. Returns how many were new."""
+        chapter_range = self.layout.chapter_range(book, chapter)
+        if not chapter_range:
+            return 0
+        base, verse_count = chapter_range
+        added = 0
+        with self._lock:
+            for verse, text in verses.items():
+                if 1 <= int(verse) <= verse_count and self._insert(base + int(verse) - 1, text):
+                    added += 1
+        return added
+
+    def _insert(self, verse_id: int, text: str) -> bool:
+        if not text or not text.strip():
+            return False
+        if verse_id in self._pending or self._is_stored(verse_id):
+            return False
+        book, chapter, verse = self.layout.reference(verse_id)
+        self._pending[verse_id] = text.strip()
+        self._append_journal(book, chapter, verse, text.strip())
+        return True
+
+
+def read_store_texts(store_path: Path, layout: VerseLayout) -> Dict[int, str]:
+    """Every verse in a store file built for this layout, read without opening it as a store."""
+    try:
+        data = Path(store_path).read_bytes()
+    except OSError:
+        return {}
+    if len(data) < VerseStore.HEADER.size:
+        return {}
+    magic, version, _flags, slots, checksum, _cached = VerseStore.HEADER.unpack_from(data, 0)
+    if (magic, version, slots, checksum) != (VerseStore.MAGIC, VerseStore.VERSION, layout.slot_count, layout.checksum):
+        return {}
+
+    blob_start = VerseStore.HEADER.size + (slots + 1) * VerseStore.OFFSET.size
+    texts = {}
+    for verse_id in range(slots):
+        start, end = VerseStore.OFFSET_PAIR.unpack_from(data, VerseStore.HEADER.size + verse_id * VerseStore.OFFSET.size)
+        if start != end:
+            texts[verse_id] = data[blob_start + start:blob_start + end].decode('utf-8')
+    return texts
+
+
+def convert_json_translation(json_path: Path, store_path: Path, layout: VerseLayout,
+                             merge: bool = True) -> Tuple[int, int]:
+    """Convert a nested-JSON translation cache into a verse store.
+
+    With merge, verses already in the store file (compacted fetches and
+    backfill the JSON never saw) are kept; the JSON wins where both have a verse.
+    Returns (verses written, verses skipped because they are outside the layout).
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        bible = json.load(f)
+
+    texts = read_store_texts(store_path, layout) if merge else {}
+    skipped = 0
+    for book, chapters in bible.items():
+        if not isinstance(chapters, dict):
+            continue
+        for chapter, verses in chapters.items():
+            if not isinstance(verses, dict):
+                continue
+            for verse, text in verses.items():
+                if not isinstance(text, str) or not text.strip():
+                    continue
+                verse_id = layout.verse_id(book, chapter, verse)
+                if verse_id is None:
+                    skipped += 1
+                    continue
+                texts[verse_id] = text.strip()
+
+    written = VerseStore.write(store_path, layout, texts)
+    return written, skipped
+
+
+def open_translation_store(translation: str, layout: VerseLayout, directory: Path = TRANSLATIONS_DIR,
+                           shard_cache: ShardCache = None) -> VerseStore:
+    """Open the verse store for a translation, converting its JSON cache if needed.
+
+    The JSON file is converted when no store exists yet, and merged into the
+    store when it is newer than the store (e.g. after a fresh download).
+    """
+    logger = logging.getLogger(__name__)
+    stem = translation_file_stem(translation)
+    json_path = Path(directory) / f'{stem}.json'
+    store_path = Path(directory) / f'{stem}.bin'
+
+    with store_lock(store_path):
+        needs_conversion = json_path.exists() and (
+            not store_path.exists() or json_path.stat().st_mtime > store_path.stat().st_mtime
+        )
+        if needs_conversion:
+            written, skipped = convert_json_translation(json_path, store_path, layout)
+            logger.info(f"Merged {json_path.name} into verse store: {written} verses"
+                        + (f", {skipped} outside Bible structure skipped" if skipped else ""))
+
+    try:
+        return VerseStore(store_path, layout, shard_cache)
+    except ValueError as e:
+        with store_lock(store_path):
+            if json_path.exists():
+                logger.warning(f"{e}; rebuilding from {json_path.name}")
+                convert_json_translation(json_path, store_path, layout)
+            else:
+                logger.warning(f"{e}; starting an empty {translation.upper()} store")
+                store_path.unlink(missing_ok=True)
+        return VerseStore(store_path, layout, shard_cache)
+
+
+def peek_cached_verses(translation: str, layout: VerseLayout, directory: Path = TRANSLATIONS_DIR) -> int:
+    """Estimate a translation's cached verse count without opening its store.
+
+    Reads the store header and counts journal lines; a JSON cache that has not
+    been converted yet counts as empty until the store is first opened.
+    """
+    stem = translation_file_stem(translation)
+    store_path = Path(directory) / f'{stem}.bin'
+    journal_path = store_path.with_suffix('.journal')
+
+    cached = 0
+    try:
+        with open(store_path, 'rb') as f:
+            header = f.read(VerseStore.HEADER.size)
+        if len(header) == VerseStore.HEADER.size:
+            magic, version, _flags, slots, checksum, stored = VerseStore.HEADER.unpack(header)
+            if (magic, version, slots, checksum) == (VerseStore.MAGIC, VerseStore.VERSION,
+                                                     layout.slot_count, layout.checksum):
+                cached = stored
+    except OSError:
+        pass
+
+    try:
+        with open(journal_path, 'rb') as f:
+            cached += sum(1 for _line in f)
+    except OSError:
+        pass
+    return min(cached, layout.slot_count)
+
+
+def load_layout(structure_path: Path = Path('data/bible_structure.json')) -> VerseLayout:
+    """Load the verse layout from the Bible structure file."""
+    with open(structure_path, 'r') as f:
+        return VerseLayout(json.load(f))
+
+
+def main():
+    """Convert JSON translation caches into verse stores."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert Bible translation JSON caches to verse stores')
+    parser.add_argument('translations', nargs='*',
+                        help='Translation codes to convert (default: every bible_*.json found)')
+    parser.add_argument('--data-dir', default=str(TRANSLATIONS_DIR),
+                        help='Directory containing bible_*.json files')
+    parser.add_argument('--structure', default='data/bible_structure.json',
+                        help='Path to bible_structure.json')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    layout = load_layout(Path(args.structure))
+    data_dir = Path(args.data_dir)
+
+    if args.translations:
+        json_paths = [data_dir / f'{translation_file_stem(t.lower())}.json' for t in args.translations]
+    else:
+        json_paths = sorted(data_dir.glob('bible_*.json'))
+
+    for json_path in json_paths:
+        if not json_path.exists():
+            print(f"Skipping {json_path}: not found")
+            continue
+        store_path = json_path.with_suffix('.bin')
+        with store_lock(store_path):
+            written, skipped = convert_json_translation(json_path, store_path, layout)
+        print(f"{json_path.name} -> {store_path.name}: {written} verses"
+              + (f" ({skipped} skipped)" if skipped else ""))
+
+
+if __name__ == "__main__":
+    main()
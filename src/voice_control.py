@@ -10,8 +10,22 @@ import time
 import json
 from typing import Optional, Callable, Dict, Any, List
 import queue
+import re
 from datetime import datetime
 
+try:
+    from src.scripture_retriever import ScriptureRetriever
+except ImportError:
+    from scripture_retriever import ScriptureRetriever
+
+# "show me a verse about hope", "find scriptures on forgiveness", "search for verses about grief";
+# anchored to the start so commands and questions that mention verses are left alone
+VERSE_SEARCH_PATTERN = re.compile(
+    r'^(?:please\s+)?(?:find|search(?:\s+for)?|show\s+me|give\s+me|read\s+me)\s+'
+    r'(?:an?\s+|some\s+)?(?:bible\s+)?(?:verses?|scriptures?|passages?)\s+'
+    r'(?:about|on|for|regarding)\s+(.+)$'
+)
+
 class BibleClockVoiceControl:
     """
     Bible Clock voice control with automatic Porcupine/SpeechRecognition selection.
@@ -22,6 +36,7 @@ class BibleClockVoiceControl:
         self.verse_manager = verse_manager
         self.image_generator = image_generator
         self.display_manager = display_manager
+        self.service_manager = None  # Set by the service manager to share its current frame
         
         # Voice settings
         self.enabled = os.getenv('ENABLE_VOICE', 'false').lower() == 'true'
@@ -78,6 +93,7 @@ class BibleClockVoiceControl:
         # ChatGPT conversation context
         self.conversation_history = []
         self.current_verse_context = None
+        self.scripture_retriever = ScriptureRetriever(verse_manager)
         
         # Token usage tracking
         self.token_usage_stats = {
@@ -640,6 +656,10 @@ class BibleClockVoiceControl:
         if command_executed:
             return
         
+        # "Show me a verse about hope" is answered from the local search index
+        if self._handle_verse_search_command(text_lower):
+            return
+        
         # Check for verse explanation commands first
         verse_explanation_phrases = ['explain this verse', 'explain verse', 'what does this mean', 'explain this', 'what does this verse mean']
         if any(phrase in text_lower for phrase in verse_explanation_phrases):
@@ -811,13 +831,18 @@ class BibleClockVoiceControl:
                 if self.current_verse_context.get('is_summary'):
                     context_info += f"\nThis is a book summary for the book of {self.current_verse_context.get('book', 'the Bible')}"
             
+            # Ground the answer in locally retrieved verses, summaries and events
+            grounding = self.scripture_retriever.context_block(question)
+            if grounding:
+                context_info += f"\n\n{grounding}"
+            
             # Prepare conversation with context
             messages = [
                 {"role": "system", "content": self.system_prompt + context_info}
             ]
             
-            # Add recent conversation history (last 4 exchanges)
-            messages.extend(self.conversation_history[-8:])
+            # Add recent conversation history (last 4 exchanges, or 2 when retrieved scripture covers the topic)
+            messages.extend(self.conversation_history[-4:] if grounding else self.conversation_history[-8:])
             
             # Add current question
             messages.append({"role": "user", "content": question})
@@ -1146,12 +1171,17 @@ class BibleClockVoiceControl:
             self.logger.error(f"Error getting system status: {e}")
             self._speak("System is running normally.")
     
+    def _current_frame_image(self):
+        """Image of the frame on the display, shared with the web interface and display tick."""
+        if self.service_manager is not None:
+            return self.service_manager.current_frame().image
+        verse_data = self.verse_manager.get_current_verse()
+        return self.image_generator.create_verse_image(verse_data)
+    
     def _refresh_display(self):
         """Refresh the display with current verse."""
         try:
-            verse_data = self.verse_manager.get_current_verse()
-            image = self.image_generator.create_verse_image(verse_data)
-            self.display_manager.display_image(image, force_refresh=True)
+            self.display_manager.display_image(self._current_frame_image(), force_refresh=True)
             
             self._speak("Display has been refreshed")
             
@@ -1393,6 +1423,32 @@ class BibleClockVoiceControl:
             'daily_usage': stats['daily_usage']
         }
     
+    def _handle_verse_search_command(self, text: str) -> bool:
+        """Handle 'verse about X' requests from the locally cached Bible."""
+        match = VERSE_SEARCH_PATTERN.match(text)
+        if not match or not hasattr(self.verse_manager, 'search_verses'):
+            return False
+        
+        topic = match.group(1).strip(' .?!')
+        try:
+            results = self.verse_manager.search_verses(topic, limit=5)
+        except Exception as e:
+            self.logger.error(f"Verse search failed for '{topic}': {e}")
+            results = []
+        
+        if not results:
+            # Let ChatGPT suggest one when the cached verses have no match
+            if self.chatgpt_enabled:
+                return False
+            self._speak(f"I couldn't find a verse about {topic} in the downloaded Bible.")
+            return True
+        
+        verse = results[0]
+        self.logger.info(f"Verse search for '{topic}' answered locally: {verse['reference']}")
+        self._display_response_on_screen(f"{verse['reference']}\n\n{verse['text']}", 20.0)
+        self._speak(f"Here is a verse about {topic}. {verse['reference']}: {verse['text']}")
+        return True
+    
     def _handle_translation_change_command(self, text: str) -> bool:
         """Handle 'change translation to X' commands."""
         if 'change translation to' not in text:
@@ -1624,9 +1680,7 @@ class BibleClockVoiceControl:
     def _refresh_display_silent(self):
         """Silently refresh the display without speaking."""
         try:
-            verse_data = self.verse_manager.get_current_verse()
-            image = self.image_generator.create_verse_image(verse_data)
-            self.display_manager.display_image(image, force_refresh=True)
+            self.display_manager.display_image(self._current_frame_image(), force_refresh=True)
             self.logger.info("Display silently refreshed after speech")
             
         except Exception as e:
@@ -5,11 +5,17 @@ Enhanced web interface for Bible Clock with full configuration and statistics.
 import json
 import logging
 import os
+import time
 from datetime import datetime, timedelta
 from flask import Flask, jsonify, request, render_template, send_file, current_app
 from pathlib import Path
 import psutil
 from src.conversation_manager import ConversationManager
+from src.current_frame import CurrentFrame
+from src.usage_stats import usage_stats
+
+# Most reference x translation lookups one /api/verses request may fan out into
+MAX_VERSE_LOOKUPS = 50
 
 def create_app(verse_manager, image_generator, display_manager, service_manager, performance_monitor):
     """Create enhanced Flask application."""
@@ -76,6 +82,16 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
     _track_activity("System startup", "Bible Clock system started successfully")
     _track_activity("Display initialized", "E-ink display ready for verse display")
     
+    def _current_frame(rerender: bool = False):
+        """Get the frame on the display, re-rendered after changes to how it looks."""
+        service_manager = current_app.service_manager
+        if service_manager is not None and hasattr(service_manager, 'refresh_frame'):
+            return service_manager.refresh_frame() if rerender else service_manager.current_frame()
+        
+        verse_data = current_app.verse_manager.get_current_verse()
+        image = current_app.image_generator.create_verse_image(verse_data)
+        return CurrentFrame.build(current_app.verse_manager.frame_key(), verse_data, image)
+    
     def _is_mobile_device(request):
         """Detect if the request is from a mobile device."""
         user_agent = request.headers.get('User-Agent', '').lower()
@@ -154,7 +170,67 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
         except Exception as e:
             current_app.logger.error(f"API error: {e}")
             return jsonify({'success': False, 'error': str(e)}), 500
-    
+
+    @app.route('/api/verses', methods=['GET'])
+    def get_verses():
+        """Look up several references, in one or more translations, in a single batch."""
+        try:
+            references = request.args.getlist('ref')
+            if not references:
+                return jsonify({'success': False, 'error': 'At least one ref parameter is required'}), 400
+
+            translations = [t.strip().lower() for value in request.args.getlist('translation')
+                            for t in value.split(',') if t.strip()]
+            translations = translations or [current_app.verse_manager.translation]
+
+            if len(references) * len(translations) > MAX_VERSE_LOOKUPS:
+                return jsonify({
+                    'success': False,
+                    'error': f'At most {MAX_VERSE_LOOKUPS} lookups (references x translations) per request'
+                }), 400
+
+            lookups = [(reference, translation) for reference in references for translation in translations]
+            results = current_app.verse_manager.get_verses(lookups)
+
+            return jsonify({
+                'success': True,
+                'data': [
+                    {'reference': reference, 'translation': translation, 'verse': result}
+                    if result else {'reference': reference, 'translation': translation, 'verse': None,
+                                    'error': 'not found'}
+                    for (reference, translation), result in zip(lookups, results)
+                ]
+            })
+        except Exception as e:
+            current_app.logger.error(f"Verses API error: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/search', methods=['GET'])
+    def search_verses():
+        """Full-text search over the locally cached verses of a translation."""
+        try:
+            query = request.args.get('q', '').strip()
+            if not query:
+                return jsonify({'success': False, 'error': 'The q parameter is required'}), 400
+
+            translation = request.args.get('translation', '').strip().lower() or None
+            limit = max(1, min(request.args.get('limit', 10, type=int), 100))
+
+            started = time.perf_counter()
+            results = current_app.verse_manager.search_verses(query, translation, limit)
+            return jsonify({
+                'success': True,
+                'data': {
+                    'query': query,
+                    'translation': (translation or current_app.verse_manager.translation).upper(),
+                    'results': results,
+                    'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+                }
+            })
+        except Exception as e:
+            current_app.logger.error(f"Search API error: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     @app.route('/api/status', methods=['GET'])
     def get_status():
         """Get comprehensive system status."""
@@ -170,7 +246,7 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
                 'simulation_mode': simulation_mode,
                 'hardware_mode': 'Simulation' if simulation_mode else 'Hardware',
                 'current_background': current_app.image_generator.get_current_background_info(),
-                'verses_today': getattr(current_app.verse_manager, 'statistics', {}).get('verses_today', 0),
+                'verses_today': usage_stats.rollup().get('verses_today', 0),
                 'system': {
                     'cpu_percent': psutil.cpu_percent(),
                     'memory_percent': psutil.virtual_memory().percent,
@@ -185,6 +261,13 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             if current_app.performance_monitor:
                 status['performance'] = current_app.performance_monitor.get_performance_summary()
             
+            if hasattr(current_app.verse_manager, 'get_provider_status'):
+                status['providers'] = current_app.verse_manager.get_provider_status()
+            
+            backfill = getattr(current_app.service_manager, 'translation_backfill', None)
+            if backfill:
+                status['backfill'] = backfill.get_status()
+            
             return jsonify({'success': True, 'data': status})
         except Exception as e:
             current_app.logger.error(f"Status API error: {e}")
@@ -242,6 +325,10 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             
             for translation_file in translation_dir.glob('bible_*.json'):
                 translation_name = translation_file.stem.replace('bible_', '')
+                # Prefer the verse store the clock actually reads from
+                store_file = translation_file.with_suffix('.bin')
+                if store_file.exists():
+                    translation_file = store_file
                 if translation_name != 'web' and translation_file.exists():  # Exclude WEB
                     size_bytes = translation_file.stat().st_size
                     file_sizes[translation_name] = {
@@ -442,8 +529,7 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             
             if should_update_display:
                 try:
-                    verse_data = current_app.verse_manager.get_current_verse()
-                    image = current_app.image_generator.create_verse_image(verse_data)
+                    image = _current_frame(rerender=True).image
                     
                     # Determine refresh type: full refresh for background changes and parallel mode changes, partial for other settings
                     force_refresh = 'background_index' in data or background_changed or 'parallel_mode' in data
@@ -502,7 +588,7 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             if hasattr(current_app.verse_manager, 'get_statistics'):
                 stats = current_app.verse_manager.get_statistics()
             else:
-                stats = _generate_basic_statistics()
+                stats = usage_stats.rollup()
             
             # Add AI statistics if voice control is available
             if hasattr(current_app.service_manager, 'voice_control') and current_app.service_manager.voice_control:
@@ -529,9 +615,9 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
     def force_refresh():
         """Force display refresh."""
         try:
-            verse_data = current_app.verse_manager.get_current_verse()
-            image = current_app.image_generator.create_verse_image(verse_data)
-            current_app.display_manager.display_image(image, force_refresh=True)
+            frame = _current_frame()
+            verse_data = frame.verse()
+            current_app.display_manager.display_image(frame.image, force_refresh=True)
             
             _track_activity("Display refreshed", f"Manual refresh triggered for {verse_data.get('reference', 'Unknown')}")
             return jsonify({'success': True, 'message': 'Display refreshed'})
@@ -549,9 +635,8 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
                 return jsonify({'success': True, 'message': 'Display ghosting cleared'})
             else:
                 # Fallback to multiple full refreshes
+                image = _current_frame().image
                 for i in range(3):
-                    verse_data = current_app.verse_manager.get_current_verse()
-                    image = current_app.image_generator.create_verse_image(verse_data)
                     current_app.display_manager.display_image(image, force_refresh=True)
                     if i < 2:  # Don't sleep after last refresh
                         import time
@@ -571,8 +656,7 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             
             # Update display if requested - always use full refresh for background changes
             if request.get_json() and request.get_json().get('update_display', False):
-                verse_data = current_app.verse_manager.get_current_verse()
-                image = current_app.image_generator.create_verse_image(verse_data)
+                image = _current_frame(rerender=True).image
                 current_app.display_manager.display_image(image, force_refresh=True)
                 current_app.logger.info("Background cycled with full refresh")
                 _track_activity("Background cycled", f"Background changed to index {current_app.image_generator.current_background_index}")
@@ -594,8 +678,7 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
             
             # Update display if requested - always use full refresh for background changes
             if request.get_json() and request.get_json().get('update_display', False):
-                verse_data = current_app.verse_manager.get_current_verse()
-                image = current_app.image_generator.create_verse_image(verse_data)
+                image = _current_frame(rerender=True).image
                 current_app.display_manager.display_image(image, force_refresh=True)
                 current_app.logger.info("Background randomized with full refresh")
             
@@ -1631,16 +1714,6 @@ def create_app(verse_manager, image_generator, display_manager, service_manager,
         except Exception:
             return "error"
     
-    def _generate_basic_statistics():
-        """Generate basic statistics."""
-        return {
-            'verses_displayed_today': 1440,  # Minutes in a day
-            'most_common_book': 'Psalms',
-            'total_uptime': _get_uptime(),
-            'api_success_rate': 98.5,
-            'average_response_time': 0.85
-        }
-    
     @app.route('/api/translation-completion', methods=['GET'])
     def translation_completion():
         """Get completion statistics for all Bible translations."""
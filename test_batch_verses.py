@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test batch verse lookups and the /api/verses endpoint
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.verse_manager import VerseManager
+from src.verse_store import VerseStore
+from src.web_interface.app import MAX_VERSE_LOOKUPS, create_app
+
+
+class FakeVerseManager:
+    translation = 'kjv'
+
+    def __init__(self):
+        self.batches = []
+
+    def get_verses(self, lookups):
+        self.batches.append(lookups)
+        return [{'reference': reference, 'text': 'text'} if reference != 'Nowhere 1:1' else None
+                for reference, _translation in lookups]
+
+
+def test_batch_groups_by_chapter():
+    print("Testing batch lookups...")
+    with tempfile.TemporaryDirectory() as directory:
+        verse_manager = VerseManager()
+        store = VerseStore(Path(directory) / 'bible_ylt.bin', verse_manager.verse_layout)
+        verse_manager.translation_caches['ylt'] = store
+        store.add('John', 1, 1, 'In the beginning was the Word')
+
+        groups = []
+
+        def resolve_group(translation, book, chapter, verses):
+            groups.append((translation, book, chapter, verses))
+            return {verse: {'reference': f"{book} {chapter}:{verse}", 'text': 'upstream'}
+                    for verse in verses if verse != 9}
+
+        verse_manager._resolve_chapter_group = resolve_group
+        results = verse_manager.get_verses([
+            ('John 1:1', 'ylt'), ('John 3:17', 'ylt'), ('not a reference', 'ylt'),
+            ('John 3:16', 'YLT'), ('Ruth 1:9', 'ylt'),
+        ])
+        assert results[0]['text'] == 'In the beginning was the Word'
+        assert results[1]['text'] == results[3]['text'] == 'upstream'
+        assert results[2] is None and results[4] is None
+        assert sorted(groups) == [('ylt', 'John', 3, [16, 17]), ('ylt', 'Ruth', 1, [9])]
+        print("✓ Local hits answered directly, misses resolved once per chapter")
+        print("✓ Unparsed and unfound references come back as None, in request order")
+        store.close()
+
+
+def test_api_caps_lookups():
+    print("Testing /api/verses...")
+    verse_manager = FakeVerseManager()
+    client = create_app(verse_manager, None, None, None, None).test_client()
+
+    response = client.get('/api/verses?ref=John 3:16&ref=Nowhere 1:1&translation=kjv,amp')
+    data = response.get_json()
+    assert response.status_code == 200 and data['success']
+    assert [(entry['reference'], entry['translation']) for entry in data['data']] == [
+        ('John 3:16', 'kjv'), ('John 3:16', 'amp'), ('Nowhere 1:1', 'kjv'), ('Nowhere 1:1', 'amp')]
+    assert data['data'][2] == {'reference': 'Nowhere 1:1', 'translation': 'kjv', 'verse': None, 'error': 'not found'}
+    print("✓ References x translations looked up in one batch")
+
+    refs = '&'.join(f'ref=Psalms 119:{verse}' for verse in range(1, MAX_VERSE_LOOKUPS // 2 + 2))
+    response = client.get(f'/api/verses?{refs}&translation=kjv&translation=esv')
+    assert response.status_code == 400
+    assert client.get('/api/verses').status_code == 400
+    assert len(verse_manager.batches) == 1
+    print(f"✓ More than {MAX_VERSE_LOOKUPS} lookups rejected before any lookup")
+
+
+if __name__ == "__main__":
+    test_batch_groups_by_chapter()
+    test_api_caps_lookups()
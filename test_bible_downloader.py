@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test resumable Bible downloads into the verse store
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import src.bible_downloader as bible_downloader
+from src.bible_downloader import BibleDownloader
+from src.verse_store import VerseLayout, open_translation_store
+
+STRUCTURE = {'Genesis': {'1': 2, '2': 1}, 'Exodus': {'1': 1}}
+
+GETBIBLE_PAYLOAD = {
+    '1': {'name': 'Genesis',
+          '1': {'1': {'text': 'In the beginning God created the heaven and the earth.'},
+                '2': {'text': 'And the earth was without form, and void.'}},
+          '2': {'1': {'text': 'Thus the heavens and the earth were finished.'}}},
+    '2': {'name': 'Exodus',
+          '1': {'1': {'text': 'Now these are the names of the children of Israel.'}}},
+}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeClient:
+    def __init__(self, payload):
+        self.payload = payload
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return FakeResponse(self.payload)
+
+
+def _downloader(directory, layout):
+    downloader = BibleDownloader()
+    downloader.translation_dir = Path(directory)
+    downloader._layout = lambda: layout
+    return downloader
+
+
+def test_partial_book_is_not_done():
+    print("Testing checkpointed books with missing chapters...")
+    with tempfile.TemporaryDirectory() as directory:
+        layout = VerseLayout(STRUCTURE)
+        downloader = _downloader(directory, layout)
+        store = open_translation_store('test', layout, Path(directory))
+        checkpoint = {'completed': {'Genesis': 'digest'}}
+
+        store.add('Genesis', 1, 1, 'In the beginning God created the heaven and the earth.')
+        assert not downloader._book_done(checkpoint, 'Genesis', store, layout)
+        print("✓ Book missing its last chapter is downloaded again")
+
+        store.add('Genesis', 2, 1, 'Thus the heavens and the earth were finished.')
+        assert downloader._book_done(checkpoint, 'Genesis', store, layout)
+        assert not downloader._book_done(checkpoint, 'Exodus', store, layout)
+        print("✓ Book with every chapter stored counts as done")
+        store.close()
+
+
+def test_whole_bible_download_resumes():
+    print("Testing whole-Bible downloads into the verse store...")
+    with tempfile.TemporaryDirectory() as directory:
+        layout = VerseLayout(STRUCTURE)
+        downloader = _downloader(directory, layout)
+        client = FakeClient(GETBIBLE_PAYLOAD)
+        original_client = bible_downloader.http_client
+        bible_downloader.http_client = client
+        try:
+            assert downloader.download_web_bible('test')
+            assert not (Path(directory) / 'bible_test.json').exists()
+            store = open_translation_store('test', layout, Path(directory))
+            assert store.cached_verses == 4
+            assert store.get('Exodus', 1, 1) == 'Now these are the names of the children of Israel.'
+            store.close()
+            print("✓ Verses streamed into the store without a JSON copy")
+
+            assert downloader.download_web_bible('test')
+            assert client.requests == 1
+            print("✓ Rerun skips the request once every book is stored")
+        finally:
+            bible_downloader.http_client = original_client
+
+
+if __name__ == "__main__":
+    test_partial_book_is_not_done()
+    test_whole_bible_download_resumes()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test whole-chapter fetches into the translation cache
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from src.http_client import http_client
+from src.verse_manager import VerseManager
+from src.verse_store import VerseStore
+
+JOHN_3 = {'verses': [
+    {'book_name': 'John', 'chapter': 3, 'verse': 16, 'text': 'For God so loved the world, that he gave his only begotten Son'},
+    {'book_name': 'John', 'chapter': 3, 'verse': 17, 'text': 'For God sent not his Son into the world to condemn the world'},
+]}
+
+
+class ProviderSession:
+    """Answers bible-api.com requests from a fixed payload, or with a status code."""
+
+    def __init__(self, payload=None, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = json.dumps(self.payload or {}).encode('utf-8')
+        return response
+
+
+def test_chapter_fetched_once():
+    print("Testing chapter fetches from bible-api.com...")
+    with tempfile.TemporaryDirectory() as directory:
+        verse_manager = VerseManager()
+        store = VerseStore(Path(directory) / 'bible_ylt.bin', verse_manager.verse_layout)
+        verse_manager.translation_caches['ylt'] = store
+        original_session = http_client._session
+        try:
+            session = http_client._session = ProviderSession(JOHN_3)
+            result = verse_manager._fetch_from_source('bible-api', 'ylt', 'John', 3, 16, 'ylt')
+            assert result['text'] == JOHN_3['verses'][0]['text']
+            assert len(session.urls) == 1 and session.urls[0].endswith('John 3?translation=ylt')
+            assert sorted(store.chapter_verses('John', 3)) == [16, 17]
+            print("✓ One request cached every verse of the chapter")
+
+            result = verse_manager._fetch_from_source('local_cache', 'ylt', 'John', 3, 17, 'ylt')
+            assert result['text'] == JOHN_3['verses'][1]['text']
+            assert len(session.urls) == 1
+            print("✓ The next verse of the chapter is a local hit")
+
+            session = http_client._session = ProviderSession(status_code=404)
+            assert verse_manager._fetch_from_source('bible-api', 'ylt', 'Jude', 2, 1, 'ylt') is None
+            assert len(session.urls) == 1
+            print("✓ No single-verse request after the chapter was not found")
+        finally:
+            http_client._session = original_session
+            verse_manager._cache_writer_stop.set()
+            store.close()
+
+
+if __name__ == "__main__":
+    test_chapter_fetched_once()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test the shared current frame and display counting
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.current_frame import CurrentFrame
+from src.verse_manager import VerseManager
+
+
+def test_displays_counted_once_per_frame():
+    print("Testing display counting for published frames...")
+    verse_manager = VerseManager()
+    recorded = []
+    verse_manager._record_display = recorded.append
+
+    verse_data = {'reference': 'John 3:16', 'book': 'John', 'text': 'For God so loved the world'}
+    frame = CurrentFrame.build(verse_manager.frame_key(), verse_data)
+    verse_manager.publish_frame(frame)
+    assert verse_manager.get_current_frame() is frame
+    assert recorded == []
+    print("✓ Publishing a frame does not count a display")
+
+    verse_manager.record_frame_displayed(frame)
+    # A retried tick or a summary page flip shows the same frame again
+    verse_manager.record_frame_displayed(frame.with_image(None))
+    assert len(recorded) == 1
+    print("✓ A frame is counted once however often it reaches the panel")
+
+    next_frame = CurrentFrame.build(verse_manager.frame_key() + ('next',), verse_data)
+    verse_manager.record_frame_displayed(next_frame)
+    assert len(recorded) == 2
+    print("✓ The next frame is counted again")
+
+
+if __name__ == "__main__":
+    test_displays_counted_once_per_frame()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test precompiled date-mode schedules
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.date_schedule import SLOTS_PER_DAY, DateSchedule, prune_schedules
+from src.verse_manager import VerseManager
+
+CALENDAR = {
+    'events': {
+        '12-25': [
+            {'title': 'The Birth of Jesus', 'description': 'Christmas',
+             'verses': [{'reference': 'Luke 2:11', 'text': 'For unto you is born this day'},
+                        {'reference': 'Isaiah 9:6-7', 'text': 'For unto us a child is born'},
+                        {'reference': 'Matthew 1:23', 'text': 'Behold, a virgin shall be with child'}]},
+            {'title': 'The Word Made Flesh', 'description': 'Incarnation',
+             'verses': [{'reference': 'John 1:14', 'text': 'And the Word was made flesh'}]},
+        ]
+    },
+}
+
+
+def _verse_manager():
+    verse_manager = VerseManager()
+    verse_manager.biblical_events_calendar = CALENDAR
+    verse_manager._date_source_checksum = None
+    return verse_manager
+
+
+def test_schedule_compiled():
+    print("Testing date schedule compilation...")
+    verse_manager = _verse_manager()
+    schedule = verse_manager._compile_date_schedule(date(2026, 12, 25))
+    assert len(schedule.slots) == SLOTS_PER_DAY
+    assert len(schedule.records) == 4
+
+    # Events alternate each minute, and each event's verses cycle within it
+    references = [schedule.record_for(minute)['reference'] for minute in range(6)]
+    assert references == ['Luke 2:11', 'John 1:14', 'Matthew 1:23', 'John 1:14', 'Isaiah 9:6-7', 'John 1:14']
+    record = schedule.record_for(4)
+    assert (record['book'], record['chapter'], record['verse'], record['end_verse']) == ('Isaiah', 9, 6, 7)
+    assert record['date_match'] == 'exact' and record['event_cycle_position'] == '1 of 2'
+    print("✓ Events and verses cycle per minute with parsed references")
+
+    record['text'] = 'changed'
+    assert schedule.record_for(4)['text'] == 'For unto us a child is born'
+    print("✓ record_for() hands out copies")
+
+    quiet_day = verse_manager._compile_date_schedule(date(2026, 12, 26))
+    assert all(record['date_match'] == 'fallback' for record in quiet_day.records)
+    assert quiet_day.slots == verse_manager._compile_date_schedule(date(2026, 12, 26)).slots
+    print("✓ Days without events get a repeatable fallback schedule")
+
+
+def test_schedule_saved_and_reloaded():
+    print("Testing date schedule persistence...")
+    verse_manager = _verse_manager()
+    day = date(2026, 12, 25)
+    checksum = verse_manager._date_schedule_checksum()
+    with tempfile.TemporaryDirectory() as directory:
+        schedule = verse_manager._compile_date_schedule(day)
+        schedule.save(directory)
+        loaded = DateSchedule.load(day, checksum, directory)
+        assert loaded.records == schedule.records and loaded.slots == schedule.slots
+        print("✓ Saved schedule reloaded unchanged")
+
+        # Editing the calendar changes the checksum, so the saved schedule is recompiled
+        verse_manager.biblical_events_calendar = {'events': {}}
+        verse_manager._date_source_checksum = None
+        assert verse_manager._date_schedule_checksum() != checksum
+        assert DateSchedule.load(day, verse_manager._date_schedule_checksum(), directory) is None
+        Path(DateSchedule.path_for(day, directory)).write_text('{"version": 1, "source_checksum": ')
+        assert DateSchedule.load(day, checksum, directory) is None
+        print("✓ Stale or unreadable schedules are ignored")
+
+        DateSchedule(date(2026, 12, 24), schedule.records, schedule.slots, checksum).save(directory)
+        assert prune_schedules(keep_from=day, directory=directory) == 1
+        assert not DateSchedule.path_for(date(2026, 12, 24), directory).exists()
+        assert DateSchedule.path_for(day, directory).exists()
+        print("✓ Schedules before today pruned")
+
+
+if __name__ == "__main__":
+    test_schedule_compiled()
+    test_schedule_saved_and_reloaded()
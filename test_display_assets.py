@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the display-resolution background and border rasters
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+from src.display_assets import DisplayAssets
+
+WIDTH, HEIGHT = 32, 24
+
+
+def _write_png(path, shade, mtime):
+    Image.new('RGB', (WIDTH * 2, HEIGHT * 2), (shade, shade, shade)).save(path)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_rasters_built_and_rebuilt():
+    print("Testing display asset rasters...")
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / 'background.png'
+        _write_png(source, 200, 1_000_000_000)
+        assets = DisplayAssets(WIDTH, HEIGHT, quantize=False, asset_dir=Path(directory) / 'assets')
+        assets.sources = lambda: [(source, None)]
+
+        raster = assets.load(source)
+        assert raster.size == (WIDTH, HEIGHT) and raster.mode == 'L'
+        assert raster.getpixel((0, 0)) == 200
+        first_name = assets._load_manifest()[str(source)]['raster']
+        assert (assets.asset_dir / first_name).exists()
+        print("✓ Raster built at panel size on first use")
+
+        assert assets.build() == {'updated': 0, 'current': 1, 'failed': 0}
+        reloaded = DisplayAssets(WIDTH, HEIGHT, quantize=False, asset_dir=assets.asset_dir)
+        assert reloaded._load_manifest()[str(source)]['raster'] == first_name
+        print("✓ Manifest persisted and the raster kept while the source is unchanged")
+
+        _write_png(source, 90, 2_000_000_000)
+        assert assets.load(source).getpixel((0, 0)) == 90
+        second_name = assets._load_manifest()[str(source)]['raster']
+        assert second_name != first_name
+        print("✓ Raster rebuilt after the source changed")
+
+        assets.build()
+        assert not (assets.asset_dir / first_name).exists()
+        assert (assets.asset_dir / second_name).exists()
+        source.unlink()
+        assets.build()
+        assert assets._load_manifest() == {}
+        assert list(assets.asset_dir.glob('*.l8')) == []
+        print("✓ Stale rasters and removed sources pruned")
+
+
+if __name__ == "__main__":
+    test_rasters_built_and_rebuilt()
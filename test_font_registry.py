@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test the shared font registry
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.font_registry import FontRegistry
+
+FONT = 'data/fonts/DejaVuSans.ttf'
+
+
+def test_faces_shared_and_bounded():
+    print("Testing font registry sharing and eviction...")
+    registry = FontRegistry(max_fonts=2)
+    face = registry.truetype(FONT, 40)
+    assert registry.truetype(FONT, 40) is face
+    assert registry.truetype(FONT, 40.0) is face
+    assert face.size == 40
+    print("✓ A face is loaded once per path and size")
+
+    registry.truetype(FONT, 50)
+    registry.truetype(FONT, 40)  # Most recently used again
+    registry.truetype(FONT, 60)
+    assert registry.truetype(FONT, 40) is face
+    assert len(registry._fonts) == 2
+    print("✓ Least recently used faces are evicted beyond the limit")
+
+    try:
+        registry.truetype('data/fonts/missing.ttf', 40)
+        assert False, "a missing font should raise like ImageFont.truetype"
+    except OSError:
+        pass
+    assert registry.get('missing.ttf', 40) is not None
+    print("✓ Missing fonts raise from truetype() and fall back in get()")
+
+
+if __name__ == "__main__":
+    test_faces_shared_and_bounded()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test request deadlines in the shared HTTP client
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from src.http_client import HttpClient
+
+
+class RecordingSession:
+    def __init__(self):
+        self.timeouts = []
+
+    def request(self, method, url, **kwargs):
+        self.timeouts.append(kwargs['timeout'])
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+def test_deadline_caps_requests():
+    print("Testing request deadlines...")
+    client = HttpClient(max_concurrency=1)
+    session = RecordingSession()
+    client._session = session
+
+    client.get('https://example.com/verse', timeout=(3.05, 10))
+    assert session.timeouts[-1] == (3.05, 10)
+    print("✓ Requests outside a deadline keep their provider timeout")
+
+    with client.deadline(time.monotonic() + 2):
+        client.get('https://example.com/verse', timeout=(3.05, 10))
+    connect, read = session.timeouts[-1]
+    assert connect <= 2 and read <= 2
+    print("✓ Timeouts shrink to the time left before the deadline")
+
+    with client.deadline(time.monotonic() - 1):
+        try:
+            client.get('https://example.com/verse')
+            assert False, "request after the deadline should not be sent"
+        except requests.Timeout:
+            pass
+    assert len(session.timeouts) == 2
+    print("✓ No request is sent once the deadline has passed")
+
+    # A request waiting for a busy slot gives up at the deadline
+    client._slots.acquire()
+    try:
+        started = time.monotonic()
+        with client.deadline(started + 0.1):
+            try:
+                client.get('https://example.com/verse')
+                assert False, "request should have timed out waiting for a slot"
+            except requests.Timeout:
+                pass
+        assert time.monotonic() - started < 1
+    finally:
+        client._slots.release()
+    print("✓ Waiting for a connection slot stops at the deadline")
+
+
+if __name__ == "__main__":
+    test_deadline_caps_requests()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test ImageGenerator font fitting, page layouts and background composites
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+import src.image_generator as image_generator
+from src.display_assets import DisplayAssets
+from src.font_registry import font_registry
+from src.image_generator import ImageGenerator
+
+WIDTH, HEIGHT = 64, 48
+
+VERSES = [
+    "Jesus wept.",
+    "The LORD is my shepherd; I shall not want.",
+    "For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him "
+    "should not perish, but have everlasting life.",
+    "And it came to pass in those days, that there went out a decree from Caesar Augustus, that all the "
+    "world should be taxed. (And this taxing was first made when Cyrenius was governor of Syria.) And all "
+    "went to be taxed, every one into his own city.",
+]
+
+
+def _generator(directory):
+    generator = ImageGenerator()
+    generator.width, generator.height = WIDTH, HEIGHT
+    generator.display_assets = DisplayAssets(WIDTH, HEIGHT, quantize=False, asset_dir=Path(directory) / 'assets')
+    generator.enhanced_layering_enabled = True
+    return generator
+
+
+def _write_png(path, shade, mtime):
+    Image.new('L', (WIDTH, HEIGHT), shade).save(path)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def linear_fit(generator, texts, width, available_height, max_size, min_size, line_spacing, font_path):
+    """The original search: try every even size from the largest down."""
+    for size in range(max_size, min_size - 1, -2):
+        font = font_registry.truetype(font_path, size)
+        lines = max(len(generator._wrap_text(text, width, font)) for text in texts)
+        if lines * (size + line_spacing) <= available_height:
+            return size
+    return min_size
+
+
+def test_fit_matches_linear_descent():
+    print("Testing auto-fit font sizes against the linear descent...")
+    generator = ImageGenerator()
+    font_path = generator._verse_font_path()
+    checked = 0
+    for width in (400, 800, 1700):
+        for height in (150, 400, 1000):
+            for text in VERSES:
+                expected = linear_fit(generator, [text], width, height, 120, 20, 20, font_path)
+                assert generator._fit_font_size([text], width, height, 120, 20, 20, font_path) == expected
+                checked += 1
+            # Parallel mode fits two texts in one column size
+            texts = [VERSES[2], VERSES[3]]
+            expected = linear_fit(generator, texts, width // 2, height * 0.9, 100, 20, 18, font_path)
+            assert generator._fit_font_size(texts, width // 2, height * 0.9, 100, 20, 18, font_path) == expected
+            checked += 1
+    print(f"✓ Same size as the linear descent in {checked} fits")
+
+    fitted = len(generator._fitted_sizes)
+    generator._fit_font_size([VERSES[0]], 400, 150, 120, 20, 20, font_path)
+    assert len(generator._fitted_sizes) == fitted
+    print("✓ Repeated fits are memoized")
+
+
+def test_page_layouts_cached():
+    print("Testing summary and devotional page layout cache...")
+    generator = ImageGenerator()
+    summary = ' '.join(f"Sentence {i} of a long book summary that needs several pages." for i in range(120))
+    margin = 80
+    content_width = generator.width - 2 * margin
+
+    generator.warm_page_layouts({'is_summary': True, 'text': summary})
+    assert len(generator._page_layouts) == 1
+    pages = generator._paginate_book_summary_text(summary, content_width, margin)
+    assert len(pages) > 1
+    assert generator._paginate_book_summary_text(summary, content_width, margin) is pages
+    print(f"✓ Warmed summary layout reused ({len(pages)} pages)")
+
+    lines = [line for page in pages for line, _x, _height in page]
+    assert lines == generator._wrap_text(summary, content_width, generator._page_font())
+    print("✓ Pages hold every wrapped line in order")
+
+    devotional_pages = generator._paginate_devotional_text(summary, content_width, margin)
+    assert devotional_pages is not pages
+    assert len(generator._page_layouts) == 2
+    print("✓ Devotional layouts are cached separately")
+
+
+def test_composite_cache():
+    print("Testing background + border composite cache...")
+    with tempfile.TemporaryDirectory() as directory:
+        original_dir = image_generator.COMPOSITE_CACHE_DIR
+        image_generator.COMPOSITE_CACHE_DIR = Path(directory) / 'composites'
+        try:
+            generator = _generator(directory)
+            background = Path(directory) / 'background.png'
+            border = Path(directory) / 'border.png'
+            _write_png(background, 200, 1_000_000_000)
+            _write_png(border, 100, 1_000_000_000)
+            generator.separate_backgrounds = [None, background]
+            generator.separate_borders = [None, border]
+            generator.separate_background_index = 1
+            generator.separate_border_index = 1
+
+            first = generator._create_enhanced_layered_background()
+            assert first.getpixel((0, 0)) == 100
+            assert generator._create_enhanced_layered_background() is first
+            assert len(list(image_generator.COMPOSITE_CACHE_DIR.glob('*.l8'))) == 1
+            print("✓ Composite built once and reused")
+
+            # A changed border with a new mtime gets a new composite
+            _write_png(border, 250, 2_000_000_000)
+            changed = generator._create_enhanced_layered_background()
+            assert changed is not first
+            assert changed.getpixel((0, 0)) == 200
+            print("✓ Composite rebuilt after a layer's mtime changed")
+
+            # A layer that fails to load is left out, and the result is not cached
+            broken = Path(directory) / 'broken.png'
+            broken.write_bytes(b'not a png')
+            generator.separate_borders = [None, broken]
+            saved = set(image_generator.COMPOSITE_CACHE_DIR.glob('*.l8'))
+            cached = len(generator._composites)
+            partial = generator._create_enhanced_layered_background()
+            assert partial.getpixel((0, 0)) == 200
+            assert len(generator._composites) == cached
+            assert set(image_generator.COMPOSITE_CACHE_DIR.glob('*.l8')) == saved
+            print("✓ Composite with a failed layer is not cached")
+        finally:
+            image_generator.COMPOSITE_CACHE_DIR = original_dir
+
+
+if __name__ == "__main__":
+    test_fit_matches_linear_descent()
+    test_page_layouts_cached()
+    test_composite_cache()
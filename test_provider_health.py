@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test provider circuit breaker transitions
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.provider_health import CircuitBreaker
+
+
+def test_breaker_transitions():
+    print("Testing circuit breaker open/half-open/closed transitions...")
+    breaker = CircuitBreaker('test', window=10, min_requests=4, failure_threshold=0.5, base_backoff=0.05)
+
+    for _ in range(3):
+        breaker.record_failure(error='timeout')
+    assert breaker.state == CircuitBreaker.CLOSED
+    print("✓ Stays closed below the minimum request count")
+
+    breaker.record_failure(error='timeout')
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    print("✓ Opens once the failure rate crosses the threshold")
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    print("✓ Half-open after the backoff lets a single probe through")
+
+    breaker.record_failure(error='timeout')
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.backoff == 0.1
+    print("✓ Failed probe reopens with a doubled backoff")
+
+    time.sleep(0.11)
+    assert breaker.allow()
+    breaker.record_success(latency=0.2)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.backoff == 0.05
+    assert breaker.allow()
+    print("✓ Successful probe closes the breaker and resets the backoff")
+
+
+if __name__ == "__main__":
+    test_breaker_transitions()
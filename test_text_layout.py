@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test line breaking with cached word widths against full-line measurement
+"""
+
+import os
+import sys
+import textwrap
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import ImageFont
+
+from src.text_layout import TextLayout
+
+FONTS = ('data/fonts/DejaVuSans.ttf', 'data/fonts/DejaVuSerif-Bold.ttf')
+
+TEXTS = [
+    "For God so loved the world, that he gave his only begotten Son, that whosoever believeth in him "
+    "should not perish, but have everlasting life.",
+    "In the beginning was the Word, and the Word was with God, and the Word was God.",
+    "Jesus wept.",
+    "And it came to pass, when Jesus had finished these sayings, that he departed from Galilee, and came "
+    "into the coasts of Judaea beyond Jordan; Mahershalalhashbaz and Chushanrishathaim were there too.",
+    "The LORD is my shepherd; I shall not want. He maketh me to lie down in green pastures: he leadeth me "
+    "beside the still waters. “He restoreth my soul” — for his name’s sake.",
+]
+
+
+def getbbox_wrap(text, font, max_width):
+    """The original wrap: measure the whole growing line for every word."""
+    lines, current = [], []
+    for word in text.split():
+        bbox = font.getbbox(' '.join(current + [word]))
+        if bbox[2] - bbox[0] <= max_width:
+            current.append(word)
+        elif current:
+            lines.append(' '.join(current))
+            current = [word]
+        else:
+            lines.append(word)
+    if current:
+        lines.append(' '.join(current))
+    return lines
+
+
+def test_wrap_matches_getbbox_wrap():
+    print("Testing cached-width wrapping against full-line measurement...")
+    layout = TextLayout()
+    checked = 0
+    for path in FONTS:
+        for size in (24, 48, 80, 96):
+            font = ImageFont.truetype(path, size)
+            for text in TEXTS:
+                for max_width in range(120, 1800, 89):
+                    assert layout.wrap(text, font, max_width) == getbbox_wrap(text, font, max_width), \
+                        (path, size, max_width, text[:30])
+                    checked += 1
+    print(f"✓ Same lines as full-line measurement in {checked} layouts")
+
+
+def test_wrap_without_font():
+    print("Testing wrapping without a font...")
+    text = "one two three four five six seven"
+    assert TextLayout().wrap(text, None, 100) == textwrap.wrap(text, width=10)
+    print("✓ Falls back to character-based wrapping")
+
+
+if __name__ == "__main__":
+    test_wrap_matches_getbbox_wrap()
+    test_wrap_without_font()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed time-mode candidate index
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.verse_manager import VerseManager
+
+
+def test_index_matches_book_scan():
+    print("Testing time slot index against a scan of every book...")
+    verse_manager = VerseManager()
+    index = verse_manager.time_slot_index
+    assert len(index) == 24 * 59
+
+    # Without the index the lookup falls back to checking all 66 books
+    verse_manager.time_slot_index = {}
+    try:
+        for chapter in range(1, 25):
+            for verse in range(1, 60):
+                all_books, exact_books = index[(chapter, verse)]
+                scanned = verse_manager._get_all_books_with_valid_verse(chapter, verse)
+                assert all_books == scanned, (chapter, verse)
+                assert exact_books == [book for book in scanned if book['exact_match']]
+    finally:
+        verse_manager.time_slot_index = index
+    print(f"✓ All {len(index)} slots match the scan, in the same order")
+
+    all_books, exact_books = verse_manager._get_time_slot_candidates(3, 16)
+    assert {'book': 'John', 'verse': 16, 'exact_match': True} in exact_books
+    assert all(book['verse'] < 16 for book in all_books[len(exact_books):])
+    print("✓ Chapters shorter than the minute use their last verse")
+
+
+if __name__ == "__main__":
+    test_index_matches_book_scan()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the translation backfill checkpoint and retries
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.translation_backfill import MAX_RETRIES, TranslationBackfill
+
+
+class FakeVerseManager:
+    """Serves chapters from a script: verses, {} for not found, or None for a failed request."""
+
+    CACHEABLE_TRANSLATIONS = ['ylt']
+
+    def __init__(self, answers):
+        self.bible_structure = {'Ruth': {'1': 22, '2': 23, '3': 18, '4': 22}, 'Jude': {'1': 25}}
+        self.translation = 'ylt'
+        self.translation_completion = {}
+        self.answers = answers
+        self.cached = set()
+        self.fetched = []
+
+    def chapter_sources(self, translation):
+        return [('bible-api', translation)]
+
+    def source_ready(self, api_source):
+        return True
+
+    def fetch_chapter(self, api_source, source_code, book, chapter):
+        self.fetched.append((book, chapter))
+        verses = self.answers.get((book, chapter), {1: 'text'})
+        if verses:
+            self.cached.add((book, chapter))
+        return verses
+
+    def is_chapter_cached(self, translation, book, chapter):
+        return (book, chapter) in self.cached
+
+
+def _backfill(verse_manager, state_path):
+    backfill = TranslationBackfill(verse_manager, state_path=state_path)
+    backfill.enabled = False  # Driven step by step instead of from the thread
+    backfill.chapters = [(book, int(chapter)) for book, chapters in verse_manager.bible_structure.items()
+                         for chapter in chapters]
+    backfill._load_state()
+    return backfill
+
+
+def _step(backfill, times=1):
+    for _ in range(times):
+        backfill._next_request.clear()
+        backfill._backfill_next()
+
+
+def test_checkpoint_resumes():
+    print("Testing backfill checkpoint resume...")
+    with tempfile.TemporaryDirectory() as directory:
+        state_path = Path(directory) / 'backfill_state.json'
+        verse_manager = FakeVerseManager({})
+        backfill = _backfill(verse_manager, state_path)
+        _step(backfill, 2)
+        assert not state_path.exists()
+        backfill.stop()
+        assert verse_manager.fetched == [('Ruth', 1), ('Ruth', 2)]
+        print("✓ Checkpoint written on stop, not per chapter")
+
+        # Ruth 3 arrived meanwhile (e.g. displayed and cached); the restart skips it
+        verse_manager.cached.add(('Ruth', 3))
+        resumed = _backfill(verse_manager, state_path)
+        assert resumed.state['ylt']['next'] == 2
+        _step(resumed)
+        assert verse_manager.fetched[-1] == ('Ruth', 4)
+        print("✓ Restart resumed after the last checkpointed chapter")
+
+
+def test_failed_chapters_retried():
+    print("Testing backfill retries...")
+    with tempfile.TemporaryDirectory() as directory:
+        verse_manager = FakeVerseManager({('Ruth', 2): {}, ('Ruth', 3): None})
+        backfill = _backfill(verse_manager, Path(directory) / 'backfill_state.json')
+        state = backfill._translation_state('ylt')
+
+        _step(backfill, 3)
+        assert verse_manager.fetched == [('Ruth', 1), ('Ruth', 2), ('Ruth', 3)]
+        assert state['next'] == 2 and state['failed'] == [1]
+        print("✓ A transport failure keeps the position, a missing chapter is queued for retry")
+
+        verse_manager.answers[('Ruth', 3)] = {1: 'text'}
+        _step(backfill, 3 + MAX_RETRIES)  # Ruth 3, Ruth 4, Jude 1, then the retries
+        assert verse_manager.fetched.count(('Ruth', 2)) == 1 + MAX_RETRIES
+        assert state['next'] == len(backfill.chapters)
+        assert state['failed'] == [] and state['retries'] == {}
+        print(f"✓ Missing chapter given up after {MAX_RETRIES} retries")
+
+
+if __name__ == "__main__":
+    test_checkpoint_resumes()
+    test_failed_chapters_retried()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Test usage statistics ring buffers
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.usage_stats import RingBuffer
+
+
+def test_ring_buffer_rollover():
+    print("Testing ring buffer rollover...")
+    buffer = RingBuffer(4)
+    for bucket in range(100, 104):
+        buffer.add(bucket, bucket - 99)
+    assert buffer.window(103, 4) == [1.0, 2.0, 3.0, 4.0]
+    print("✓ Buckets fill in order")
+
+    buffer.add(105, 10)
+    assert buffer.window(105, 4) == [3.0, 4.0, 0.0, 10.0]
+    print("✓ Advancing overwrites the oldest buckets and clears skipped ones")
+
+    buffer.add(101, 5)
+    assert buffer.total(105, 4) == 17.0
+    print("✓ Buckets older than the window are ignored")
+
+    buffer.add(200, 1)
+    assert buffer.window(200, 4) == [0.0, 0.0, 0.0, 1.0]
+    assert buffer.window(200, 6) == [0.0] * 5 + [1.0]
+    print("✓ A long gap clears every slot")
+
+
+if __name__ == "__main__":
+    test_ring_buffer_rollover()
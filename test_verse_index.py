@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test full-text verse search
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.verse_index import VerseIndex
+from src.verse_store import VerseLayout, VerseStore
+
+STRUCTURE = {'John': {'1': 5, '3': 17}}
+
+
+def test_search():
+    print("Testing verse index search...")
+    with tempfile.TemporaryDirectory() as directory:
+        layout = VerseLayout(STRUCTURE)
+        store = VerseStore(Path(directory) / 'bible_test.bin', layout)
+        store.add('John', 1, 1, 'In the beginning was the Word, and the Word was with God, and the Word was God.')
+        store.add('John', 1, 4, 'In him was life; and the life was the light of men.')
+        store.add('John', 1, 5, 'And the light shineth in darkness; and the darkness comprehended it not.')
+
+        index = VerseIndex(layout)
+        index.build(store)
+        word, life, light = (layout.verse_id('John', 1, verse) for verse in (1, 4, 5))
+
+        assert [verse_id for verse_id, _ in index.search('word god', store)] == [word]
+        assert [verse_id for verse_id, _ in index.search('light', store)] == [life, light]
+        assert index.search('the', store) == []
+        print("✓ Words must all match; stopwords alone match nothing")
+
+        assert [verse_id for verse_id, _ in index.search('"light shineth"', store)] == [light]
+        assert [verse_id for verse_id, _ in index.search('dark*', store)] == [light]
+        print("✓ Phrase and prefix queries")
+
+        store.add('John', 3, 16, 'For God so loved the world, that he gave his only begotten Son')
+        index.add('John', 3, 16, store.get('John', 3, 16))
+        assert [verse_id for verse_id, _ in index.search('loved world', store)] == [layout.verse_id('John', 3, 16)]
+        print("✓ Verses added after the build are searchable")
+
+        index_path = Path(directory) / 'bible_test.idx'
+        index.save(index_path, store.cached_verses)
+        reloaded = VerseIndex(layout)
+        assert reloaded.load(index_path, store.cached_verses)
+        assert not VerseIndex(layout).load(index_path, store.cached_verses + 1)
+        assert len(reloaded.search('loved world', store)) == 1
+        print("✓ Saved index reloads and is rejected once the store has grown")
+        store.close()
+
+
+if __name__ == "__main__":
+    test_search()
@@ -9,6 +9,7 @@ import sys
 import logging
 import speech_recognition as sr
 from src.conversation_manager import ConversationManager
+from src.scripture_retriever import ScriptureRetriever
 import time as time_module
 import subprocess
 import tempfile
@@ -79,6 +80,7 @@ class VoiceAssistant:
         
         # Conversation management and metrics
         self.conversation_manager = ConversationManager()
+        self.scripture_retriever = ScriptureRetriever(verse_manager)
         
         # Timing metrics for performance tracking
         self.timing_metrics = {
@@ -1187,13 +1189,20 @@ class VoiceAssistant:
                 if verse_data:
                     current_verse = f"Current verse displayed: {verse_data.get('reference', '')} - {verse_data.get('text', '')}"
             
-            # Get conversation context for multi-turn conversations
-            conversation_context = self.conversation_manager.get_conversation_context(turns_back=3)
+            # Ground the answer in locally retrieved verses, summaries and events
+            grounding = self.scripture_retriever.context_block(question)
+            if grounding:
+                logger.info(f"📖 Retrieved {len(grounding.splitlines()) - 1} scripture passages for context")
+            
+            # Get conversation context for multi-turn conversations (less when scripture was retrieved)
+            conversation_context = self.conversation_manager.get_conversation_context(turns_back=2 if grounding else 3)
             
             # Create enhanced system prompt with context
             context_section = ""
             if conversation_context:
                 context_section = f"\n\nRecent conversation context:\n{conversation_context}\n"
+            if grounding:
+                context_section += f"\n\n{grounding}\n"
             
             full_system_prompt = f"""{self.system_prompt}
             